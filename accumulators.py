@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Tek geçişte hesaplanan, birleştirilebilir istatistik biriktiricileri.
+
+MomentAccumulator sayısal bir matris üzerinde tek bir vektörel geçişte sayım,
+ortalama, M2 (kareler toplamı), min/max ve çapraz çarpım (ko-moment)
+matrisini hesaplar. Parçalardan ya da farklı süreçlerden gelen kısmi sonuçlar
+Chan'ın paralel güncelleme formülleriyle birleştirilir. İstatistiksel özet
+(bölüm 3), Pearson korelasyonu (bölüm 6) ve standartlaştırma parametreleri
+(bölüm 7) hep aynı biriktiriciden türetilir.
+
+Eksik değerler pandas ile aynı şekilde ele alınır: tek sütunlu istatistikler
+her sütunun kendi dolu değerleriyle, korelasyon ise sütun çiftinin birlikte
+dolu olduğu satırlarla hesaplanır.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+class MomentAccumulator:
+    """Sütun çiftleri bazında sayım, ortalama ve ko-moment biriktiricisi.
+
+    Tüm matrisler p x p boyutundadır; [i, j] elemanı i ve j sütunlarının
+    birlikte dolu olduğu satırlar üzerinden hesaplanır:
+
+    - n[i, j]: satır sayısı
+    - mean[i, j]: i sütununun ortalaması
+    - m2[i, j]: i sütununun ortalamadan sapmalarının kareler toplamı
+    - comoment[i, j]: i ve j sapmalarının çarpımlarının toplamı
+
+    Köşegen, sütunların kendi istatistiklerini verir.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        p = len(self.columns)
+        self.n = np.zeros((p, p))
+        self.mean = np.zeros((p, p))
+        self.m2 = np.zeros((p, p))
+        self.comoment = np.zeros((p, p))
+        self.min = np.full(p, np.nan)
+        self.max = np.full(p, np.nan)
+
+    @classmethod
+    def from_frame(cls, df, columns=None):
+        """Bir DataFrame'in sayısal sütunlarından biriktirici oluşturur"""
+        columns = df.columns.tolist() if columns is None else list(columns)
+        accumulator = cls(columns)
+        accumulator.update(df[columns])
+        return accumulator
+
+    def update(self, data):
+        """Yeni satırları (DataFrame ya da 2B dizi) biriktiriciye ekler"""
+        if isinstance(data, pd.DataFrame):
+            data = data.reindex(columns=self.columns)
+        values = np.asarray(data, dtype=np.float64)
+        if values.shape[0] == 0:
+            return self
+
+        other = MomentAccumulator(self.columns)
+        other._fit_block(values)
+        return self.merge(other)
+
+    def _fit_block(self, values):
+        present = ~np.isnan(values)
+        presentf = present.astype(np.float64)
+        counts = present.sum(axis=0)
+
+        # Sayısal kararlılık için veri sütun ortalamasına göre kaydırılır
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shift = np.where(counts > 0, np.nansum(values, axis=0) / np.maximum(counts, 1), 0.0)
+        shifted = np.where(present, values - shift, 0.0)
+
+        n = presentf.T @ presentf
+        sums = shifted.T @ presentf
+        squares = (shifted * shifted).T @ presentf
+        products = shifted.T @ shifted
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            block_mean = np.where(n > 0, sums / n, 0.0)
+            self.m2 = np.where(n > 0, squares - sums * block_mean, 0.0)
+            self.comoment = np.where(n > 0, products - sums * block_mean.T, 0.0)
+        self.mean = block_mean + shift[:, None]
+        self.n = n
+
+        if present.any():
+            with warnings.catch_warnings():
+                # Tamamen boş sütunlar için nanmin/nanmax uyarısı beklenen bir durumdur
+                warnings.simplefilter("ignore", RuntimeWarning)
+                self.min = np.nanmin(values, axis=0)
+                self.max = np.nanmax(values, axis=0)
+
+    def merge(self, other):
+        """Başka bir biriktiricinin sonuçlarını bununla birleştirir (Chan)"""
+        if other.columns != self.columns:
+            raise ValueError("Farklı sütunlara sahip biriktiriciler birleştirilemez")
+
+        total = self.n + other.n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(total > 0, other.n / total, 0.0)
+            cross = np.where(total > 0, self.n * other.n / total, 0.0)
+        delta = np.where(other.n > 0, other.mean - self.mean, 0.0)
+
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + other.m2 + delta * delta * cross
+        self.comoment = self.comoment + other.comoment + delta * delta.T * cross
+        self.n = total
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    # ==============================
+    # Türetilen istatistikler
+    # ==============================
+
+    def count(self):
+        return pd.Series(np.diag(self.n), index=self.columns)
+
+    def means(self):
+        counts = np.diag(self.n)
+        return pd.Series(np.where(counts > 0, np.diag(self.mean), np.nan), index=self.columns)
+
+    def var(self, ddof=1):
+        counts = np.diag(self.n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = np.where(counts > ddof, np.diag(self.m2) / (counts - ddof), np.nan)
+        return pd.Series(values, index=self.columns)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.var(ddof=ddof))
+
+    def minimum(self):
+        return pd.Series(self.min, index=self.columns)
+
+    def maximum(self):
+        return pd.Series(self.max, index=self.columns)
+
+    def corr(self):
+        """Pearson korelasyon matrisi (çift bazında eksik değer atlanarak)"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            denominator = np.sqrt(self.m2 * self.m2.T)
+            values = np.where((self.n > 1) & (denominator > 0), self.comoment / denominator, np.nan)
+        values = np.clip(values, -1.0, 1.0)
+        # Köşegen tanım gereği 1'dir; yuvarlama hatasıyla 0.999... çıkmasın
+        diagonal = np.diag_indices_from(values)
+        values[diagonal] = np.where(np.isnan(values[diagonal]), np.nan, 1.0)
+        return pd.DataFrame(values, index=self.columns, columns=self.columns)
+
+    def scaler_params(self):
+        """StandardScaler ile aynı (ortalama, ölçek) parametreleri.
+
+        Ölçek popülasyon standart sapmasıdır; sıfır varyanslı sütunlarda 1 alınır.
+        """
+        scales = self.std(ddof=0)
+        scales = scales.where(scales > 0, 1.0).fillna(1.0)
+        return self.means(), scales
+
+    def describe(self, quantiles=None):
+        """describe() biçiminde özet; çeyrekler dışarıdan verilir"""
+        rows = {
+            "count": self.count(),
+            "mean": self.means(),
+            "std": self.std(),
+            "min": self.minimum(),
+        }
+        if quantiles is not None:
+            for q, values in quantiles.iterrows():
+                rows[f"{q * 100:g}%"] = values.reindex(self.columns)
+        rows["max"] = self.maximum()
+        return pd.DataFrame(rows).T
+
+
+def combine(accumulators):
+    """Birden fazla kısmi biriktiriciyi tek sonuçta birleştirir"""
+    accumulators = list(accumulators)
+    result = MomentAccumulator(accumulators[0].columns)
+    for accumulator in accumulators:
+        result.merge(accumulator)
+    return result
+
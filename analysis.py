@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""Streamlit'ten bağımsız analiz fonksiyonları.
+
+Buradaki fonksiyonlar saftır: yalnızca aldıkları DataFrame'e bakar, hiçbir
+widget durumuna dokunmaz. app.py bunları veri setinin parmak izine göre
+önbelleğe alır; böylece bir slider hareketi ağır hesapları tekrar tetiklemez.
+
+sklearn ve matplotlib yüklenmesi saniyeler süren modüllerdir; yalnızca onlara
+ihtiyaç duyan fonksiyonların içinde içe aktarılırlar, böylece uygulamanın ve
+toplu raporun açılışı bu maliyeti ödemez.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from accumulators import MomentAccumulator
+from sketches import KLLSketch
+
+
+# Bu satır sayısına kadar kantiller kesin hesaplanır, üstünde KLL özeti kullanılır
+EXACT_QUANTILE_MAX_ROWS = 100_000
+# KLL özetinin hedef sıralama hatası
+QUANTILE_SKETCH_ERROR = 0.01
+# "auto" PCA motoru bu satır sayısına kadar kesin (tam SVD) PCA kullanır
+PCA_EXACT_MAX_ROWS = 100_000
+# Bu sütun sayısının üstünde kesin PCA randomized SVD ile çözülür
+PCA_RANDOMIZED_MIN_FEATURES = 100
+# Kovaryans ve artımlı PCA motorlarında bir seferde işlenen satır sayısı
+PCA_CHUNK_SIZE = 100_000
+
+
+def dataset_fingerprint(df):
+    """Veri setinin şema ve içeriğinden kararlı bir parmak izi üretir"""
+    digest = hashlib.sha1()
+    digest.update(str(df.shape).encode("utf-8"))
+    digest.update("|".join(map(str, df.columns)).encode("utf-8"))
+    digest.update("|".join(df.dtypes.astype(str)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def get_numeric_features(df):
+    """Sayısal sütunların isimlerini döndürür"""
+    return df.select_dtypes(include="number").columns.tolist()
+
+
+def value_counts(series):
+    """Değer frekansları, çoktan aza sıralı.
+
+    Kategorik sütunlarda Python dizeleri yerine tamsayı kodlar sayılır ve
+    hiç görülmeyen kategoriler sonuçta yer almaz.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts()
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    result = pd.Series(counts, index=series.cat.categories.rename(series.name), name="count")
+    return result[result > 0].sort_values(ascending=False, kind="stable")
+
+
+def _unoptimized_dtype(dtype):
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(dtype):
+        return object
+    if pd.api.types.is_bool_dtype(dtype):
+        return dtype
+    if pd.api.types.is_integer_dtype(dtype):
+        return "int64"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float64"
+    return dtype
+
+
+def memory_comparison(df):
+    """Sütun başına bellek kullanımı: optimize edilmiş tipler ile varsayılan
+    tipler (object dizeler, int64, float64) karşılaştırması, KB cinsinden"""
+    unoptimized = df.astype({col: _unoptimized_dtype(dtype) for col, dtype in df.dtypes.items()})
+    return pd.DataFrame({
+        "before": unoptimized.memory_usage(deep=True, index=False) / 1024,
+        "after": df.memory_usage(deep=True, index=False) / 1024,
+    })
+
+
+def numeric_moments(df, numeric_features, values=None):
+    """Sayısal sütunlar üzerinde tek geçişte moment biriktiricisi.
+
+    Bölüm 3'ün özeti, bölüm 6'nın korelasyonu ve bölüm 7'nin ölçekleme
+    parametreleri bu tek sonuçtan türetilir. values verilirse (sütun
+    deposunun float64 bloğu) sütunlar DataFrame'den kopyalanmaz.
+    """
+    if values is None:
+        return MomentAccumulator.from_frame(df, numeric_features)
+    return MomentAccumulator(numeric_features).update(values)
+
+
+def describe_numeric(df, moments):
+    """Sayısal sütunlar için describe() özeti"""
+    quantiles = df[moments.columns].quantile([0.25, 0.5, 0.75])
+    return moments.describe(quantiles)
+
+
+def describe_all(df):
+    """Tüm sütunlar için describe(include="all") özeti"""
+    return df.describe(include="all")
+
+
+def correlation_matrix(moments):
+    """Pearson korelasyon matrisi"""
+    return moments.corr()
+
+
+def standardize(df, moments, values=None):
+    """Z-skoru standartlaştırması; (standart veri, ortalamalar, ölçekler) döndürür
+
+    Parametreler StandardScaler ile aynıdır ancak ayrı bir fit geçişi yapılmaz.
+    """
+    means, scales = moments.scaler_params()
+    if values is None:
+        df_standardized = (df[moments.columns].astype("float64") - means) / scales
+    else:
+        df_standardized = pd.DataFrame(
+            (values - means.to_numpy()) / scales.to_numpy(), columns=moments.columns, index=df.index
+        )
+    return df_standardized, means, scales
+
+
+def _complete_chunks(df, features, chunksize, values=None):
+    """Eksik değer içermeyen satırları parça parça (index, değerler) olarak üretir.
+
+    values verilirse parçalar bloğun kopyasız dilimleridir.
+    """
+    for start in range(0, len(df), chunksize):
+        if values is None:
+            block = df[features].iloc[start:start + chunksize]
+            index, chunk = block.index, block.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            index, chunk = df.index[start:start + chunksize], values[start:start + chunksize]
+        complete = ~np.isnan(chunk).any(axis=1)
+        yield index[complete], (chunk if complete.all() else chunk[complete])
+
+
+def _flip_signs(components):
+    """Bileşen işaretlerini sklearn ile aynı kurala göre sabitler:
+    her bileşende mutlak değerce en büyük yük pozitif olur."""
+    max_abs = np.argmax(np.abs(components), axis=1)
+    signs = np.sign(components[np.arange(len(components)), max_abs])
+    return components * signs[:, None]
+
+
+def _pca_exact(df, features, means, scales, values=None):
+    from sklearn.decomposition import PCA
+
+    if values is None:
+        complete_rows = df[features].dropna()
+        index = complete_rows.index
+        standardized = (complete_rows.astype("float64") - means) / scales
+    else:
+        complete = ~np.isnan(values).any(axis=1)
+        index = df.index[complete]
+        rows = values if complete.all() else values[complete]
+        # Standart matris PCA'nın tek kopyasıdır; bloğun kendisi değiştirilmez
+        standardized = (rows - means.to_numpy()) / scales.to_numpy()
+
+    svd_solver = "randomized" if len(features) > PCA_RANDOMIZED_MIN_FEATURES else "auto"
+    pca = PCA(n_components=2, svd_solver=svd_solver, random_state=0)
+    return index, pca.fit_transform(standardized), pca.explained_variance_ratio_
+
+
+def _pca_covariance(df, features, means, scales, chunksize, values=None):
+    # Ham verinin (eksiksiz satırlar) kovaryansı parça parça biriktirilir;
+    # standartlaştırılmış verinin kovaryansı buradan ölçeklenerek elde edilir.
+    moments = MomentAccumulator(features)
+    for _, chunk in _complete_chunks(df, features, chunksize, values):
+        moments.update(chunk)
+
+    n = np.diag(moments.n)[0]
+    scale_values = scales.to_numpy()
+    covariance = moments.comoment / (n - 1) / np.outer(scale_values, scale_values)
+    center = (np.diag(moments.mean) - means.to_numpy()) / scale_values
+
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    order = np.argsort(eigenvalues)[::-1][:2]
+    components = _flip_signs(eigenvectors[:, order].T)
+    explained_variance_ratio = eigenvalues[order] / eigenvalues.sum()
+
+    index_parts, projection_parts = [], []
+    for index, chunk in _complete_chunks(df, features, chunksize, values):
+        standardized = (chunk - means.to_numpy()) / scale_values
+        index_parts.append(index)
+        projection_parts.append((standardized - center) @ components.T)
+    index = index_parts[0].append(index_parts[1:]) if index_parts else df.index[:0]
+    return index, np.vstack(projection_parts) if projection_parts else np.empty((0, 2)), explained_variance_ratio
+
+
+def _pca_incremental(df, features, means, scales, chunksize, values=None):
+    from sklearn.decomposition import IncrementalPCA
+
+    pca = IncrementalPCA(n_components=2)
+    for _, chunk in _complete_chunks(df, features, chunksize, values):
+        standardized = (chunk - means.to_numpy()) / scales.to_numpy()
+        # partial_fit her parçada en az bileşen sayısı kadar satır ister
+        if len(standardized) >= 2:
+            pca.partial_fit(standardized)
+    signs = np.sign(np.diag(_flip_signs(pca.components_) @ pca.components_.T))
+
+    index_parts, projection_parts = [], []
+    for index, chunk in _complete_chunks(df, features, chunksize, values):
+        standardized = (chunk - means.to_numpy()) / scales.to_numpy()
+        index_parts.append(index)
+        projection_parts.append(pca.transform(standardized) * signs)
+    index = index_parts[0].append(index_parts[1:]) if index_parts else df.index[:0]
+    return index, np.vstack(projection_parts), pca.explained_variance_ratio_
+
+
+PCA_ENGINES = ["auto", "exact", "covariance", "incremental"]
+
+
+def pca_2d(df, moments, engine="auto", chunksize=PCA_CHUNK_SIZE, values=None):
+    """İki bileşenli PCA; (bileşen tablosu, açıklanan varyans oranları) döndürür
+
+    Standartlaştırma parametreleri moment biriktiricisinden alınır. PCA eksik
+    değer kabul etmediği için eksik değer içeren satırlar atlanır.
+
+    Motorlar:
+    - "exact": sklearn PCA, standartlaştırılmış veri bir kez oluşturulur
+    - "covariance": kovaryans parça parça biriktirilir ve özayrışımla çözülür;
+      standartlaştırılmış verinin tam kopyası hiç oluşturulmaz
+    - "incremental": sklearn IncrementalPCA ile parça parça öğrenme
+    - "auto": küçük veride "exact", büyük veride "covariance"
+
+    values, df ile aynı satır sırasında sayısal sütunların float64 bloğudur
+    (ör. bellek eşlemli sütun deposu); verilirse değerler oradan okunur.
+    """
+    features = moments.columns
+    means, scales = moments.scaler_params()
+
+    if engine == "auto":
+        engine = "exact" if len(df) <= PCA_EXACT_MAX_ROWS else "covariance"
+
+    if engine == "exact":
+        index, pca_components, explained_variance_ratio = _pca_exact(df, features, means, scales, values)
+    elif engine == "covariance":
+        index, pca_components, explained_variance_ratio = _pca_covariance(df, features, means, scales, chunksize, values)
+    elif engine == "incremental":
+        index, pca_components, explained_variance_ratio = _pca_incremental(df, features, means, scales, chunksize, values)
+    else:
+        raise ValueError(f"Bilinmeyen PCA motoru: {engine}")
+
+    pca_df = pd.DataFrame(
+        pca_components,
+        columns=["PC1", "PC2"],
+        index=index
+    )
+    return pca_df, explained_variance_ratio
+
+
+def box_plot_stats(df, features, exact_max_rows=EXACT_QUANTILE_MAX_ROWS,
+                   error=QUANTILE_SKETCH_ERROR, values=None):
+    """Her özellik için kutu grafiği istatistikleri (Axes.bxp biçiminde).
+
+    Küçük veri setlerinde matplotlib'in kesin hesabı kullanılır. Büyük veri
+    setlerinde çeyrekler her sütun için bir kez oluşturulan KLL özetinden
+    alınır; bıyıklar 1.5 IQR sınırına kırpılır ve aykırı noktalar çizilmez.
+    values verilirse (sütun deposunun float64 bloğu) sütunlar DataFrame'den
+    değil bloğun sütun dilimlerinden okunur.
+    """
+    from matplotlib import cbook
+
+    block = values
+    stats = {}
+    for j, feature in enumerate(features):
+        if block is None:
+            values = df[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = block[:, j]
+        values = values[~np.isnan(values)]
+
+        if len(values) <= exact_max_rows:
+            feature_stats = cbook.boxplot_stats(values)[0] if len(values) > 0 else None
+        else:
+            sketch = KLLSketch(error=error).update(values)
+            q1, med, q3 = sketch.quantile([0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            feature_stats = {
+                'med': med, 'q1': q1, 'q3': q3, 'iqr': iqr,
+                'whislo': max(sketch.min, q1 - 1.5 * iqr),
+                'whishi': min(sketch.max, q3 + 1.5 * iqr),
+                'fliers': np.empty(0),
+                'mean': values.mean(),
+            }
+
+        if feature_stats is not None:
+            feature_stats['label'] = feature
+            stats[feature] = feature_stats
+    return stats
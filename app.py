@@ -1,13 +1,34 @@
 # -*- coding: utf-8 -*-
 
 
+from collections import namedtuple
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+
+import analysis
+import charts
+import correlation
+import data_loader
+import filters
+import grouped
+import ingest
+import instrumentation
+import outliers
+import paging
+import profiler
+import render_pool
+import streaming
+# Ağır hesapların oturumlar arası paylaşılan önbelleği pipeline modülündedir;
+# böylece serve.py sunucu başlamadan önce aynı depoyu doldurabilir.
+from pipeline import (
+    cached_box_stats, cached_correlation_result, cached_describe_all, cached_describe_numeric,
+    cached_filter_options, cached_grouped_pca, cached_grouped_stats, cached_memory_comparison,
+    cached_moments, cached_outlier_flags, cached_outliers, cached_pca, cached_profile,
+    cached_subset, cached_table_order, cached_top_pairs, cached_value_counts, get_result_store,
+    shared_result,
+    STREAMING_THRESHOLD_BYTES,
+)
 
 
 
@@ -135,507 +156,952 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_default_data():
-    """Varsayılan veri setini GitHub'dan yükler"""
-    default_url = "https://raw.githubusercontent.com/iremkay/veri-analizi-projesi/main/endangered_animals.csv"
+@st.cache_resource
+def load_default_data(source_signature):
+    """Varsayılan veri setini yükler; önce yerel dosya, gerekirse GitHub.
+
+    source_signature yalnızca önbellek anahtarıdır: yerel dosya değişince
+    veri yeniden yüklenir. Veri seti bellek eşlemli sütun deposundan açılır
+    ve tüm oturumlar aynı nesneyi paylaşır (cache_data her çağrıda bir kopya
+    üretirdi); bu yüzden değiştirilmemelidir.
+    """
+    # Gövde yalnızca önbellekte yoksa çalışır: ölçümde ıskalama olarak sayılır
+    instrumentation.mark_computed()
     try:
-        return pd.read_csv(default_url), True
-    except:
+        df, fingerprint = data_loader.load_dataset()
+    except Exception:
+        return None, None, False
+    return df, fingerprint, True
+
+
+@st.cache_data(show_spinner="Büyük veri seti parça parça okunuyor...")
+def load_streaming_summary(source_signature):
+    """Büyük veri setini belleğe almadan özetler"""
+    instrumentation.mark_computed()
+    return streaming.summarize_csv(data_loader.DEFAULT_CSV)
+
+
+# Yükleme bu süre içinde biterse (ör. depodaki bir dosya) ilerleme ekranı gösterilmez
+UPLOAD_WAIT_SECONDS = 0.5
+UPLOAD_POLL_SECONDS = 0.5
+UPLOAD_PREVIEW_ROWS = 100
+
+
+def start_upload(uploaded):
+    """Yüklenen dosyanın okuma işini başlatır ya da mevcut işi döndürür.
+
+    İçerik özeti dosya başına bir kez hesaplanıp oturumda saklanır; okuma işi
+    ve sonucu aynı içeriği yükleyen tüm oturumlarca paylaşılır.
+    """
+    hash_key = f"upload_hash_{uploaded.file_id}"
+    data = uploaded.getbuffer()
+    if hash_key not in st.session_state:
+        st.session_state[hash_key] = ingest.content_hash(data)
+    st.session_state["upload_digest"] = st.session_state[hash_key]
+    return ingest.submit(st.session_state[hash_key], uploaded.name, data)
+
+
+def forget_upload():
+    """Yüklenen dosya kaldırıldıysa, okunamamış olması durumunda işini bırakır"""
+    if "upload_digest" in st.session_state:
+        ingest.forget(st.session_state.pop("upload_digest"))
+
+
+@st.fragment(run_every=UPLOAD_POLL_SECONDS)
+def render_upload_progress(job):
+    """Okuma sürerken ilerleme çubuğu ve o ana kadar okunan satırlar"""
+    if job.done.is_set():
+        st.rerun()
+    progress, n_rows = job.status()
+    st.progress(progress, text=f"📥 {job.name} okunuyor... %{progress * 100:.0f} · {n_rows:,} satır")
+    preview = job.preview(UPLOAD_PREVIEW_ROWS)
+    if preview is not None:
+        st.caption(f"İlk {len(preview)} satır (okuma sürüyor)")
+        st.dataframe(preview, use_container_width=True)
+
+
+# ==============================
+# Grafik Yardımcıları
+# ==============================
+# Pasta grafikleri: sütun -> (alt başlık, grafik başlığı, renkler)
+PIE_CHARTS = {
+    'conservation_status': ("Koruma Statüsü", 'Koruma Statüsü Dağılımı', ['#e74c3c', '#e67e22', '#f39c12']),
+    'continent': ("Kıta Dağılımı", 'Kıtalara Göre Dağılım', None),
+    'diet_type': ("Beslenme Türü", 'Beslenme Türü Dağılımı', ['#3498db', '#2ecc71', '#9b59b6']),
+}
+
+
+@st.cache_resource
+def get_render_pool():
+    """Süreç genelinde paylaşılan grafik çizim havuzu"""
+    return render_pool.RenderPool()
+
+
+# Bu çalıştırmada çizimi havuza gönderilmiş, henüz gösterilmemiş grafikler
+pending_charts = []
+# Depoda bulunmayan grafik işareti (None geçerli bir değer olabilir)
+MISSING = object()
+
+
+def show_chart(fingerprint, name, params, build_figure, *args):
+    """Grafiği sonuç deposundan PNG olarak gösterir; yoksa havuzda çizdirir.
+
+    Anahtar veri setinin parmak izi, grafik adı ve çizim parametrelerinden
+    oluşur; parametreler hash'lenebilir (tuple, str, sayı) olmalıdır.
+    Depoda olmayan grafik için yer tutucu bırakılır ve çizim havuza
+    gönderilir; sonuç flush_pending_charts() ile yer tutucuya yazılır.
+    """
+    key = (fingerprint, "figure:" + name, params)
+    # Kontrol ve okuma tek aramada: arada LRU tahliyesi olamaz; yoksa havuzda çizilir
+    png = get_result_store().get(key, MISSING)
+    if png is not MISSING:
+        # Iskalamalar flush_pending_charts'ta, çizim beklenirken kaydedilir
+        with instrumentation.span("figure:" + name, kind="cache", cache=True):
+            st.image(png, use_container_width=True)
+        return
+
+    placeholder = st.empty()
+    placeholder.caption("⏳ Grafik hazırlanıyor...")
+    future = get_render_pool().submit(key, build_figure, *args)
+    pending_charts.append((placeholder, fingerprint, name, params, future))
+
+
+def flush_pending_charts():
+    """Havuzda çizilen grafikleri bekleyip yer tutuculara yerleştirir"""
+    for placeholder, fingerprint, name, params, future in pending_charts:
         try:
-            return pd.read_csv("endangered_animals.csv"), True
-        except:
-            return None, False
+            png = shared_result(fingerprint, "figure:" + name, params, future.result)
+        except Exception as e:
+            placeholder.error(f"Grafik oluşturulurken hata: {str(e)}")
+        else:
+            placeholder.image(png, use_container_width=True)
+    pending_charts.clear()
 
 
+def render_pie_chart(fingerprint, column, counts):
+    """Bir kategorik sütunun frekanslarını pasta grafiği olarak çizer"""
+    subheader, title, colors = PIE_CHARTS[column]
+    st.subheader(subheader)
+    show_chart(
+        fingerprint, "pie", (column, title, tuple(colors or ())),
+        charts.pie_chart_figure, counts, title, colors
+    )
 
-df, default_loaded = load_default_data()
 
 
-with st.sidebar:
-    st.header("Ayarlar")
-    
-    if default_loaded:
-        st.success("✅ Veri seti yüklendi")
-        st.caption(f"Toplam {len(df)} Hayvan Türü")
-    else:
-        st.error("❌ Veri seti yüklenemedi")
+# Filtrelenebilen sütunların kenar çubuğundaki etiketleri
+FILTER_LABELS = {
+    'conservation_status': "Koruma Statüsü",
+    'continent': "Kıta",
+    'habitat': "Yaşam Alanı",
+    'diet_type': "Beslenme Türü",
+    'population': "Popülasyon",
+    'threat_level': "Tehdit Seviyesi",
+    'body_weight_kg': "Vücut Ağırlığı (kg)",
+    'lifespan_years': "Yaşam Süresi (yıl)",
+}
 
-if df is not None:
-    
-    
-    st.header("1. 📈 Veri Seti Genel Bakış")
-    
+
+def _clear_filters():
+    for key in list(st.session_state):
+        if str(key).startswith("filter_"):
+            del st.session_state[key]
+
+
+def render_filters(filter_options):
+    """Kenar çubuğunda kategori ve aralık filtrelerini gösterir; seçimi döndürür"""
+    st.subheader("Filtreler")
+    
+    categories = {}
+    for column in filters.CATEGORY_FILTER_COLUMNS:
+        options = filter_options.categories(column)
+        if options:
+            chosen = st.multiselect(
+                FILTER_LABELS.get(column, column), options,
+                key=f"filter_{column}", placeholder="Tümü"
+            )
+            if chosen:
+                categories[column] = chosen
+    
+    ranges = {}
+    for column in filters.RANGE_FILTER_COLUMNS:
+        options = filter_options.range_options(column)
+        if len(options) >= 2:
+            low, high = st.select_slider(
+                FILTER_LABELS.get(column, column), options=options,
+                value=(options[0], options[-1]), key=f"filter_{column}",
+                format_func=lambda value: f"{value:,.6g}"
+            )
+            if (low, high) != (options[0], options[-1]):
+                ranges[column] = (low, high)
     
+    st.button("Filtreleri Temizle", on_click=_clear_filters)
+    return filters.FilterSelection(categories, ranges)
+
+
+def paged_table(df, fingerprint, key, columns=None):
+    """Sunucu tarafında sıralanan, süzülen ve sayfalanan tablo görünümü.
+
+    Yalnızca görünen sayfanın satırlarını döndürür; sıralama, örnekleme ve
+    filtre sonuçları veri setinin parmak iziyle paylaşılan depoda tutulur.
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+
+    with col1:
+        view_option = st.selectbox("Görünüm Seç", ["Satır Sırası", "Rastgele Örnek"], key=f"{key}_view")
+        sort_column, ascending, seed = None, True, None
+        if view_option == "Rastgele Örnek":
+            seed = int(st.number_input("Tohum (seed)", min_value=0, value=0, step=1, key=f"{key}_seed"))
+        else:
+            choice = st.selectbox("Sırala", ["—"] + columns, key=f"{key}_sort")
+            if choice != "—":
+                sort_column = choice
+                ascending = st.toggle("Artan", value=True, key=f"{key}_ascending")
+
+    with col2:
+        filter_column = st.selectbox("Filtre sütunu", ["—"] + columns, key=f"{key}_filter_column")
+        filter_column = None if filter_column == "—" else filter_column
+        query = st.text_input(
+            "Filtre", key=f"{key}_query", disabled=filter_column is None,
+            help="Metin sütunlarında içerir araması; sayısal sütunlarda ör. >100, <=5, =3 ya da 10..20"
+        ) if filter_column else ""
+
+    try:
+        positions = cached_table_order(fingerprint, df, sort_column, ascending, seed, filter_column, query)
+    except ValueError:
+        st.warning("⚠️ Filtre anlaşılamadı; sayısal sütunlarda ör. >100, <=5, =3 ya da 10..20 kullanın.")
+        positions = None
+    n_rows = len(df) if positions is None else len(positions)
+
+    with col3:
+        page_size = st.selectbox("Sayfa boyutu", paging.PAGE_SIZES, key=f"{key}_page_size")
+    n_pages = max(1, -(-n_rows // page_size))
+    with col4:
+        page_number = int(st.number_input("Sayfa", min_value=1, max_value=n_pages, value=1, step=1,
+                                          key=f"{key}_page"))
+
+    start, stop = paging.page_bounds(n_rows, page_number, page_size)
+    st.caption(f"{n_rows:,} satırdan {start + 1 if n_rows else 0:,}–{stop:,} arası · sayfa {page_number:,} / {n_pages:,}")
+    return paging.page(df, positions, start, stop)[columns]
+
+
+def column_info_table(profile):
+    """Sütun bilgisi tablosu (ad, tip, benzersiz değer, örnek değer)"""
+    return pd.DataFrame({
+        'Sütun Adı': profile.index,
+        'Veri Tipi': profile["dtype"].values,
+        'Benzersiz Değer': profile["distinct"].values,
+        'Örnek Değer': ['N/A' if sample is None else str(sample) for sample in profile["sample"]]
+    })
+
+
+# ==============================
+# Bölüm Kaydı
+# ==============================
+# Her bölüm, başlığını, hangi girdilere ihtiyaç duyduğunu ve ağır olup
+# olmadığını bildirerek kaydedilir. Bölümler açılır kutular içinde çizilir ve
+# yalnızca kutu açıkken (ya da kenar çubuğundaki anahtarı açıkken) çalıştırılır;
+# böylece bir yeniden çalıştırma yalnızca görünen bölümlerin maliyetini öder.
+# Ağır bölümler varsayılan olarak kapalı gelir.
+
+Section = namedtuple("Section", ["key", "title", "render", "inputs", "heavy", "min_numeric", "max_numeric"])
+
+SECTIONS = []
+
+
+def section(key, title, inputs=("df",), heavy=False, min_numeric=0, max_numeric=None):
+    """Bir bölüm çizim fonksiyonunu kayda ekleyen dekoratör"""
+    def register(render):
+        SECTIONS.append(Section(key, title, render, tuple(inputs), heavy, min_numeric, max_numeric))
+        return render
+    return register
+
+
+def section_available(sec, numeric_features):
+    """Bölümün bu veri setinde gösterilip gösterilemeyeceği"""
+    if len(numeric_features) < sec.min_numeric:
+        return False
+    return sec.max_numeric is None or len(numeric_features) <= sec.max_numeric
+
+
+def _toggle_key(sec):
+    return f"section_toggle_{sec.key}"
+
+
+def _expander_key(sec):
+    return f"section_{sec.key}"
+
+
+def _sync_expander(sec):
+    st.session_state[_expander_key(sec)] = st.session_state[_toggle_key(sec)]
+
+
+def _sync_toggle(sec):
+    st.session_state[_toggle_key(sec)] = st.session_state[_expander_key(sec)]
+
+
+def render_section_toggles(sections):
+    """Kenar çubuğunda her bölüm için aç/kapa anahtarı gösterir"""
+    st.subheader("Bölümler")
+    st.caption("Ağır bölümler varsayılan olarak kapalıdır; yalnızca açık bölümler hesaplanır.")
+    for sec in sections:
+        st.session_state.setdefault(_toggle_key(sec), not sec.heavy)
+        st.toggle(sec.title, key=_toggle_key(sec), on_change=_sync_expander, args=(sec,))
+
+
+def render_section(sec, context):
+    """Bölümü açılır kutu içinde, yalnızca kutu açıksa çalıştırır"""
+    expander = st.expander(
+        f"**{sec.title}**",
+        expanded=st.session_state[_toggle_key(sec)],
+        key=_expander_key(sec),
+        on_change=_sync_toggle,
+        args=(sec,)
+    )
+    if expander.open:
+        with expander, instrumentation.span(sec.key, kind="section"):
+            sec.render(**{name: context[name] for name in sec.inputs})
+
+
+@section("overview", "1. 📈 Veri Seti Genel Bakış", inputs=("df", "fingerprint", "numeric_features"))
+def render_overview(df, fingerprint, numeric_features):
+    profile = cached_profile(fingerprint, df)
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.metric(
             label="📋 Toplam Satır",
             value=f"{df.shape[0]:,}",
             delta="Veri Noktası"
         )
-    
+
     with col2:
         st.metric(
             label="📊 Toplam Sütun",
             value=df.shape[1],
             delta="Özellik"
         )
-    
+
     with col3:
-        numeric_count = len(df.select_dtypes(include=['int64', 'float64']).columns)
         st.metric(
             label="🔢 Sayısal Sütun",
-            value=numeric_count,
+            value=len(numeric_features),
             delta="Numerik"
         )
-    
+
     with col4:
-        missing_percentage = (df.isnull().sum().sum() / (df.shape[0] * df.shape[1]) * 100)
+        missing_percentage = profile["null_count"].sum() / max(df.shape[0] * df.shape[1], 1) * 100
         st.metric(
             label="⚠️ Eksik Veri",
             value=f"{missing_percentage:.1f}%",
             delta="Toplam",
             delta_color="inverse"
         )
-    
+
+
+@section("categorical", "1.5. Kategorik Veri Dağılımları", inputs=("df", "fingerprint"))
+def render_categorical(df, fingerprint):
+    for column, pie_col in zip(PIE_CHARTS, st.columns(3)):
+        if column in df.columns:
+            with pie_col:
+                render_pie_chart(fingerprint, column, cached_value_counts(fingerprint, df, column))
+
     st.markdown("---")
-    
-    # ==============================
-    # Pasta Grafikleri (Kategorik Dağılımlar)
-    # ==============================
-    st.header("1.5. Kategorik Veri Dağılımları")
-    
+
+    # Sütun İsimleri ve Tipleri
+    with st.expander("📝 Sütun İsimleri ve Tipleri"):
+        st.dataframe(column_info_table(cached_profile(fingerprint, df)), use_container_width=True, height=300)
+
+
+@section("preview", "2. 🔍 Ham Veri Önizleme", inputs=("df", "fingerprint"))
+def render_preview(df, fingerprint):
+    page_df = paged_table(df, fingerprint, "preview")
+    st.dataframe(page_df, use_container_width=True, height=400)
+
+
+@section("stats", "3. İstatistiksel Özet", inputs=("df", "fingerprint", "numeric_features"), heavy=True)
+def render_stats(df, fingerprint, numeric_features):
+    # Sekmeler de yalnızca açık olan sekmenin içeriğini hesaplar
+    tab1, tab2 = st.tabs(["Sayısal Özellikler", "Tüm Özellikler"], key="stats_tabs", on_change="rerun")
+
+    if tab1.open:
+        with tab1:
+            if len(numeric_features) > 0:
+                st.dataframe(
+                    cached_describe_numeric(fingerprint, df, numeric_features),
+                    use_container_width=True,
+                    height=350
+                )
+            else:
+                st.info("Bu veri setinde sayısal sütun bulunmamaktadır.")
+
+    if tab2.open:
+        with tab2:
+            describe_all = cached_describe_all(fingerprint, df)
+            st.dataframe(describe_all, use_container_width=True, height=350)
+
+
+@section("dtypes", "4. 🏷️ Veri Tipleri ve Detaylar", inputs=("df", "fingerprint"))
+def render_dtypes(df, fingerprint):
+    memory = cached_memory_comparison(fingerprint, df)
+    before_kb, after_kb = memory["before"].sum(), memory["after"].sum()
+
     col1, col2, col3 = st.columns(3)
-    
-    # Koruma Statüsü Dağılımı
+
     with col1:
-        if 'conservation_status' in df.columns:
-            st.subheader("Koruma Statüsü")
-            status_counts = df['conservation_status'].value_counts()
-            
-            fig, ax = plt.subplots(figsize=(8, 8))
-            colors = ['#e74c3c', '#e67e22', '#f39c12']
-            ax.pie(status_counts.values, labels=status_counts.index, autopct='%1.1f%%',
-                   colors=colors, startangle=90, textprops={'fontsize': 10})
-            ax.set_title('Koruma Statüsü Dağılımı', fontsize=12, fontweight='bold', pad=20)
-            st.pyplot(fig)
-            plt.close()
-    
-    # Kıta Dağılımı
+        st.metric(label="💾 Varsayılan Tiplerle", value=f"{before_kb:,.1f} KB")
+
     with col2:
-        if 'continent' in df.columns:
-            st.subheader("Kıta Dağılımı")
-            continent_counts = df['continent'].value_counts()
-            
-            fig, ax = plt.subplots(figsize=(8, 8))
-            colors = plt.cm.Set3(range(len(continent_counts)))
-            ax.pie(continent_counts.values, labels=continent_counts.index, autopct='%1.1f%%',
-                   colors=colors, startangle=90, textprops={'fontsize': 10})
-            ax.set_title('Kıtalara Göre Dağılım', fontsize=12, fontweight='bold', pad=20)
-            st.pyplot(fig)
-            plt.close()
-    
-    # Beslenme Türü Dağılımı
+        st.metric(label="🗜️ Optimize Tiplerle", value=f"{after_kb:,.1f} KB")
+
     with col3:
-        if 'diet_type' in df.columns:
-            st.subheader("Beslenme Türü")
-            diet_counts = df['diet_type'].value_counts()
-            
-            fig, ax = plt.subplots(figsize=(8, 8))
-            colors = ['#3498db', '#2ecc71', '#9b59b6']
-            ax.pie(diet_counts.values, labels=diet_counts.index, autopct='%1.1f%%',
-                   colors=colors, startangle=90, textprops={'fontsize': 10})
-            ax.set_title('Beslenme Türü Dağılımı', fontsize=12, fontweight='bold', pad=20)
-            st.pyplot(fig)
-            plt.close()
-    
+        st.metric(
+            label="📉 Tasarruf",
+            value=f"{1 - after_kb / before_kb:.1%}" if before_kb > 0 else "-",
+            delta="Bellek"
+        )
+
+    st.caption(
+        "Veri yüklenirken az sayıda farklı değeri olan metin sütunları kategoriye, "
+        "sayısal sütunlar değer kaybı olmadan en küçük tipe çevrilir. Varsayılan tipler: "
+        "object dizeler, int64 ve float64."
+    )
+
+    profile = cached_profile(fingerprint, df)
+    dtypes_df = pd.DataFrame({
+        "Sütun": profile.index,
+        "Veri Tipi": profile["dtype"].values,
+        "Null Sayısı": profile["null_count"].values,
+        "Null %": (profile["null_count"] / max(len(df), 1) * 100).round(2).values,
+        "Benzersiz Değer": profile["distinct"].values,
+        "Önce (KB)": memory["before"].round(2).values,
+        "Hafıza (KB)": memory["after"].round(2).values
+    })
+
+    st.dataframe(
+        dtypes_df.style.background_gradient(subset=['Null %'], cmap='Reds'),
+        use_container_width=True,
+        height=350
+    )
+
+
+@section("missing", "5. ⚠️ Eksik Değer Analizi", inputs=("df", "fingerprint"))
+def render_missing(df, fingerprint):
+    missing_df = profiler.missing_values_table(cached_profile(fingerprint, df), len(df))
+    total_missing = missing_df["Eksik Değer"].sum()
+
+    if total_missing == 0:
+        st.success("🎉 Harika! Veri setinizde hiç eksik değer bulunmamaktadır.")
+        return
+
+    st.warning(f"⚠️ Toplam {total_missing} eksik değer tespit edildi.")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.dataframe(
+            missing_df.style.background_gradient(subset=['Yüzde (%)'], cmap='YlOrRd'),
+            use_container_width=True,
+            height=300
+        )
+
+    with col2:
+        show_chart(
+            fingerprint, "missing", (),
+            charts.missing_values_figure, missing_df
+        )
+
+
+CORRELATION_LABELS = {
+    "pearson": "Pearson",
+    "spearman": "Spearman",
+    "kendall": "Kendall τ-b",
+}
+# "En Yüksek Korelasyonlar" listesindeki çift sayısı
+TOP_PAIRS = 10
+
+
+@section("correlation", "6. Sayısal Özellikler ve Korelasyon Analizi",
+         inputs=("df", "fingerprint", "numeric_features"), heavy=True, min_numeric=1)
+def render_correlation(df, fingerprint, numeric_features):
+    with st.expander("Tespit Edilen Sayısal Özellikler", expanded=False):
+        cols = st.columns(min(len(numeric_features), 4))
+        for idx, feature in enumerate(numeric_features):
+            with cols[idx % 4]:
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                            padding: 10px; border-radius: 8px; text-align: center;
+                            color: white; margin: 5px;'>
+                    <b>{feature}</b>
+                </div>
+                """, unsafe_allow_html=True)
+
+
+    st.subheader("Korelasyon Isı Haritası")
+
+    method = st.radio(
+        "Yöntem", correlation.CORRELATION_METHODS, format_func=CORRELATION_LABELS.get,
+        horizontal=True, key="correlation_method",
+        help="Spearman ve Kendall sıralara dayanır; doğrusal olmayan tekdüze ilişkileri ve aykırı değerlere dayanıklılığı yakalar."
+    )
+    result = cached_correlation_result(fingerprint, df, numeric_features, method)
+    if result.sampled_rows is not None:
+        st.caption(f"Kendall τ, {len(df):,} satırdan sabit tohumlu {result.sampled_rows:,} satırlık bir örnek üzerinde hesaplandı.")
+
+    heatmap = correlation.heatmap_matrix(result.matrix)
+    if len(heatmap) < len(result.matrix):
+        st.caption(
+            f"{len(result.matrix)} özellikten en güçlü korelasyona sahip {len(heatmap)} tanesi, "
+            "benzer özellikler yan yana gelecek şekilde kümelenerek gösteriliyor."
+        )
+
+    heatmap_cmap = "RdBu_r"
+    show_chart(
+        fingerprint, "heatmap", (tuple(numeric_features), method, heatmap_cmap),
+        charts.correlation_heatmap_figure, heatmap, heatmap_cmap,
+        f"Sayısal Özelliklerin Korelasyon Isı Haritası ({CORRELATION_LABELS[method]})"
+    )
+
+
+    with st.expander("En Yüksek Korelasyonlar", expanded=False):
+        top_pairs = cached_top_pairs(fingerprint, df, numeric_features, method, TOP_PAIRS)
+
+        for idx, (first, second, value, p_value, n_obs) in enumerate(top_pairs.itertuples(index=False, name=None), 1):
+            st.markdown(f"**{idx}.** `{first}` ↔ `{second}`: **{value:.3f}** (p = {p_value:.2g}, n = {n_obs:,})")
+
+
+@section("standardization", "7. Sayısal Özelliklerin Standartlaştırılması",
+         inputs=("df", "fingerprint", "numeric_features"), heavy=True, min_numeric=1)
+def render_standardization(df, fingerprint, numeric_features):
+    # z-skorları yalnızca görünen sayfa için, önbellekteki ölçekleme parametreleriyle hesaplanır
+    scaler_means, scaler_scales = cached_moments(fingerprint, df, numeric_features).scaler_params()
+
+    comparison_option = st.radio(
+        "Görüntüleme Modu:",
+        ["Standartlaştırılmış Veri", "Orijinal vs Standartlaştırılmış Karşılaştırma"],
+        horizontal=True
+    )
+
+    page_df = paged_table(df, fingerprint, "std", columns=numeric_features)
+    page_standardized = paging.standardize_page(page_df, scaler_means, scaler_scales)
+
+    if comparison_option == "Standartlaştırılmış Veri":
+        st.dataframe(page_standardized, use_container_width=True, height=350)
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**📄 Orijinal Veri**")
+            st.dataframe(page_df, use_container_width=True, height=350)
+        with col2:
+            st.markdown("**⚖️ Standartlaştırılmış Veri**")
+            st.dataframe(page_standardized, use_container_width=True, height=350)
+
+
+@section("pca", "8. Temel Bileşen Analizi (PCA)",
+         inputs=("df", "fingerprint", "numeric_features"), heavy=True, min_numeric=2)
+def render_pca(df, fingerprint, numeric_features):
+    pca_engine_labels = {
+        "auto": "Otomatik",
+        "exact": "Kesin (tam SVD)",
+        "covariance": "Kovaryans (akış)",
+        "incremental": "Artımlı (IncrementalPCA)",
+    }
+    pca_engine = st.selectbox(
+        "PCA Motoru:",
+        analysis.PCA_ENGINES,
+        format_func=pca_engine_labels.get,
+        help="Büyük veri setlerinde kovaryans ve artımlı motorlar standartlaştırılmış verinin tam kopyasını oluşturmaz."
+    )
+
+    try:
+        pca_df, explained_variance = cached_pca(fingerprint, df, numeric_features, pca_engine)
+    except ValueError as e:
+        # Filtrelenmiş çok küçük alt kümelerde PCA tanımsız olabilir
+        st.warning(f"⚠️ PCA hesaplanamadı: {e}")
+        return
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric(
+            label="🟦 PC1 Varyans",
+            value=f"{explained_variance[0]:.1%}",
+            delta="Birinci Bileşen"
+        )
+
+    with col2:
+        st.metric(
+            label="🟩 PC2 Varyans",
+            value=f"{explained_variance[1]:.1%}",
+            delta="İkinci Bileşen"
+        )
+
+    with col3:
+        st.metric(
+            label="🎯 Toplam Varyans",
+            value=f"{explained_variance.sum():.1%}",
+            delta="PC1 + PC2"
+        )
+
     st.markdown("---")
+
+
+    st.subheader("PCA Dağılım Grafiği (PC1 vs PC2)")
+
+    if len(pca_df) > charts.SCATTER_MAX_POINTS:
+        st.caption(f"{len(pca_df):,} nokta: yoğunluk (hexbin) gösterimi kullanılıyor.")
+    show_chart(
+        fingerprint, "pca_scatter", (tuple(numeric_features), pca_engine),
+        charts.pca_scatter_figure, pca_df, explained_variance
+    )
+
+
+@section("box_plots", "9. Sayısal Özelliklerin Kutu Grafikleri ve Aykırı Değer Analizi",
+         inputs=("df", "fingerprint", "numeric_features"), heavy=True, min_numeric=2)
+def render_box_plots(df, fingerprint, numeric_features):
+    selected_features = st.multiselect(
+        "Görselleştirmek istediğiniz özellikleri seçin:",
+        numeric_features,
+        default=numeric_features[:min(4, len(numeric_features))]
+    )
+
+    if not selected_features:
+        st.info("👆 Lütfen en az bir özellik seçin.")
+        return
+
+    box_stats = cached_box_stats(fingerprint, df, numeric_features)
+    show_chart(
+        fingerprint, "box_grid", tuple(selected_features),
+        charts.box_plot_grid_figure, box_stats, selected_features
+    )
+
+    details = st.expander("Aykırı Değer İstatistikleri", expanded=False, key="outlier_details", on_change="rerun")
+    if details.open:
+        with details:
+            outlier_df = cached_outliers(fingerprint, df, numeric_features)
+            outlier_df = outlier_df[outlier_df['Özellik'].isin(selected_features)]
+            st.dataframe(outlier_df, use_container_width=True)
+
+            st.markdown("**Dayanıklı ve çok değişkenli yöntemler**")
+            flags = cached_outlier_flags(fingerprint, df, numeric_features)
+            st.dataframe(outliers.method_summary(flags, selected_features), use_container_width=True)
+            st.caption(
+                f"Mahalanobis uzaklığı (tüm sayısal özellikler, d² > "
+                f"{outliers.chi2_threshold(len(numeric_features)):.2f}): "
+                f"{int(flags['mahalanobis'].sum()):,} satır · herhangi bir yöntemde aykırı: "
+                f"{int(flags['any'].sum()):,} satır"
+            )
+            st.download_button(
+                "📥 Satır bazında bayrakları indir (CSV)",
+                data=lambda: flags.to_csv(index_label="satir").encode("utf-8"),
+                file_name="aykiri_deger_bayraklari.csv",
+                mime="text/csv",
+                key="outlier_flags_download"
+            )
+
+
+@section("pair_plot", "10. Sayısal Özelliklerin Dağılım Grafikleri (Pair Plot)",
+         inputs=("df", "fingerprint", "numeric_features"), heavy=True, min_numeric=2, max_numeric=6)
+def render_pair_plot(df, fingerprint, numeric_features):
+    if st.button("🎨 Pair Plot Oluştur", key="pairplot_btn"):
+        with st.spinner('Pair plot oluşturuluyor...'):
+            try:
+                sample_features = numeric_features[:6]
+                plot_data = charts.pair_plot_data(df, sample_features)
+
+                if len(plot_data) > 0:
+                    if len(df) > charts.PAIRPLOT_MAX_POINTS:
+                        st.caption(
+                            f"Dağılım panelleri {charts.PAIRPLOT_MAX_POINTS:,} satırlık tabakalı bir "
+                            "örnekle, KDE'ler tüm veri üzerinden ızgara tabanlı çizildi."
+                        )
+                    show_chart(
+                        fingerprint, "pair_plot", tuple(sample_features),
+                        charts.pair_plot_figure, plot_data, sample_features
+                    )
+                else:
+                    st.warning("Pair plot oluşturmak için yeterli veri yok.")
+            except Exception as e:
+                st.error(f"Pair plot oluşturulurken hata: {str(e)}")
+
+
+@section("grouped", "11. Gruplara Göre Analiz",
+         inputs=("df", "fingerprint", "numeric_features"), heavy=True, min_numeric=1)
+def render_grouped(df, fingerprint, numeric_features):
+    group_columns = [col for col in grouped.GROUP_COLUMNS if col in df.columns]
+    if not group_columns:
+        st.info("Gruplanabilecek kategorik sütun bulunamadı.")
+        return
+
+    by = st.selectbox(
+        "Gruplama sütunu:", group_columns,
+        format_func=lambda col: FILTER_LABELS.get(col, col), key="grouped_by"
+    )
+    stats = cached_grouped_stats(fingerprint, df, by, numeric_features)
+    st.caption(f"{len(stats.sizes):,} grup, tek bir sıralama geçişiyle hesaplandı.")
+
+    feature = st.selectbox("Özellik:", numeric_features, key="grouped_feature")
+    st.dataframe(
+        pd.concat([stats.sizes, stats.describe[feature]], axis=1),
+        use_container_width=True
+    )
+
+    st.subheader("Gruplara Göre Dağılımlar")
+    if len(stats.sizes) > charts.GROUP_CHART_MAX_GROUPS:
+        st.caption(f"Grafikte en kalabalık {charts.GROUP_CHART_MAX_GROUPS} grup gösteriliyor.")
+    show_chart(
+        fingerprint, "grouped_summary", (by, tuple(numeric_features)),
+        charts.grouped_summary_figure, stats.describe, stats.sizes, numeric_features
+    )
+
+    if stats.correlation.shape[1] > 0:
+        st.subheader("Gruplara Göre Korelasyonlar")
+        show_chart(
+            fingerprint, "grouped_correlation", (by, tuple(numeric_features)),
+            charts.grouped_correlation_figure, stats.correlation
+        )
+
+    with st.expander("Gruplara Göre Aykırı Değerler (IQR)", expanded=False):
+        st.dataframe(stats.outliers, use_container_width=True)
+
+    if len(numeric_features) >= 2:
+        st.subheader("Gruplara Göre PCA")
+        if st.checkbox("Her grup için PCA hesapla", key="grouped_pca"):
+            parallel = st.checkbox(
+                "Süreç havuzunda paralel çalıştır", key="grouped_pca_parallel",
+                help="Çok sayıda büyük grupta hızlandırır; az grupta süreç başlatma maliyeti baskındır."
+            )
+            with st.spinner("Grup PCA'ları hesaplanıyor..."):
+                st.dataframe(
+                    cached_grouped_pca(fingerprint, df, by, numeric_features, parallel),
+                    use_container_width=True
+                )
+
+
+# ==============================
+# Performans Paneli
+# ==============================
+# Kenar çubuğundaki grafikte gösterilen son ölçülmüş çalıştırma sayısı
+PERF_HISTORY_RUNS = 20
+SPAN_KIND_LABELS = {"load": "yükleme", "section": "bölüm", "cache": "önbellek", "call": "çağrı"}
+
+
+def perf_setting(name, default):
+    """Ölçüm ayarı; anahtar widget'tan ayrı tutulur, böylece widget'ın
+    çizilmediği çalıştırmalarda (ör. yükleme ilerlemesi) kaybolmaz"""
+    return st.session_state.setdefault(name, default)
+
+
+def _sync_perf_setting(name):
+    st.session_state[name] = st.session_state[f"{name}_toggle"]
+
+
+def span_table(run):
+    """Bir çalıştırmanın aralıkları; iç içe aralıklar girintili"""
+    table = pd.DataFrame({
+        "Aralık": ["\u2003" * span["depth"] + span["name"] for span in run["spans"]],
+        "Tür": [SPAN_KIND_LABELS.get(span["kind"], span["kind"]) for span in run["spans"]],
+        "Süre (ms)": [round(span["seconds"] * 1000, 1) for span in run["spans"]],
+        "Önbellek": [span["cache"] or "" for span in run["spans"]],
+    })
+    if run["trace_memory"]:
+        for column, field in [("Ayrılan (MB)", "allocated_bytes"), ("Tepe (MB)", "peak_bytes")]:
+            table[column] = [None if span[field] is None else round(span[field] / 1024 ** 2, 2)
+                             for span in run["spans"]]
+    return table
+
+
+def render_performance_panel(run):
+    """Kenar çubuğunda ölçüm anahtarları ve son çalıştırmanın dökümü"""
+    enabled = perf_setting("perf_enabled", instrumentation.PROFILE_DEFAULT)
+    with st.expander("⏱️ Performans", expanded=enabled):
+        st.toggle(
+            "Çalıştırmaları ölç", value=enabled, key="perf_enabled_toggle",
+            on_change=_sync_perf_setting, args=("perf_enabled",),
+            help="Bölüm ve ağır çağrı başına süre ile önbellek isabet/ıskalama sayıları"
+        )
+        st.toggle(
+            "Bellek ölçümü (tracemalloc)", value=perf_setting("perf_memory", instrumentation.PROFILE_MEMORY_DEFAULT),
+            key="perf_memory_toggle", on_change=_sync_perf_setting, args=("perf_memory",), disabled=not enabled,
+            help="Ayrılan ve en yüksek Python belleği; çalıştırmayı belirgin biçimde yavaşlatır ve süreç genelidir"
+        )
+        if run is None:
+            if enabled:
+                st.caption("Bu çalıştırmada ölçülecek bir analiz yok.")
+            return
+
+        history = st.session_state.setdefault("perf_history", [])
+        history.append(run)
+        del history[:-PERF_HISTORY_RUNS]
+
+        col1, col2 = st.columns(2)
+        col1.metric("Çalıştırma", f"{run['total_seconds'] * 1000:,.0f} ms")
+        col2.metric("Önbellek", f"{run['cache_hits']} / {run['cache_misses']}", help="isabet / ıskalama")
+        if run["peak_bytes"] is not None:
+            st.caption(f"En yüksek ek Python belleği: {run['peak_bytes'] / 1024 ** 2:,.1f} MB")
+        st.dataframe(span_table(run), hide_index=True, use_container_width=True, height=300)
+
+        if len(history) > 1:
+            st.caption(f"Son {len(history)} çalıştırmanın süresi (ms)")
+            st.bar_chart(pd.Series([past["total_seconds"] * 1000 for past in history], name="ms"), height=120)
+
+        st.download_button(
+            "📥 JSON satırları", key="perf_jsonl_download",
+            data="".join(instrumentation.to_json_line(past) + "\n" for past in history),
+            file_name="performans.jsonl", mime="application/x-ndjson"
+        )
+        st.download_button(
+            "📥 Prometheus metinleri", key="perf_prom_download",
+            data=instrumentation.prometheus_text(get_result_store().stats()),
+            file_name="performans.prom", mime="text/plain"
+        )
+
+
+# Ölçüm açıksa bu çalıştırmanın bölüm ve çağrı süreleri kaydedilir
+instrumentation.start_run(
+    perf_setting("perf_enabled", instrumentation.PROFILE_DEFAULT),
+    perf_setting("perf_memory", instrumentation.PROFILE_MEMORY_DEFAULT)
+)
+
+with st.sidebar:
+    st.header("Ayarlar")
+    uploaded = st.file_uploader(
+        "📤 Veri seti yükle", type=ingest.UPLOAD_TYPES, key="dataset_upload",
+        help="CSV (gzip ya da zstd ile sıkıştırılmış olabilir), Parquet veya Arrow IPC dosyası"
+    )
+
+# Yüklenen dosya varsayılan veri setinin yerine geçer
+upload_job = start_upload(uploaded) if uploaded is not None else None
+if uploaded is None:
+    forget_upload()
+if upload_job is not None and not upload_job.done.wait(UPLOAD_WAIT_SECONDS):
+    render_upload_progress(upload_job)
+    st.stop()
+if upload_job is not None and upload_job.error is not None:
+    st.sidebar.error(f"❌ {upload_job.name} okunamadı: {upload_job.error}")
+    upload_job = None
+
+if upload_job is not None:
+    streaming_mode = False
+    df, data_fingerprint, default_loaded = upload_job.result, upload_job.digest, True
+else:
+    source_signature = data_loader.source_signature()
+    streaming_mode = source_signature is not None and source_signature[1] > STREAMING_THRESHOLD_BYTES
+    
+    if streaming_mode:
+        df, default_loaded = None, True
+        data_fingerprint = "akis-{}-{}".format(*source_signature)
+        with instrumentation.span("load_streaming_summary", kind="load", cache=True):
+            summary = load_streaming_summary(source_signature)
+    else:
+        with instrumentation.span("load_default_data", kind="load", cache=True):
+            df, data_fingerprint, default_loaded = load_default_data(source_signature)
+
+
+with st.sidebar:
+    if upload_job is not None:
+        st.success(f"✅ {upload_job.name} yüklendi")
+        st.caption(f"Toplam {len(df):,} satır")
+    elif default_loaded:
+        st.success("✅ Veri seti yüklendi")
+        if streaming_mode:
+            st.caption(f"Toplam {summary.n_rows:,} Hayvan Türü")
+            st.info("📦 Büyük veri seti: akış (streaming) modunda özetlendi")
+        else:
+            st.caption(f"Toplam {len(df)} Hayvan Türü")
+    else:
+        st.error("❌ Veri seti yüklenemedi")
     
-    # Sütun İsimleri ve Tipleri
-    with st.expander("📝 Sütun İsimleri ve Tipleri"):
-        col_info = pd.DataFrame({
-            'Sütun Adı': df.columns,
-            'Veri Tipi': df.dtypes.astype(str),
-            'Benzersiz Değer': [df[col].nunique() for col in df.columns],
-            'Örnek Değer': [str(df[col].iloc[0]) if len(df) > 0 else 'N/A' for col in df.columns]
-        })
-        st.dataframe(col_info, use_container_width=True, height=300)
+    if df is not None:
+        selection = render_filters(cached_filter_options(data_fingerprint, df))
+        full_rows = len(df)
+        df, data_fingerprint = cached_subset(data_fingerprint, df, selection)
+        if selection:
+            st.caption(f"Seçili satır: {len(df):,} / {full_rows:,}")
+        
+        render_section_toggles(
+            [sec for sec in SECTIONS if section_available(sec, analysis.get_numeric_features(df))]
+        )
+
+if streaming_mode:
     
-   
-    st.header("2. 🔍 Ham Veri Önizleme")
+    # ==============================
+    # Akış Modu: yalnızca parça parça biriktirilebilen özetler gösterilir
+    # ==============================
+    st.header("1. 📈 Veri Seti Genel Bakış")
     
-    col1, col2 = st.columns([3, 1])
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        rows_to_show = st.slider(
-            "Gösterilecek satır sayısını seçin:",
-            min_value=5,
-            max_value=min(50, len(df)),
-            value=min(10, len(df))
-        )
+        st.metric(label="📋 Toplam Satır", value=f"{summary.n_rows:,}", delta="Veri Noktası")
     
     with col2:
-        view_option = st.selectbox(
-            "Görünüm Seç",
-            ["İlk Satırlar", "Son Satırlar", "Rastgele Örnek"]
-        )
-    
-    st.markdown("")
-    
-    if view_option == "İlk Satırlar":
-        st.dataframe(df.head(rows_to_show), use_container_width=True, height=400)
-    elif view_option == "Son Satırlar":
-        st.dataframe(df.tail(rows_to_show), use_container_width=True, height=400)
-    else:
-        st.dataframe(df.sample(min(rows_to_show, len(df))), use_container_width=True, height=400)
-    
+        st.metric(label="📊 Toplam Sütun", value=summary.n_columns, delta="Özellik")
     
-    st.header("3. İstatistiksel Özet")
+    with col3:
+        st.metric(label="🔢 Sayısal Sütun", value=len(summary.numeric_features), delta="Numerik")
     
-    tab1, tab2 = st.tabs(["Sayısal Özellikler", "Tüm Özellikler"])
+    with col4:
+        missing_percentage = summary.null_counts.sum() / max(summary.n_rows * summary.n_columns, 1) * 100
+        st.metric(
+            label="⚠️ Eksik Veri",
+            value=f"{missing_percentage:.1f}%",
+            delta="Toplam",
+            delta_color="inverse"
+        )
     
-    with tab1:
-        numeric_df = df.select_dtypes(include=['int64', 'float64'])
-        if len(numeric_df.columns) > 0:
-            st.dataframe(numeric_df.describe(), use_container_width=True, height=350)
-        else:
-            st.info("Bu veri setinde sayısal sütun bulunmamaktadır.")
+    st.markdown("---")
     
-    with tab2:
-        describe_all = df.describe(include="all")
-        st.dataframe(describe_all, use_container_width=True, height=350)
+    st.header("1.5. Kategorik Veri Dağılımları")
     
+    for column, pie_col in zip(PIE_CHARTS, st.columns(3)):
+        if column in summary.value_counts:
+            with pie_col:
+                render_pie_chart(data_fingerprint, column, summary.sorted_value_counts(column))
     
-    st.header("4. 🏷️ Veri Tipleri ve Detaylar")
+    st.markdown("---")
     
-    dtypes_df = pd.DataFrame({
-        "Sütun": df.columns,
-        "Veri Tipi": df.dtypes.astype(str),
-        "Null Sayısı": df.isnull().sum().values,
-        "Null %": (df.isnull().sum() / len(df) * 100).round(2).values,
-        "Benzersiz Değer": [df[col].nunique() for col in df.columns],
-        "Hafıza (KB)": (df.memory_usage(deep=True).values[1:] / 1024).round(2)
-    })
+    summary_profile = summary.profile()
     
-    st.dataframe(
-        dtypes_df.style.background_gradient(subset=['Null %'], cmap='Reds'),
-        use_container_width=True,
-        height=350
-    )
+    with st.expander("📝 Sütun İsimleri ve Tipleri"):
+        st.dataframe(column_info_table(summary_profile), use_container_width=True, height=300)
     
-   
     st.header("5. ⚠️ Eksik Değer Analizi")
     
-    total_missing = df.isnull().sum().sum()
+    missing_df = profiler.missing_values_table(summary_profile, summary.n_rows)
     
-    if total_missing == 0:
+    if len(missing_df) == 0:
         st.success("🎉 Harika! Veri setinizde hiç eksik değer bulunmamaktadır.")
     else:
-        st.warning(f"⚠️ Toplam {total_missing} eksik değer tespit edildi.")
-        
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            missing_df = pd.DataFrame({
-                "Sütun": df.columns,
-                "Eksik Değer": df.isnull().sum(),
-                "Yüzde (%)": (df.isnull().sum() / len(df) * 100).round(2)
-            })
-            missing_df = missing_df[missing_df['Eksik Değer'] > 0].sort_values('Eksik Değer', ascending=False)
-            
-            if len(missing_df) > 0:
-                st.dataframe(
-                    missing_df.style.background_gradient(subset=['Yüzde (%)'], cmap='YlOrRd'),
-                    use_container_width=True,
-                    height=300
-                )
-        
-        with col2:
-            if len(missing_df) > 0:
-                fig, ax = plt.subplots(figsize=(8, 6))
-                colors = plt.cm.RdYlGn_r(missing_df['Yüzde (%)'] / 100)
-                ax.barh(missing_df['Sütun'], missing_df['Eksik Değer'], color=colors)
-                ax.set_xlabel('Eksik Değer Sayısı', fontsize=11, fontweight='bold')
-                ax.set_title('Sütunlara Göre Eksik Değer Dağılımı', fontsize=13, fontweight='bold')
-                ax.grid(axis='x', alpha=0.3, linestyle='--')
-                plt.tight_layout()
-                st.pyplot(fig)
-                plt.close()
+        st.warning(f"⚠️ Toplam {summary.null_counts.sum()} eksik değer tespit edildi.")
+        st.dataframe(missing_df, use_container_width=True, height=300)
     
+    if summary.numeric_features:
+        st.header("7. Standartlaştırma Parametreleri")
+        st.caption("Z-skoru için kullanılan ortalama ve (popülasyon) standart sapma değerleri")
+        st.dataframe(summary.numeric_stats(ddof=0), use_container_width=True)
     
-    st.markdown("---")
+    st.info("ℹ️ Korelasyon, PCA ve kutu grafikleri tüm verinin belleğe alınmasını gerektirdiği için akış modunda gösterilmez.")
+
+elif df is not None and len(df) == 0:
+    st.warning("⚠️ Seçilen filtrelere uyan satır yok. Kenar çubuğundan filtreleri genişletin.")
+
+elif df is not None:
     
-   
-    numeric_features = df.select_dtypes(include=["int64", "float64"]).columns.tolist()
+    numeric_features = analysis.get_numeric_features(df)
+    section_context = {
+        "df": df,
+        "fingerprint": data_fingerprint,
+        "numeric_features": numeric_features,
+    }
     
-    if len(numeric_features) > 0:
-        st.header("6. Sayısal Özellikler ve Korelasyon Analizi")
-        
-        with st.expander("Tespit Edilen Sayısal Özellikler", expanded=False):
-            cols = st.columns(min(len(numeric_features), 4))
-            for idx, feature in enumerate(numeric_features):
-                with cols[idx % 4]:
-                    st.markdown(f"""
-                    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                padding: 10px; border-radius: 8px; text-align: center;
-                                color: white; margin: 5px;'>
-                        <b>{feature}</b>
-                    </div>
-                    """, unsafe_allow_html=True)
-        
-      
-        st.subheader("Korelasyon Isı Haritası")
-        
-        corr_matrix = df[numeric_features].corr()
-        
-       
-        fig, ax = plt.subplots(figsize=(12, 10))
-        
-        mask = np.triu(np.ones_like(corr_matrix, dtype=bool), k=1)
-        
-        sns.heatmap(
-            corr_matrix,
-            annot=True,
-            fmt=".2f",
-            cmap="RdBu_r",
-            linewidths=1,
-            ax=ax,
-            center=0,
-            mask=mask,
-            square=True,
-            cbar_kws={"shrink": 0.8, "label": "Korelasyon Katsayısı"},
-            vmin=-1,
-            vmax=1
-        )
-        
-        ax.set_title("Sayısal Özelliklerin Korelasyon Isı Haritası", fontsize=16, fontweight='bold', pad=20)
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
-        
-        
-        with st.expander("En Yüksek Korelasyonlar", expanded=False):
-            corr_pairs = corr_matrix.unstack()
-            corr_pairs = corr_pairs[corr_pairs < 1.0].abs().sort_values(ascending=False)
-            top_corr = corr_pairs.head(10)
-            
-            for idx, (pair, value) in enumerate(top_corr.items(), 1):
-                st.markdown(f"**{idx}.** `{pair[0]}` ↔ `{pair[1]}`: **{value:.3f}**")
-        
-       
-        st.header("7. Sayısal Özelliklerin Standartlaştırılması")
-        
-       
-        scaler = StandardScaler()
-        
-        standardized_values = scaler.fit_transform(df[numeric_features])
-        
-        df_standardized = pd.DataFrame(
-            standardized_values,
-            columns=numeric_features
-        )
-        
-        
-        comparison_option = st.radio(
-            "Görüntüleme Modu:",
-            ["Standartlaştırılmış Veri", "Orijinal vs Standartlaştırılmış Karşılaştırma"],
-            horizontal=True
-        )
-        
-        rows_to_show_std = st.slider(
-            "Gösterilecek satır sayısını seçin:",
-            min_value=5,
-            max_value=min(50, len(df)),
-            value=min(10, len(df)),
-            key="std_rows"
-        )
-        
-        if comparison_option == "Standartlaştırılmış Veri":
-            st.dataframe(df_standardized.head(rows_to_show_std), use_container_width=True, height=350)
-        else:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("**📄 Orijinal Veri**")
-                st.dataframe(df[numeric_features].head(rows_to_show_std), use_container_width=True, height=350)
-            with col2:
-                st.markdown("**⚖️ Standartlaştırılmış Veri**")
-                st.dataframe(df_standardized.head(rows_to_show_std), use_container_width=True, height=350)
-        
-     
-        if len(numeric_features) >= 2:
-            st.header("8. Temel Bileşen Analizi (PCA)")
-            
-            
-            pca = PCA(n_components=2)
-            pca_components = pca.fit_transform(df_standardized)
-            
-            pca_df = pd.DataFrame(
-                pca_components,
-                columns=["PC1", "PC2"]
-            )
-            
-           
-            explained_variance = pca.explained_variance_ratio_
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    label="🟦 PC1 Varyans",
-                    value=f"{explained_variance[0]:.1%}",
-                    delta="Birinci Bileşen"
-                )
-            
-            with col2:
-                st.metric(
-                    label="🟩 PC2 Varyans",
-                    value=f"{explained_variance[1]:.1%}",
-                    delta="İkinci Bileşen"
-                )
-            
-            with col3:
-                st.metric(
-                    label="🎯 Toplam Varyans",
-                    value=f"{explained_variance.sum():.1%}",
-                    delta="PC1 + PC2"
-                )
-            
-            st.markdown("---")
-            
-            
-            st.subheader("PCA Dağılım Grafiği (PC1 vs PC2)")
-            
-            fig, ax = plt.subplots(figsize=(10, 7))
-            
-            scatter = ax.scatter(
-                pca_df["PC1"],
-                pca_df["PC2"],
-                alpha=0.7,
-                c=range(len(pca_df)),
-                cmap='viridis',
-                edgecolors='black',
-                linewidth=0.5,
-                s=100
-            )
-            
-            ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5, linewidth=1)
-            ax.axvline(x=0, color='gray', linestyle='--', alpha=0.5, linewidth=1)
-            
-            ax.set_xlabel(f"Birinci Temel Bileşen (PC1) - {explained_variance[0]:.1%} Varyans",
-                         fontsize=12, fontweight='bold')
-            ax.set_ylabel(f"İkinci Temel Bileşen (PC2) - {explained_variance[1]:.1%} Varyans",
-                         fontsize=12, fontweight='bold')
-            ax.set_title("İlk İki Temel Bileşenin Dağılım Grafiği", fontsize=14, fontweight='bold', pad=15)
-            ax.grid(True, alpha=0.3, linestyle='--')
-            
-            plt.colorbar(scatter, ax=ax, label='Veri Noktası İndeksi')
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
-            
-            
-            st.header("9. Sayısal Özelliklerin Kutu Grafikleri ve Aykırı Değer Analizi")
-            
-            
-            selected_features = st.multiselect(
-                "Görselleştirmek istediğiniz özellikleri seçin:",
-                numeric_features,
-                default=numeric_features[:min(4, len(numeric_features))]
-            )
-            
-            if selected_features:
-                
-                num_cols = min(2, len(selected_features))
-                num_rows = (len(selected_features) + num_cols - 1) // num_cols
-                
-                fig, axes = plt.subplots(num_rows, num_cols, figsize=(15, 5 * num_rows))
-                
-                if num_rows == 1 and num_cols == 1:
-                    axes = [axes]
-                elif num_rows == 1 or num_cols == 1:
-                    axes = axes.flatten()
-                else:
-                    axes = axes.flatten()
-                
-                colors = plt.cm.Set3(range(len(selected_features)))
-                
-                for idx, feature in enumerate(selected_features):
-                    if idx < len(axes):
-                        box_plot = axes[idx].boxplot(
-                            df[feature].dropna(),
-                            vert=True,
-                            patch_artist=True,
-                            widths=0.6,
-                            boxprops=dict(facecolor=colors[idx], alpha=0.7),
-                            medianprops=dict(color='red', linewidth=2),
-                            whiskerprops=dict(color='black', linewidth=1.5),
-                            capprops=dict(color='black', linewidth=1.5)
-                        )
-                        
-                        axes[idx].set_title(f'{feature} - Kutu Grafiği', fontsize=12, fontweight='bold')
-                        axes[idx].set_ylabel(feature, fontsize=11, fontweight='bold')
-                        axes[idx].grid(axis='y', alpha=0.3, linestyle='--')
-                        axes[idx].set_facecolor('#f8f9fa')
-                
-               
-                for idx in range(len(selected_features), len(axes)):
-                    axes[idx].axis('off')
-                
-                plt.tight_layout()
-                st.pyplot(fig)
-                plt.close()
-                
-                
-                with st.expander("Aykırı Değer İstatistikleri", expanded=False):
-                    outlier_stats = []
-                    for feature in selected_features:
-                        Q1 = df[feature].quantile(0.25)
-                        Q3 = df[feature].quantile(0.75)
-                        IQR = Q3 - Q1
-                        outliers = df[(df[feature] < Q1 - 1.5 * IQR) | (df[feature] > Q3 + 1.5 * IQR)][feature]
-                        
-                        outlier_stats.append({
-                            'Özellik': feature,
-                            'Aykırı Değer Sayısı': len(outliers),
-                            'Aykırı Değer Yüzdesi': f"{len(outliers) / len(df) * 100:.2f}%",
-                            'Alt Sınır': f"{Q1 - 1.5 * IQR:.2f}",
-                            'Üst Sınır': f"{Q3 + 1.5 * IQR:.2f}"
-                        })
-                    
-                    outlier_df = pd.DataFrame(outlier_stats)
-                    st.dataframe(outlier_df, use_container_width=True)
-            else:
-                st.info("👆 Lütfen en az bir özellik seçin.")
-            
-            
-            if len(numeric_features) <= 6 and len(numeric_features) >= 2:
-                st.header("10. Sayısal Özelliklerin Dağılım Grafikleri (Pair Plot)")
-                
-                if st.button("🎨 Pair Plot Oluştur", key="pairplot_btn"):
-                    with st.spinner('Pair plot oluşturuluyor...'):
-                        try:
-                            sample_features = numeric_features[:6]
-                            plot_data = df[sample_features].dropna()
-                            
-                            if len(plot_data) > 0:
-                                fig = sns.pairplot(
-                                    plot_data,
-                                    diag_kind='kde',
-                                    corner=False,
-                                    plot_kws={'alpha': 0.6, 's': 50, 'edgecolor': 'k'},
-                                    diag_kws={'alpha': 0.7}
-                                )
-                                fig.fig.suptitle('Sayısal Özelliklerin Pair Plot Analizi', y=1.01, fontsize=16, fontweight='bold')
-                                st.pyplot(fig)
-                                plt.close()
-                            else:
-                                st.warning("Pair plot oluşturmak için yeterli veri yok.")
-                        except Exception as e:
-                            st.error(f"Pair plot oluşturulurken hata: {str(e)}")
+    for sec in SECTIONS:
+        if section_available(sec, numeric_features):
+            render_section(sec, section_context)
     
-    else:
+    if len(numeric_features) == 0:
         st.warning("⚠️ Veri setinde sayısal özellik bulunamadı!")
     
     
@@ -654,3 +1120,11 @@ if df is not None:
 else:
     st.error("❌ Veri seti yüklenemedi. Lütfen sidebar'dan farklı bir veri seti yükleyin.")
     st.info("💡 Sidebar'dan (sol menü) farklı bir veri seti yükleyebilirsiniz.")
+
+
+# Havuzda çizilen grafikler sayfanın geri kalanı gönderildikten sonra yerleştirilir
+with instrumentation.span("flush_pending_charts"):
+    flush_pending_charts()
+
+with st.sidebar:
+    render_performance_panel(instrumentation.finish_run(get_result_store().stats()))
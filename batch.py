@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""Streamlit olmadan toplu (batch) analiz raporu.
+
+app.py'deki analiz hattını (genel bakış, sütun profili, istatistiksel özet,
+korelasyon, standartlaştırma, PCA, aykırı değerler) bir ya da çok sayıda CSV
+dosyası üzerinde çalıştırır. Dosyalar bir süreç havuzunda paralel işlenir;
+her dosya için çıktı dizinine bir summary.json, tablolar için Parquet
+dosyaları ve istenirse grafik PNG'leri yazılır.
+
+Bu modül streamlit'i hiçbir zaman içe aktarmaz; grafik modülü de yalnızca
+--png verildiğinde yüklenir.
+
+    python batch.py data/*.csv --out raporlar --png
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import analysis
+import correlation
+import data_loader
+import outliers
+import profiler
+
+
+DEFAULT_OUTPUT_DIR = "reports"
+# Pasta grafikleri çizilen kategorik sütunlar
+PIE_COLUMNS = ["conservation_status", "continent", "diet_type"]
+
+
+def _jsonable(value):
+    """numpy/pandas değerlerini json.dump'ın yazabileceği tiplere çevirir"""
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if value is pd.NA or value is pd.NaT:
+        return None
+    return value
+
+
+def _write_parquet(frame, path):
+    # Parquet sütun adları metin olmalıdır
+    frame = frame.copy()
+    frame.columns = frame.columns.map(str)
+    frame.to_parquet(path)
+
+
+def _write_charts(out_dir, df, profile, corr_matrix, pca_result, box_stats):
+    import charts
+
+    figures = {}
+    for column in PIE_COLUMNS:
+        if column in df.columns:
+            figures[f"pie_{column}"] = charts.pie_chart_figure(
+                analysis.value_counts(df[column]), f"{column} Dağılımı"
+            )
+
+    missing_df = profiler.missing_values_table(profile, len(df))
+    if len(missing_df) > 0:
+        figures["missing"] = charts.missing_values_figure(missing_df)
+    if corr_matrix is not None:
+        figures["heatmap"] = charts.correlation_heatmap_figure(correlation.heatmap_matrix(corr_matrix))
+    if pca_result is not None:
+        figures["pca_scatter"] = charts.pca_scatter_figure(*pca_result)
+    if box_stats:
+        figures["box_plots"] = charts.box_plot_grid_figure(box_stats, list(box_stats))
+
+    written = []
+    for name, fig in figures.items():
+        path = out_dir / f"{name}.png"
+        path.write_bytes(charts.figure_to_png(fig))
+        written.append(path.name)
+    return written
+
+
+def analyze_file(path, out_dir, pca_engine="auto", png=False):
+    """Tek bir CSV dosyası için raporu yazar; özet sözlüğünü döndürür"""
+    started = time.perf_counter()
+    path, out_dir = Path(path), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    df = data_loader.optimize_dtypes(data_loader.read_csv_typed(path))
+    numeric_features = analysis.get_numeric_features(df)
+    profile = profiler.profile_columns(df)
+    samples = profile["sample"].map(lambda value: None if value is None else str(value))
+    _write_parquet(profile.assign(sample=samples), out_dir / "profile.parquet")
+
+    summary = {
+        "source": str(path),
+        "fingerprint": analysis.dataset_fingerprint(df),
+        "overview": {
+            "rows": len(df),
+            "columns": df.shape[1],
+            "numeric_features": numeric_features,
+            "missing_values": int(profile["null_count"].sum()),
+            "missing_percentage": float(profile["null_count"].sum() / max(df.size, 1) * 100),
+        },
+        "profile": profile.to_dict(orient="index"),
+    }
+
+    corr_matrix = pca_result = None
+    box_stats = {}
+    if numeric_features:
+        moments = analysis.numeric_moments(df, numeric_features)
+
+        describe = analysis.describe_numeric(df, moments)
+        _write_parquet(describe, out_dir / "describe.parquet")
+
+        corr_result = correlation.correlation(None, numeric_features, "pearson", moments)
+        corr_matrix = corr_result.matrix
+        _write_parquet(corr_matrix, out_dir / "correlation.parquet")
+        summary["top_correlations"] = [
+            {"features": [first, second], "value": float(value), "p_value": float(p_value), "n": int(n_obs)}
+            for first, second, value, p_value, n_obs in correlation.top_pairs(corr_result).itertuples(index=False, name=None)
+        ]
+
+        means, scales = moments.scaler_params()
+        summary["standardization"] = {"mean": means.to_dict(), "scale": scales.to_dict()}
+
+        if len(numeric_features) >= 2:
+            pca_df, explained_variance = analysis.pca_2d(df, moments, engine=pca_engine)
+            pca_result = (pca_df, explained_variance)
+            _write_parquet(pca_df, out_dir / "pca.parquet")
+            summary["pca"] = {"engine": pca_engine, "explained_variance_ratio": explained_variance}
+
+        box_stats = analysis.box_plot_stats(df, numeric_features)
+        outlier_df = outliers.iqr_table(df, numeric_features)
+        _write_parquet(outlier_df, out_dir / "outliers.parquet")
+        summary["outliers"] = outlier_df.to_dict(orient="records")
+
+    if png:
+        summary["charts"] = _write_charts(out_dir, df, profile, corr_matrix, pca_result, box_stats)
+
+    summary["elapsed_seconds"] = time.perf_counter() - started
+    with open(out_dir / "summary.json", "w", encoding="utf-8") as f:
+        json.dump(_jsonable(summary), f, ensure_ascii=False, indent=2)
+    return summary
+
+
+def _collect_paths(inputs):
+    paths = []
+    for item in inputs:
+        item = Path(item)
+        paths.extend(sorted(item.glob("*.csv")) if item.is_dir() else [item])
+    return paths
+
+
+def _output_dir(root, path, paths):
+    # Aynı adlı dosyalar farklı dizinlerden gelirse çıktıları çakışmasın
+    stems = [p.stem for p in paths]
+    name = path.stem if stems.count(path.stem) == 1 else f"{path.parent.name}_{path.stem}"
+    return Path(root) / name
+
+
+def run_batch(paths, out_root, workers=None, pca_engine="auto", png=False):
+    """Dosyaları süreç havuzunda işler; {yol: özet ya da hata} döndürür"""
+    # Sonuçlar tamamlanma sırasına değil girdi sırasına göre dizilsin
+    results = {str(path): None for path in paths}
+    jobs = {path: _output_dir(out_root, path, paths) for path in paths}
+
+    if len(paths) == 1 or workers == 1:
+        for path, out_dir in jobs.items():
+            try:
+                results[str(path)] = {"status": "ok", "output": str(out_dir),
+                                      "summary": analyze_file(path, out_dir, pca_engine, png)}
+            except Exception as e:
+                results[str(path)] = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(analyze_file, path, out_dir, pca_engine, png): (path, out_dir)
+            for path, out_dir in jobs.items()
+        }
+        for future in as_completed(futures):
+            path, out_dir = futures[future]
+            try:
+                results[str(path)] = {"status": "ok", "output": str(out_dir), "summary": future.result()}
+            except Exception as e:
+                results[str(path)] = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV dosyaları için Streamlit'siz toplu analiz raporu.")
+    parser.add_argument("inputs", nargs="+", help="CSV dosyaları ya da CSV içeren dizinler")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT_DIR, help="çıktı dizini (varsayılan: reports)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="paralel süreç sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--pca-engine", choices=analysis.PCA_ENGINES, default="auto", help="PCA motoru")
+    parser.add_argument("--png", action="store_true", help="grafikleri PNG olarak da yaz")
+    args = parser.parse_args(argv)
+
+    paths = _collect_paths(args.inputs)
+    if not paths:
+        parser.error("işlenecek CSV dosyası bulunamadı")
+
+    os.makedirs(args.out, exist_ok=True)
+    results = run_batch(paths, args.out, args.workers, args.pca_engine, args.png)
+
+    index = {path: {key: value for key, value in result.items() if key != "summary"}
+             for path, result in results.items()}
+    with open(Path(args.out) / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+    failed = [path for path, result in results.items() if result["status"] != "ok"]
+    for path in failed:
+        print(f"HATA {path}: {results[path]['error']}", file=sys.stderr)
+    print(f"{len(results) - len(failed)}/{len(results)} dosya işlendi -> {args.out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Soğuk başlangıç içe aktarma süresi ölçümü.
+
+Her modül her tekrarda yeni bir Python yorumlayıcısında içe aktarılır ve
+duvar saati süresi ölçülür; medyan süre ile içe aktarma sonrasında bellekte
+bulunan ağır modüller (seaborn, sklearn, matplotlib) raporlanır.
+
+    python benchmarks/import_time.py --repeat 5 --json import_times.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Uygulamanın açılışta içe aktardığı modüller ve toplu rapor giriş noktası
+DEFAULT_MODULES = [
+    "analysis", "charts", "data_loader", "profiler", "pipeline",
+    "render_pool", "streaming", "batch", "streamlit",
+]
+HEAVY_MODULES = ["seaborn", "sklearn", "matplotlib"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, repeat):
+    """Modülü `repeat` kez yeni bir yorumlayıcıda içe aktarır"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "module": module,
+        "median_seconds": statistics.median(run["seconds"] for run in runs),
+        "min_seconds": min(run["seconds"] for run in runs),
+        "heavy_loaded": runs[-1]["loaded"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modüllerin soğuk içe aktarma sürelerini ölçer.")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="ölçülecek modüller")
+    parser.add_argument("--repeat", type=int, default=3, help="modül başına tekrar sayısı")
+    parser.add_argument("--json", dest="json_path", help="sonuçları bu JSON dosyasına da yaz")
+    args = parser.parse_args(argv)
+
+    results = [measure(module, args.repeat) for module in args.modules]
+
+    for result in results:
+        heavy = ", ".join(result["heavy_loaded"]) or "-"
+        print(f"{result['module']:<14} {result['median_seconds']:7.3f} s  (min {result['min_seconds']:.3f} s)  ağır: {heavy}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
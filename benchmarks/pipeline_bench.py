@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Analiz hattının aşama ve grafik bazında kıyaslama (benchmark) ölçümü.
+
+Her satır sayısı için ayrı bir Python sürecinde:
+
+1. synthetic.py ile endangered_animals.csv şemasında bir CSV üretilir,
+2. uygulamanın kullandığı fonksiyonlarla her aşama (yükleme, profil,
+   describe, korelasyon, standartlaştırma, PCA, aykırı değerler, gruplar)
+   ve her grafiğin PNG'ye çizimi sırayla çalıştırılır,
+3. aşama başına duvar saati süresi ve en yüksek bellek (RSS) ölçülür.
+
+Aşama başına en yüksek RSS, Linux'ta her aşamadan önce /proc/self/clear_refs
+ile sıfırlanan VmHWM'dir; diğer sistemlerde süreç ömrü boyunca en yüksek
+değerdir. Sonuçlar commit'ler arasında karşılaştırılabilmesi için git
+sürümü ve kütüphane sürümleriyle birlikte JSON olarak yazılır.
+
+    python benchmarks/pipeline_bench.py --rows 1e3 1e4 1e5 --json bench.json
+    python benchmarks/pipeline_bench.py --rows 1e5 --compare bench.json
+
+10⁸ satır için yaklaşık 12 GB disk ve veri setini bellekte tutacak kadar
+RAM gerekir.
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import synthetic
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000]
+MIN_ROWS, MAX_ROWS = 10 ** 3, 10 ** 8
+GROUP_COLUMN = "conservation_status"
+PIE_COLUMNS = ["conservation_status", "continent", "diet_type"]
+# Pair plot'ta uygulamadaki gibi ilk altı sayısal özellik kullanılır
+PAIRPLOT_FEATURES = 6
+# İlk kullanımda yüklenen modüller; yükleme süreleri aşamalara karışmasın diye önceden alınır
+WARM_MODULES = ["seaborn", "sklearn.decomposition", "scipy.special", "scipy.cluster.hierarchy"]
+
+
+def _status_kb(field):
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb():
+    """Son sıfırlamadan (ya da süreç başlangıcından) bu yana en yüksek RSS"""
+    peak = _status_kb("VmHWM")
+    if peak is None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS bayt, Linux kilobayt döndürür
+        peak = peak / 1024 if sys.platform == "darwin" else peak
+    return peak / 1024
+
+
+def reset_peak_rss():
+    """En yüksek RSS sayacını sıfırlar; desteklenmiyorsa False"""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class StageTimer:
+    """Aşamaları çalıştırıp süre ve en yüksek RSS kaydeder"""
+
+    def __init__(self):
+        self.stages = {}
+        self.per_stage_peak = True
+
+    def run(self, name, func, *args):
+        gc.collect()
+        self.per_stage_peak = reset_peak_rss() and self.per_stage_peak
+        started = time.perf_counter()
+        result = func(*args)
+        self.stages[name] = {
+            "seconds": round(time.perf_counter() - started, 6),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+        return result
+
+
+def _load(path):
+    import data_loader
+
+    return data_loader.optimize_dtypes(data_loader.read_csv_typed(path))
+
+
+def run_stages(path, n_rows, figures=True):
+    """Tek bir veri seti üzerinde tüm aşamaları ölçer"""
+    import numpy as np
+
+    import analysis
+    import charts
+    import correlation
+    import grouped
+    import outliers
+    import profiler
+
+    timer = StageTimer()
+    timer.run("imports", lambda: [importlib.import_module(module) for module in WARM_MODULES])
+    df = timer.run("load", _load, path)
+    features = analysis.get_numeric_features(df)
+
+    profile = timer.run("profile", profiler.profile_columns, df)
+    moments = timer.run("moments", analysis.numeric_moments, df, features)
+    timer.run("describe", analysis.describe_numeric, df, moments)
+    corr = timer.run("corr", correlation.correlation, None, features, "pearson", moments)
+    values = df[features].to_numpy(dtype=np.float64, na_value=np.nan)
+    timer.run("corr_spearman", correlation.correlation, values, features, "spearman")
+    timer.run("corr_kendall", correlation.correlation, values, features, "kendall")
+    del values
+    standardized, _, _ = timer.run("standardize", analysis.standardize, df, moments)
+    pca = timer.run("pca", analysis.pca_2d, df, moments)
+    timer.run("outliers", outliers.iqr_table, df, features)
+    timer.run("outlier_flags", outliers.outlier_flags, df, features, standardized, corr.matrix)
+    del standardized
+    box_stats = timer.run("box_stats", analysis.box_plot_stats, df, features)
+    group_stats = timer.run("grouped_stats", grouped.grouped_stats, df, GROUP_COLUMN, features)
+
+    if figures:
+        # Uygulamadaki grafiklerle aynı oluşturucular ve aynı PNG çözünürlüğü
+        pair_features = features[:PAIRPLOT_FEATURES]
+        builders = {
+            **{f"pie_{column}": (charts.pie_chart_figure, analysis.value_counts(df[column]), column)
+               for column in PIE_COLUMNS},
+            "missing": (charts.missing_values_figure, profiler.missing_values_table(profile, len(df))),
+            "heatmap": (charts.correlation_heatmap_figure, correlation.heatmap_matrix(corr.matrix)),
+            "pca_scatter": (charts.pca_scatter_figure, *pca),
+            "box_plots": (charts.box_plot_grid_figure, box_stats, list(box_stats)),
+            "grouped_summary": (charts.grouped_summary_figure, group_stats.describe, group_stats.sizes, features),
+            "grouped_correlation": (charts.grouped_correlation_figure, group_stats.correlation),
+            "pair_plot": (charts.pair_plot_figure, charts.pair_plot_data(df, pair_features), pair_features),
+        }
+        for name, (build_figure, *args) in builders.items():
+            timer.run(f"figure:{name}", charts.render_png, build_figure, *args)
+
+    return {
+        "rows": n_rows,
+        "columns": df.shape[1],
+        "numeric_features": len(features),
+        "stages": timer.stages,
+        "total_seconds": round(sum(stage["seconds"] for stage in timer.stages.values()), 6),
+        "peak_rss_mb": round(max(stage["peak_rss_mb"] for stage in timer.stages.values()), 1),
+        "per_stage_peak_rss": timer.per_stage_peak,
+    }
+
+
+def run_worker(n_rows, seed, null_rate, figures, data_dir):
+    """Alt süreçte çalışır: veriyi üretir, aşamaları ölçer, sonucu JSON basar"""
+    with tempfile.TemporaryDirectory(dir=data_dir) as work_dir:
+        path = Path(work_dir) / f"synthetic_{n_rows}.csv"
+        started = time.perf_counter()
+        synthetic.write_csv(path, n_rows, seed, null_rate)
+        generate_seconds = time.perf_counter() - started
+        csv_mb = path.stat().st_size / 1024 ** 2
+        result = run_stages(path, n_rows, figures)
+    result["generate_seconds"] = round(generate_seconds, 6)
+    result["csv_mb"] = round(csv_mb, 1)
+    print(json.dumps(result))
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    """Sonuçların hangi kod ve ortamda alındığı"""
+    import matplotlib
+    import numpy
+    import pandas
+    import pyarrow
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": {
+            "numpy": numpy.__version__, "pandas": pandas.__version__,
+            "pyarrow": pyarrow.__version__, "matplotlib": matplotlib.__version__,
+        },
+    }
+
+
+def measure(n_rows, seed, null_rate, figures, data_dir):
+    """Bir satır sayısını yeni bir süreçte ölçer"""
+    command = [sys.executable, __file__, "--worker", str(n_rows), "--seed", str(seed),
+               "--null-rate", str(null_rate)]
+    if not figures:
+        command.append("--no-figures")
+    if data_dir:
+        command += ["--data-dir", str(data_dir)]
+    output = subprocess.run(command, cwd=REPO_DIR, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_run(run, previous=None):
+    print(f"\n{run['rows']:,} satır · CSV {run['csv_mb']:.1f} MB · üretim {run['generate_seconds']:.2f} s")
+    for name, stage in run["stages"].items():
+        line = f"  {name:<30} {stage['seconds']:9.3f} s  {stage['peak_rss_mb']:9.1f} MB"
+        old = (previous or {}).get("stages", {}).get(name)
+        if old and old["seconds"] > 0:
+            line += f"  x{stage['seconds'] / old['seconds']:.2f} süre, x{stage['peak_rss_mb'] / max(old['peak_rss_mb'], 1e-9):.2f} bellek"
+        print(line)
+    print(f"  {'toplam':<30} {run['total_seconds']:9.3f} s  {run['peak_rss_mb']:9.1f} MB (en yüksek)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz aşamalarını sentetik veri üzerinde ölçer.")
+    parser.add_argument("--rows", nargs="+", type=synthetic.parse_rows, default=DEFAULT_ROWS,
+                        help="ölçülecek satır sayıları (ör. 1e3 1e5 1e7)")
+    parser.add_argument("--seed", type=int, default=0, help="sentetik veri tohumu")
+    parser.add_argument("--null-rate", type=float, default=synthetic.DEFAULT_NULL_RATE, help="ek eksik değer oranı")
+    parser.add_argument("--no-figures", action="store_true", help="grafik çizimlerini ölçme")
+    parser.add_argument("--data-dir", help="geçici CSV'lerin yazılacağı dizin (büyük veriler için)")
+    parser.add_argument("--json", dest="json_path", help="sonuçları bu JSON dosyasına yaz")
+    parser.add_argument("--compare", help="önceki bir JSON çıktısıyla aşama aşama karşılaştır")
+    parser.add_argument("--worker", type=synthetic.parse_rows, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        run_worker(args.worker, args.seed, args.null_rate, not args.no_figures, args.data_dir)
+        return 0
+
+    for n_rows in args.rows:
+        if not MIN_ROWS <= n_rows <= MAX_ROWS:
+            parser.error(f"satır sayısı {MIN_ROWS:,} ile {MAX_ROWS:,} arasında olmalı: {n_rows:,}")
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = {run["rows"]: run for run in json.load(f)["runs"]}
+
+    report = {"environment": environment(), "seed": args.seed, "null_rate": args.null_rate, "runs": []}
+    for n_rows in args.rows:
+        run = measure(n_rows, args.seed, args.null_rate, not args.no_figures, args.data_dir)
+        report["runs"].append(run)
+        print_run(run, previous.get(n_rows))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""endangered_animals.csv şemasında sentetik veri üreticisi.
+
+Her sentetik satır gerçek veri setinden rastgele seçilen bir satırdan
+türetilir; böylece koruma statüsü, yaşam alanı, kıta, beslenme türü ve
+tehdit seviyesinin ortak dağılımı ile sayısal sütunlar arasındaki ilişkiler
+korunur:
+
+- Adlar satır numarasıyla benzersizleştirilir (yüksek kardinaliteli metin).
+- Popülasyon, vücut ağırlığı ve yaşam süresi log-normal gürültüyle
+  çarpılır; tehdit seviyesi satırların bir kısmında ±1 kayar.
+- Gerçek veride "Unknown" olan popülasyonlar eksik kalır ve veri
+  setindeki gibi "Unknown" yazılır; ayrıca NULL_COLUMNS sütunlarına
+  null_rate oranında eksik değer (boş hücre) eklenir.
+
+Veri parça parça üretilip pyarrow'un CSV yazıcısıyla yazıldığı için 10⁸
+satır da sabit bellekle üretilebilir; aynı tohum ve satır sayısı her zaman
+aynı dosyayı verir.
+
+    python benchmarks/synthetic.py 1e6 --out sentetik_1e6.csv
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+SOURCE_CSV = REPO_DIR / "endangered_animals.csv"
+
+# Sayısal sütunlara uygulanan log-normal gürültünün standart sapması
+NOISE_SIGMA = {"population": 0.5, "body_weight_kg": 0.25, "lifespan_years": 0.15}
+# Tehdit seviyesinin ±1 kaydığı satır oranı
+THREAT_SHIFT_RATE = 0.2
+# Ek eksik değer eklenen sütunlar ve varsayılan oran
+NULL_COLUMNS = ["habitat", "continent", "body_weight_kg", "lifespan_years"]
+DEFAULT_NULL_RATE = 0.01
+CHUNK_ROWS = 1_000_000
+NA_REP = "Unknown"
+
+
+def load_template(path=SOURCE_CSV):
+    """Sentetik satırların türetildiği gerçek veri seti"""
+    return pd.read_csv(path, na_values=[NA_REP])
+
+
+def generate(n_rows, seed=0, null_rate=DEFAULT_NULL_RATE, start=0, template=None):
+    """start numaralı satırdan başlayarak n_rows sentetik satır üretir.
+
+    Rastgele üreteç (tohum, başlangıç) çiftinden türetildiği için parçalar
+    birbirinden bağımsız ve tekrarlanabilirdir.
+    """
+    template = load_template() if template is None else template
+    rng = np.random.default_rng([seed, start])
+    base = template.iloc[rng.integers(0, len(template), n_rows)].reset_index(drop=True)
+    ids = pd.Series(np.arange(start, start + n_rows)).astype(str)
+
+    df = pd.DataFrame({
+        "animal_name": base["animal_name"] + " #" + ids,
+        "scientific_name": base["scientific_name"] + " " + ids,
+        "conservation_status": base["conservation_status"],
+        "population": np.round(base["population"] * rng.lognormal(0.0, NOISE_SIGMA["population"], n_rows)),
+        "habitat": base["habitat"],
+        "continent": base["continent"],
+        "threat_level": np.clip(
+            base["threat_level"] + np.where(rng.random(n_rows) < THREAT_SHIFT_RATE, rng.choice([-1, 1], n_rows), 0),
+            1, 10
+        ),
+        "body_weight_kg": np.round(
+            base["body_weight_kg"] * rng.lognormal(0.0, NOISE_SIGMA["body_weight_kg"], n_rows), 2
+        ),
+        "lifespan_years": np.maximum(
+            np.round(base["lifespan_years"] * rng.lognormal(0.0, NOISE_SIGMA["lifespan_years"], n_rows)), 1
+        ),
+        "diet_type": base["diet_type"],
+    })
+
+    for column in NULL_COLUMNS:
+        missing = rng.random(n_rows) < null_rate
+        df[column] = df[column].mask(missing)
+    # Tamsayı sütunları eksik değerle birlikte "12.0" değil "12" olarak yazılsın
+    return df.astype({"population": "Int64", "threat_level": "Int8", "lifespan_years": "Int16"})
+
+
+def iter_chunks(n_rows, seed=0, null_rate=DEFAULT_NULL_RATE, chunk_rows=CHUNK_ROWS):
+    """n_rows satırı en fazla chunk_rows satırlık parçalar halinde üretir"""
+    template = load_template()
+    for start in range(0, n_rows, chunk_rows):
+        yield generate(min(chunk_rows, n_rows - start), seed, null_rate, start, template)
+
+
+def write_csv(path, n_rows, seed=0, null_rate=DEFAULT_NULL_RATE, chunk_rows=CHUNK_ROWS):
+    """Sentetik veri setini CSV olarak yazar; dosya yolunu döndürür"""
+    path = Path(path)
+    writer = None
+    try:
+        for chunk in iter_chunks(n_rows, seed, null_rate, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            population = table.schema.get_field_index("population")
+            table = table.set_column(population, "population", pc.fill_null(
+                pc.cast(table.column(population), pa.string()), NA_REP
+            ))
+            if writer is None:
+                writer = pacsv.CSVWriter(str(path), table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def parse_rows(text):
+    """"1e6" ya da "1_000_000" biçimindeki satır sayısı"""
+    return int(float(text.replace("_", "")))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="endangered_animals.csv şemasında sentetik CSV üretir.")
+    parser.add_argument("rows", type=parse_rows, help="satır sayısı (ör. 1e6)")
+    parser.add_argument("--out", required=True, help="yazılacak CSV dosyası")
+    parser.add_argument("--seed", type=int, default=0, help="rastgele tohum")
+    parser.add_argument("--null-rate", type=float, default=DEFAULT_NULL_RATE,
+                        help=f"ek eksik değer oranı ({', '.join(NULL_COLUMNS)})")
+    args = parser.parse_args(argv)
+
+    path = write_csv(args.out, args.rows, args.seed, args.null_rate)
+    print(f"{args.rows:,} satır -> {path} ({path.stat().st_size / 1024 ** 2:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""Grafik oluşturma fonksiyonları.
+
+Büyük veri setlerinde her satırı tek tek çizmek hem yavaştır hem de
+tarayıcıya gönderilen görüntüyü şişirir. Bu yüzden grafikler satır sayısına
+göre otomatik bir detay seviyesi (level of detail) seçer: eşiğin altında
+her nokta çizilir, üstünde yoğunluk (hexbin) gösterimi, tabakalı örnekleme ve
+ızgara üzerinde hesaplanan KDE kullanılır. Böylece çizim süresi veri
+büyüdükçe yaklaşık sabit kalır.
+
+Tüm grafikler pyplot'un global durum makinesi yerine nesne yönelimli Figure
+API'siyle (Agg) oluşturulur; böylece iş parçacıklarında ya da ayrı süreçlerde
+güvenle ve paralel çizilebilirler.
+
+matplotlib ve seaborn yüklenmesi saniyeler sürdüğü için ilk çizime kadar
+içe aktarılmazlar; seaborn yalnızca ısı haritası için kullanılır.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+
+# PCA dağılım grafiğinde bu sayının üstünde hexbin yoğunluk gösterimine geçilir
+SCATTER_MAX_POINTS = 20_000
+HEXBIN_GRID_SIZE = 80
+
+# Pair plot'ta bu sayının üstünde tabakalı örnekleme yapılır
+PAIRPLOT_MAX_POINTS = 5_000
+# Örneklemede tabaka olarak kullanılan sütun
+PAIRPLOT_STRATA_COLUMN = 'conservation_status'
+# Izgara üzerinde KDE için kullanılan kutu sayısı
+KDE_GRID_SIZE = 512
+# Korelasyon ısı haritasında bu özellik sayısına kadar hücre değerleri yazılır
+HEATMAP_ANNOTATE_MAX = 20
+# Gruplanmış küçük çoklu grafiklerde gösterilen en fazla grup sayısı (en kalabalıklar)
+GROUP_CHART_MAX_GROUPS = 40
+# Gruplanmış korelasyon ısı haritasında bu grup sayısına kadar hücre değerleri yazılır
+GROUP_HEATMAP_ANNOTATE_MAX = 30
+# PNG çıktısı için st.pyplot ile aynı çözünürlük
+PNG_DPI = 200
+
+
+def _new_figure(**kwargs):
+    """Yeni bir Figure; matplotlib ilk çizimde yüklenir"""
+    from matplotlib.figure import Figure
+    return Figure(**kwargs)
+
+
+def _colormap(name):
+    from matplotlib import colormaps
+    return colormaps[name]
+
+
+def figure_to_png(fig, dpi=PNG_DPI):
+    """Figürü PNG baytlarına dönüştürür"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def render_png(build_figure, *args):
+    """build_figure(*args) ile figürü oluşturup PNG baytlarını döndürür.
+
+    Çizim havuzundaki işçilerde çalışır; bu yüzden modül düzeyinde tanımlıdır
+    ve argümanları pickle edilebilir olmalıdır.
+    """
+    return figure_to_png(build_figure(*args))
+
+
+def stratified_sample(df, n, strata_column=None, seed=0):
+    """Tabakaların oranlarını koruyarak en fazla n satırlık örnek seçer"""
+    if len(df) <= n:
+        return df
+    if strata_column is None or strata_column not in df.columns:
+        return df.sample(n=n, random_state=seed)
+
+    fraction = n / len(df)
+    # Tabaka değeri eksik satırlar ayrı bir tabaka olarak örneklenir
+    strata, _ = pd.factorize(df[strata_column], use_na_sentinel=False)
+    return df.groupby(strata, group_keys=False).sample(frac=fraction, random_state=seed)
+
+
+def binned_kde(values, grid_size=KDE_GRID_SIZE):
+    """Gauss KDE'yi ızgara üzerinde (histogram + evrişim) hesaplar.
+
+    Maliyet, nokta sayısından bağımsız olarak ızgara boyutuyla orantılıdır.
+    Bant genişliği Scott kuralıyla seçilir. (ızgara, yoğunluk) döndürür.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    low, high = values.min(), values.max()
+    if len(values) < 2 or low == high:
+        return np.array([low]), np.array([1.0])
+
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    padding = 3 * bandwidth
+    counts, edges = np.histogram(values, bins=grid_size, range=(low - padding, high + padding))
+    grid = (edges[:-1] + edges[1:]) / 2
+    step = edges[1] - edges[0]
+
+    kernel_half_width = max(1, int(np.ceil(4 * bandwidth / step)))
+    offsets = np.arange(-kernel_half_width, kernel_half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    density = np.convolve(counts, kernel, mode="same")
+    density /= density.sum() * step
+    return grid, density
+
+
+def pie_chart_figure(counts, title, colors=None):
+    """Bir kategorik sütunun frekansları için pasta grafiği"""
+    fig = _new_figure(figsize=(8, 8))
+    ax = fig.subplots()
+    if colors is None:
+        colors = _colormap('Set3')(range(len(counts)))
+    ax.pie(counts.values, labels=counts.index, autopct='%1.1f%%',
+           colors=colors, startangle=90, textprops={'fontsize': 10})
+    ax.set_title(title, fontsize=12, fontweight='bold', pad=20)
+    return fig
+
+
+def missing_values_figure(missing_df):
+    """Sütunlara göre eksik değer sayıları için yatay çubuk grafik"""
+    fig = _new_figure(figsize=(8, 6))
+    ax = fig.subplots()
+    colors = _colormap('RdYlGn_r')(missing_df['Yüzde (%)'] / 100)
+    ax.barh(missing_df['Sütun'], missing_df['Eksik Değer'], color=colors)
+    ax.set_xlabel('Eksik Değer Sayısı', fontsize=11, fontweight='bold')
+    ax.set_title('Sütunlara Göre Eksik Değer Dağılımı', fontsize=13, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+    fig.tight_layout()
+    return fig
+
+
+def correlation_heatmap_figure(corr_matrix, cmap="RdBu_r", title="Sayısal Özelliklerin Korelasyon Isı Haritası"):
+    """Alt üçgen korelasyon ısı haritası; geniş matrislerde hücre değerleri yazılmaz"""
+    import seaborn as sns
+
+    fig = _new_figure(figsize=(12, 10))
+    ax = fig.subplots()
+
+    mask = np.triu(np.ones_like(corr_matrix, dtype=bool), k=1)
+    annotate = len(corr_matrix) <= HEATMAP_ANNOTATE_MAX
+
+    sns.heatmap(
+        corr_matrix,
+        annot=annotate,
+        fmt=".2f",
+        cmap=cmap,
+        linewidths=1 if annotate else 0,
+        ax=ax,
+        center=0,
+        mask=mask,
+        square=True,
+        cbar_kws={"shrink": 0.8, "label": "Korelasyon Katsayısı"},
+        vmin=-1,
+        vmax=1
+    )
+
+    ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+    fig.tight_layout()
+    return fig
+
+
+def box_plot_grid_figure(box_stats, selected_features):
+    """Seçilen özellikler için önceden hesaplanmış istatistiklerden kutu grafikleri"""
+    num_cols = min(2, len(selected_features))
+    num_rows = (len(selected_features) + num_cols - 1) // num_cols
+
+    fig = _new_figure(figsize=(15, 5 * num_rows))
+    axes = fig.subplots(num_rows, num_cols, squeeze=False).flatten()
+
+    colors = _colormap('Set3')(range(len(selected_features)))
+
+    for idx, feature in enumerate(selected_features):
+        if feature in box_stats:
+            axes[idx].bxp(
+                [box_stats[feature]],
+                patch_artist=True,
+                widths=0.6,
+                boxprops=dict(facecolor=colors[idx], alpha=0.7),
+                medianprops=dict(color='red', linewidth=2),
+                whiskerprops=dict(color='black', linewidth=1.5),
+                capprops=dict(color='black', linewidth=1.5)
+            )
+
+            axes[idx].set_title(f'{feature} - Kutu Grafiği', fontsize=12, fontweight='bold')
+            axes[idx].set_ylabel(feature, fontsize=11, fontweight='bold')
+            axes[idx].grid(axis='y', alpha=0.3, linestyle='--')
+            axes[idx].set_facecolor('#f8f9fa')
+
+    for idx in range(len(selected_features), len(axes)):
+        axes[idx].axis('off')
+
+    fig.tight_layout()
+    return fig
+
+
+def largest_groups(sizes, max_groups=GROUP_CHART_MAX_GROUPS):
+    """Satır sayısına göre en kalabalık gruplar, kalabalıktan aza"""
+    return sizes.sort_values(ascending=False, kind="stable").index[:max_groups]
+
+
+def grouped_summary_figure(describe, sizes, features, max_groups=GROUP_CHART_MAX_GROUPS):
+    """Özellik başına bir panel: her grup için çeyrekler arası aralık ve medyan.
+
+    Yüzlerce grupta da okunabilir kalması için yalnızca en kalabalık
+    max_groups grup çizilir; paneller aynı grup sırasını paylaşır.
+    """
+    groups = largest_groups(sizes, max_groups)[::-1]
+    num_cols = min(2, len(features))
+    num_rows = (len(features) + num_cols - 1) // num_cols
+    height = max(3, 0.28 * len(groups) + 1.5)
+
+    fig = _new_figure(figsize=(15, height * num_rows))
+    axes = fig.subplots(num_rows, num_cols, squeeze=False, sharey=True).flatten()
+    positions = np.arange(len(groups))
+    colors = _colormap('Set3')(range(len(features)))
+
+    for idx, feature in enumerate(features):
+        stats = describe[feature].loc[groups]
+        ax = axes[idx]
+        ax.hlines(positions, stats["25%"], stats["75%"], color=colors[idx], linewidth=6, alpha=0.9)
+        ax.scatter(stats["50%"], positions, color='red', zorder=3, s=18, label='Medyan')
+        ax.scatter(stats["mean"], positions, color='black', marker='x', zorder=3, s=18, label='Ortalama')
+        ax.set_title(f'{feature}', fontsize=12, fontweight='bold')
+        ax.grid(axis='x', alpha=0.3, linestyle='--')
+        ax.set_facecolor('#f8f9fa')
+
+    axes[0].set_yticks(positions, [str(group) for group in groups], fontsize=9)
+    axes[0].legend(loc='lower right', fontsize=8)
+    for idx in range(len(features), len(axes)):
+        axes[idx].axis('off')
+
+    fig.suptitle(f'{sizes.index.name} Gruplarına Göre Dağılım (Q1-Q3, medyan)', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    return fig
+
+
+def grouped_correlation_figure(correlation):
+    """Satırları gruplar, sütunları özellik çiftleri olan korelasyon ısı haritası"""
+    fig = _new_figure(figsize=(max(8, 1.2 * correlation.shape[1] + 3), max(4, 0.25 * len(correlation) + 2)))
+    ax = fig.subplots()
+    image = ax.imshow(correlation.to_numpy(dtype=float), cmap='RdBu_r', vmin=-1, vmax=1, aspect='auto',
+                      interpolation='nearest')
+
+    ax.set_xticks(range(correlation.shape[1]), correlation.columns, rotation=45, ha='right', fontsize=9)
+    ax.set_yticks(range(len(correlation)), [str(group) for group in correlation.index],
+                  fontsize=9 if len(correlation) <= 60 else 5)
+    if len(correlation) <= GROUP_HEATMAP_ANNOTATE_MAX:
+        for (row, col), value in np.ndenumerate(correlation.to_numpy(dtype=float)):
+            if not np.isnan(value):
+                ax.text(col, row, f"{value:.2f}", ha='center', va='center', fontsize=8)
+
+    ax.set_ylabel(str(correlation.index.name), fontsize=11, fontweight='bold')
+    ax.set_title("Gruplara Göre Korelasyonlar", fontsize=14, fontweight='bold', pad=15)
+    fig.colorbar(image, ax=ax, label="Korelasyon Katsayısı")
+    fig.tight_layout()
+    return fig
+
+
+def pca_scatter_figure(pca_df, explained_variance, max_points=SCATTER_MAX_POINTS):
+    """PC1/PC2 dağılım grafiği; çok noktada hexbin yoğunluk grafiği çizer"""
+    fig = _new_figure(figsize=(10, 7))
+    ax = fig.subplots()
+
+    if len(pca_df) <= max_points:
+        scatter = ax.scatter(
+            pca_df["PC1"],
+            pca_df["PC2"],
+            alpha=0.7,
+            c=range(len(pca_df)),
+            cmap='viridis',
+            edgecolors='black',
+            linewidth=0.5,
+            s=100
+        )
+        colorbar_label = 'Veri Noktası İndeksi'
+    else:
+        scatter = ax.hexbin(
+            pca_df["PC1"],
+            pca_df["PC2"],
+            gridsize=HEXBIN_GRID_SIZE,
+            cmap='viridis',
+            mincnt=1,
+            bins='log'
+        )
+        colorbar_label = 'Nokta Sayısı (log)'
+
+    ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5, linewidth=1)
+    ax.axvline(x=0, color='gray', linestyle='--', alpha=0.5, linewidth=1)
+
+    ax.set_xlabel(f"Birinci Temel Bileşen (PC1) - {explained_variance[0]:.1%} Varyans",
+                  fontsize=12, fontweight='bold')
+    ax.set_ylabel(f"İkinci Temel Bileşen (PC2) - {explained_variance[1]:.1%} Varyans",
+                  fontsize=12, fontweight='bold')
+    ax.set_title("İlk İki Temel Bileşenin Dağılım Grafiği", fontsize=14, fontweight='bold', pad=15)
+    ax.grid(True, alpha=0.3, linestyle='--')
+
+    fig.colorbar(scatter, ax=ax, label=colorbar_label)
+    fig.tight_layout()
+    return fig
+
+
+def pair_plot_data(df, features, strata_column=PAIRPLOT_STRATA_COLUMN):
+    """Pair plot için gereken sütunlar (varsa tabaka sütunu dahil).
+
+    Yalnızca özelliklerinde eksik değer olan satırlar atılır; tabaka değeri
+    eksik satırlar korunur ve örneklemede kendi tabakalarını oluşturur.
+    """
+    features = list(features)
+    columns = list(features)
+    if strata_column in df.columns and strata_column not in columns:
+        columns.append(strata_column)
+    return df[columns].dropna(subset=features)
+
+
+def _gaussian_kde(values, points=200):
+    """Küçük veri için kesin Gauss KDE (Scott bant genişliği)"""
+    low, high = values.min(), values.max()
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    if len(values) < 2 or not bandwidth > 0:
+        return np.array([low]), np.array([1.0])
+    grid = np.linspace(low - 3 * bandwidth, high + 3 * bandwidth, points)
+    density = np.exp(-0.5 * ((grid[:, None] - values[None, :]) / bandwidth) ** 2).sum(axis=1)
+    density /= len(values) * bandwidth * np.sqrt(2 * np.pi)
+    return grid, density
+
+
+def pair_plot_figure(plot_data, features, max_points=PAIRPLOT_MAX_POINTS,
+                     strata_column=PAIRPLOT_STRATA_COLUMN):
+    """Sayısal özelliklerin pair plot'u (pair_plot_data çıktısı üzerinde).
+
+    Figure API ile çizilir: pyplot'un global durumuna dayanan sns.pairplot
+    çizim havuzunun iş parçacıklarında güvenli değildir. Küçük veride tüm
+    noktalar sns.pairplot'un önceki ayarlarıyla çizilir ve köşegende kesin
+    Gauss KDE kullanılır; görünüm seaborn'unkine yakındır, piksel piksel
+    aynı değildir. Büyük veride dağılım panelleri tabakalı bir örnekle,
+    köşegendeki KDE'ler ise tüm veri üzerinden ızgara tabanlı olarak çizilir.
+    """
+    features = list(features)
+    if len(plot_data) == 0:
+        return None
+
+    if len(plot_data) <= max_points:
+        scatter_data = plot_data
+        scatter_kws = {'alpha': 0.6, 's': 50, 'edgecolor': 'k', 'linewidth': 0.5}
+        kde = _gaussian_kde
+    else:
+        scatter_data = stratified_sample(plot_data, max_points, strata_column)
+        scatter_kws = {'alpha': 0.4, 's': 12, 'edgecolor': 'none'}
+        kde = binned_kde
+
+    n = len(features)
+    fig = _new_figure(figsize=(2.5 * n, 2.5 * n))
+    axes = fig.subplots(n, n, sharex='col', squeeze=False)
+
+    for row, y_feature in enumerate(features):
+        for col, x_feature in enumerate(features):
+            ax = axes[row, col]
+            if row == col:
+                grid, density = kde(plot_data[x_feature].to_numpy(dtype=np.float64))
+                diag_ax = ax.twinx()
+                diag_ax.fill_between(grid, density, alpha=0.7)
+                diag_ax.plot(grid, density, linewidth=1)
+                diag_ax.set_ylim(bottom=0)
+                diag_ax.set_yticks([])
+                for spine in ('top', 'right'):
+                    diag_ax.spines[spine].set_visible(False)
+                ax.tick_params(left=col == 0, labelleft=col == 0)
+            else:
+                ax.scatter(scatter_data[x_feature], scatter_data[y_feature], **scatter_kws)
+                if col > 0:
+                    ax.tick_params(labelleft=False)
+            if row == n - 1:
+                ax.set_xlabel(x_feature)
+            if col == 0:
+                ax.set_ylabel(y_feature)
+            for spine in ('top', 'right'):
+                ax.spines[spine].set_visible(False)
+
+    # Satırlardaki dağılım panelleri aynı y eksenini paylaşır (köşegen hariç)
+    for row in range(n):
+        others = [axes[row, col] for col in range(n) if col != row]
+        if others:
+            low = min(ax.get_ylim()[0] for ax in others)
+            high = max(ax.get_ylim()[1] for ax in others)
+            for ax in axes[row]:
+                ax.set_ylim(low, high)
+
+    fig.suptitle('Sayısal Özelliklerin Pair Plot Analizi', y=1.01, fontsize=16, fontweight='bold')
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Bellek eşlemli (memory-mapped) sütun deposu.
+
+Her veri seti diskte iki dosya olarak tutulur:
+
+- <ad>.arrow: sıkıştırılmamış Arrow IPC (Feather v2) dosyası. Bellek
+  eşlemiyle açılır; metin sütunları (pyarrow destekli "string") ve eksik
+  değersiz sayısal sütunlar dosyanın sayfalarını kopyalamadan gösterir.
+- <ad>.numeric.npy: tüm sayısal sütunlar tek, sütun öncelikli (Fortran
+  sıralı) bitişik bir float64 blok olarak; eksik değerler NaN'dır. Salt
+  okunur bellek eşlemiyle açılır.
+
+Sayfalar işletim sisteminin sayfa önbelleğindedir; aynı dosyayı açan tüm
+oturumlar ve süreçler aynı fiziksel belleği paylaşır. Korelasyon,
+ölçekleme ve PCA hesapları sayısal bloğu kopyalamadan okur.
+
+Dosyalar önce geçici bir ada yazılıp os.replace ile yerine konur; aynı
+anda yazan süreçler yarım dosya göremez.
+
+Açık sayısal bloklar en fazla MAX_MAPPED veri seti için tutulur; en uzun
+süredir kullanılmayanın eşlemesi bırakılır (LRU). Bloğu bırakılmış bir veri
+seti için numeric_block() None döner ve hesaplar DataFrame'den kopyalayarak
+devam eder.
+"""
+
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+
+
+# Bellek eşlemi açık tutulan en fazla veri seti (varsayılan veri seti ve son yüklemeler)
+MAX_MAPPED = 8
+
+_mapped = OrderedDict()
+_mapped_lock = threading.Lock()
+
+
+def _paths(directory, name):
+    return directory / f"{name}.arrow", directory / f"{name}.numeric.npy"
+
+
+def numeric_columns(df):
+    """Sayısal bloğa giren sütunlar (bool hariç sayısal tipler)"""
+    return df.select_dtypes(include="number").columns.tolist()
+
+
+def exists(directory, name):
+    return all(path.exists() for path in _paths(directory, name))
+
+
+def _replace(path, write):
+    temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+
+
+def write(df, directory, name):
+    """Veri setini Arrow dosyası ve sayısal blok olarak yazar"""
+    directory.mkdir(parents=True, exist_ok=True)
+    arrow_path, numeric_path = _paths(directory, name)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Tek kayıt grubu: parçalı sütunlar to_pandas'ta birleştirilirken kopyalanırdı
+    _replace(arrow_path, lambda path: feather.write_feather(
+        table, path, compression="uncompressed", chunksize=max(len(df), 1)
+    ))
+
+    block = np.asfortranarray(df[numeric_columns(df)].to_numpy(dtype=np.float64, na_value=np.nan))
+    # np.save yola ".npy" ekler; açık dosya nesnesiyle geçici ad korunur
+    def save(path):
+        with open(path, "wb") as f:
+            np.save(f, block)
+    _replace(numeric_path, save)
+
+
+def open_mapped(directory, name, key):
+    """Veri setini bellek eşlemiyle açar; DataFrame döndürür.
+
+    Sayısal blok key (veri setinin parmak izi) ile kaydedilir ve
+    numeric_block() ile alınır.
+    """
+    arrow_path, numeric_path = _paths(directory, name)
+    table = feather.read_table(arrow_path, memory_map=True)
+    # split_blocks: sütunlar tek bir 2B bloğa birleştirilmez; kopyasız dönüşüm mümkün olur
+    df = table.to_pandas(split_blocks=True)
+    block = np.load(numeric_path, mmap_mode="r")
+    columns = numeric_columns(df)
+    if block.shape != (len(df), len(columns)):
+        raise ValueError(f"Sayısal blok veri setiyle uyuşmuyor: {numeric_path}")
+    with _mapped_lock:
+        _mapped[key] = (columns, block)
+        _mapped.move_to_end(key)
+        while len(_mapped) > MAX_MAPPED:
+            _mapped.popitem(last=False)
+    return df
+
+
+def numeric_block(key, columns):
+    """key ile açılmış veri setinin istenen sütunlarına ait bloğu.
+
+    Sütunlar bloktakilerle aynıysa bellek eşlemli dizinin kendisi, bitişik
+    bir alt kümeyse kopyasız dilimi döner; aksi halde None.
+    """
+    with _mapped_lock:
+        entry = _mapped.get(key)
+        if entry is not None:
+            _mapped.move_to_end(key)
+    if entry is None:
+        return None
+    stored, block = entry
+    columns = list(columns)
+    if columns == stored:
+        return block
+    positions = [stored.index(col) for col in columns if col in stored]
+    if positions and len(positions) == len(columns) and positions == list(range(positions[0], positions[0] + len(positions))):
+        return block[:, positions[0]:positions[0] + len(positions)]
+    return None
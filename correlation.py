@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""Matris işlemleriyle korelasyon motoru.
+
+Üç yöntem de sütunlar arası tüm çiftleri tek seferde hesaplar; çift başına
+döngü yoktur. Eksik değerler çift bazında atlanır:
+
+- Pearson: moment biriktiricisinin ortak momentlerinden (bölüm 3 ve 7 ile
+  paylaşılan tek geçiş).
+- Spearman: sıralar üzerinde Pearson. Sütunlar eksik değer desenlerine
+  göre gruplanır; aynı desendeki sütun çiftleri tek bir sıralamayla,
+  desenleri farklı çiftler ise her sütunun tek sıralamasından ortak dolu
+  satırlara indirgenen sıralarla hesaplanır (pandas ve scipy ile aynı
+  sonuç).
+- Kendall τ-b: satır çiftlerinin işaret matrislerinin Gram çarpımlarıyla;
+  bağlar ve eksik değerler çift bazında paydaya yansır. Maliyet satır
+  sayısının karesiyle büyüdüğü için büyük veride sabit tohumlu bir örnek
+  üzerinde hesaplanır.
+
+p-değerleri tüm matris için vektörel hesaplanır (Pearson/Spearman için t
+testi, Kendall için normal yaklaşım). scipy, scikit-learn'ün bağımlılığı
+olarak zaten kuruludur; açılışı yavaşlatmamak için yalnızca p-değeri
+hesaplanırken içe aktarılır.
+
+En güçlü çiftler üst üçgenden np.argpartition ile seçilir; tam sıralama
+yapılmaz.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from accumulators import MomentAccumulator
+
+
+CORRELATION_METHODS = ["pearson", "spearman", "kendall"]
+# Kendall için kullanılan en fazla satır; maliyet satır² x sütun² ile büyür
+KENDALL_MAX_ROWS = 2000
+KENDALL_MAX_WORK = 4e10
+# Kendall'da bir seferde oluşturulan işaret matrisinin en fazla eleman sayısı
+KENDALL_CHUNK_ELEMENTS = 1 << 22
+# Isı haritasında gösterilen en fazla özellik; fazlası en güçlü bağlantılılarla sınırlanır
+HEATMAP_MAX_FEATURES = 40
+
+CorrelationResult = namedtuple("CorrelationResult", ["method", "matrix", "p_values", "n_obs", "sampled_rows"])
+
+
+def _frame(values, features):
+    return pd.DataFrame(values, index=features, columns=features)
+
+
+def _t_test_p_values(r, n):
+    """r katsayılarının iki yönlü p-değerleri, n-2 serbestlik dereceli t dağılımıyla"""
+    from scipy import special
+
+    dof = n - 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.abs(r) * np.sqrt(dof / np.maximum(1.0 - r ** 2, 0.0))
+        p = 2.0 * special.stdtr(np.where(dof > 0, dof, np.nan), -t)
+    return np.where(np.isnan(r) | (dof <= 0), np.nan, p)
+
+
+def _kendall_p_values(tau, n):
+    """τ katsayılarının iki yönlü p-değerleri, normal yaklaşımla.
+
+    Varyansta bağ düzeltmesi yapılmaz; bağ çok olan sütunlarda yaklaşıktır.
+    """
+    from scipy import special
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = 3.0 * tau * np.sqrt(n * (n - 1)) / np.sqrt(2.0 * (2.0 * n + 5.0))
+        p = special.erfc(np.abs(z) / np.sqrt(2.0))
+    return np.where(np.isnan(tau) | (n < 2), np.nan, p)
+
+
+def _blank_diagonal(p_values):
+    np.fill_diagonal(p_values, np.nan)
+    return p_values
+
+
+def rank_columns(values):
+    """Sütun başına ortalama sıralar; eksik değerler NaN kalır"""
+    return pd.DataFrame(values).rank(method="average").to_numpy(dtype=np.float64)
+
+
+def _missing_patterns(valid):
+    """Eksik değer desenlerine göre sütun grupları: [(dolu satır maskesi, sütunlar)]"""
+    patterns = {}
+    for column in range(valid.shape[1]):
+        mask = valid[:, column]
+        patterns.setdefault(np.packbits(mask).tobytes(), (mask, []))[1].append(column)
+    return list(patterns.values())
+
+
+def _rank_corr(values):
+    """Eksiksiz bir bloğun sıraları üzerinde Pearson matrisi"""
+    if not len(values):
+        return np.full((values.shape[1],) * 2, np.nan)
+    ranked = rank_columns(values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centered = ranked - ranked.mean(axis=0)
+        scale = np.sqrt((centered ** 2).sum(axis=0))
+        return np.clip((centered.T @ centered) / np.outer(scale, scale), -1.0, 1.0)
+
+
+def _sort_columns(values):
+    """Sütun başına (sütunlar x satırlar düzeninde) sıralama düzeni ve her
+    elemanın bağ grubunun sıralı düzendeki ilk ve son konumu; eksik değerler
+    sona düşer"""
+    columns = np.ascontiguousarray(values.T)
+    order = np.argsort(columns, axis=1, kind="stable")
+    sorted_values = np.take_along_axis(columns, order, axis=1)
+    positions = np.arange(columns.shape[1])
+    changed = sorted_values[:, 1:] != sorted_values[:, :-1]
+    edge = np.ones((len(columns), 1), dtype=bool)
+    starts = np.maximum.accumulate(np.where(np.hstack([edge, changed]), positions, 0), axis=1)
+    ends = np.where(np.hstack([changed, edge]), positions, columns.shape[1])
+    ends = np.minimum.accumulate(ends[:, ::-1], axis=1)[:, ::-1]
+    return order, starts, ends
+
+
+def _selected_ranks(order, starts, ends, selected):
+    """Sıralı düzende seçili satırların kendi aralarındaki ortalama sıraları,
+    özgün satır düzeninde (seçilmeyen satırların değeri anlamsızdır).
+
+    Diziler sütunlar x satırlar düzenindedir. Bir bağ grubunun sırası,
+    seçili satır sayısının grubun ilk konumundan önceki ve son konumuna
+    kadarki kümülatif değerlerinin ortalamasıdır; order/starts/ends tek
+    sütunsa selected'ın tüm sütunlarına yayılır.
+    """
+    counted = np.zeros((len(selected), selected.shape[1] + 1), dtype=np.int32)
+    np.cumsum(selected, axis=1, dtype=np.int32, out=counted[:, 1:])
+    lower = np.take_along_axis(counted, starts, axis=1)
+    upper = np.take_along_axis(counted, ends + 1, axis=1)
+    ranks = np.empty(selected.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, (lower + upper + 1) / 2.0, axis=1)
+    return ranks
+
+
+def _centered_corr(a, b, both, center):
+    """Satır satır eşleşen sıra vektörlerinin ortak dolu konumlardaki Pearson katsayısı"""
+    a = np.where(both, a - center[:, None], 0.0)
+    b = np.where(both, b - center[:, None], 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rho = (a * b).sum(axis=1) / np.sqrt((a * a).sum(axis=1) * (b * b).sum(axis=1))
+    return np.clip(rho, -1.0, 1.0)
+
+
+def spearman_rho(values):
+    """Çift bazında eksik değer atlayan Spearman ρ matrisi ve çift başına satır sayısı.
+
+    Her çift yalnızca iki sütunun da dolu olduğu satırlarda sıralanır.
+    Eksik değer deseni aynı olan sütunlar birlikte işlenir; eksik değersiz
+    veride tek bir sıralama yeterlidir. Desenleri farklı çiftler için her
+    sütun bir kez sıralanır; bir desenin dolu satırlarıyla sınırlı sıralar bu
+    tek sıralamadan kümülatif sayımla çıkarılır, desen çifti başına yeniden
+    sıralama yapılmaz.
+    """
+    valid = ~np.isnan(values)
+    counts = valid.T.astype(np.float64) @ valid.astype(np.float64)
+    r = np.full((values.shape[1],) * 2, np.nan)
+    patterns = _missing_patterns(valid)
+    for mask, columns in patterns:
+        r[np.ix_(columns, columns)] = _rank_corr(values[np.ix_(mask, columns)])
+    if len(patterns) == 1:
+        return r, counts
+
+    # Desen hesapları sütunlar x satırlar düzeninde yapılır (sütun başına bitişik)
+    valid = np.ascontiguousarray(valid.T)
+    masks = np.vstack([mask for mask, _ in patterns])
+    pattern_of = np.empty(values.shape[1], dtype=np.intp)
+    for i, (_, columns) in enumerate(patterns):
+        pattern_of[columns] = i
+    order, starts, ends = _sort_columns(values)
+    for i, (mask, columns) in enumerate(patterns[:-1]):
+        later = np.flatnonzero(pattern_of > i)
+        both = valid[np.ix_(later, mask)]
+        center = (counts[np.ix_(columns, later)] + 1.0) / 2.0
+        # Sonraki desenlerin sütunları bu desenin dolu satırlarıyla sınırlı sıralanır
+        selected = np.take_along_axis(valid[later] & mask, order[later], axis=1)
+        theirs = _selected_ranks(order[later], starts[later], ends[later], selected)[:, mask]
+        for k, column in enumerate(columns):
+            # Bu sütun sonraki her desenin dolu satırlarıyla sınırlı sıralanır
+            rows = order[column]
+            selected = masks[i + 1:, rows] & mask[rows]
+            ours = _selected_ranks(rows[None], starts[[column]], ends[[column]], selected)
+            ours = ours[pattern_of[later] - (i + 1)][:, mask]
+            r[column, later] = r[later, column] = _centered_corr(ours, theirs, both, center[k])
+    return r, counts
+
+
+def kendall_tau(values):
+    """Çift bazında eksik değer atlayan Kendall τ-b matrisi ve çift başına satır sayısı.
+
+    S_j, j sütununda satır çiftlerinin işaret matrisi ve V_j her iki satırın
+    da dolu olduğu çiftlerin göstergesi olmak üzere:
+    τ(a, b) = <S_a, S_b> / sqrt(<S_a², V_b> <V_a, S_b²>).
+    Bağlı çiftlerin işareti 0 olduğundan bu τ-b'dir.
+    """
+    m, p = values.shape
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    numerator = np.zeros((p, p))
+    ties = np.zeros((p, p))
+    chunk = max(1, KENDALL_CHUNK_ELEMENTS // max(m * p, 1))
+    for start in range(0, m, chunk):
+        stop = min(start + chunk, m)
+        signs = np.sign(filled[start:stop, None, :] - filled[None, :, :]).astype(np.float32)
+        both = (valid[start:stop, None, :] & valid[None, :, :]).astype(np.float32)
+        signs *= both
+        signs, both = signs.reshape(-1, p), both.reshape(-1, p)
+        numerator += signs.T @ signs
+        ties += (signs * signs).T @ both
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tau = np.clip(numerator / np.sqrt(ties * ties.T), -1.0, 1.0)
+    counts = valid.T.astype(np.float64) @ valid.astype(np.float64)
+    return tau, counts
+
+
+def kendall_rows(n_rows, n_features):
+    """Kendall için kullanılacak satır sayısı: satır² x sütun² iş bütçesine sığan en fazla satır"""
+    budget = int(np.sqrt(KENDALL_MAX_WORK) / max(n_features, 1))
+    return min(n_rows, KENDALL_MAX_ROWS, max(budget, 2))
+
+
+def correlation(values, features, method="pearson", moments=None, seed=0):
+    """Korelasyon, p-değeri ve çift başına gözlem sayısı matrisleri.
+
+    values satırlar x özellikler float64 bloğudur. Pearson için önceden
+    hesaplanmış moment biriktiricisi verilirse veri yeniden taranmaz
+    (values None olabilir).
+    sampled_rows, Kendall örneklendiyse kullanılan satır sayısıdır, aksi
+    halde None.
+    """
+    features = list(features)
+    sampled_rows = None
+    if method == "pearson":
+        if moments is None:
+            moments = MomentAccumulator(features).update(values)
+        r, n = moments.corr().to_numpy(), moments.n
+        p_values = _t_test_p_values(r, n)
+    elif method == "spearman":
+        r, n = spearman_rho(np.asarray(values, dtype=np.float64))
+        p_values = _t_test_p_values(r, n)
+    elif method == "kendall":
+        n_rows = kendall_rows(len(values), len(features))
+        if n_rows < len(values):
+            rows = np.sort(np.random.default_rng(seed).choice(len(values), n_rows, replace=False))
+            values, sampled_rows = values[rows], n_rows
+        r, n = kendall_tau(np.asarray(values, dtype=np.float64))
+        np.fill_diagonal(r, np.where(np.isnan(np.diag(r)), np.nan, 1.0))
+        p_values = _kendall_p_values(r, n)
+    else:
+        raise ValueError(f"Bilinmeyen korelasyon yöntemi: {method}")
+
+    return CorrelationResult(
+        method,
+        _frame(r, features),
+        _frame(_blank_diagonal(np.array(p_values, dtype=np.float64)), features),
+        _frame(np.asarray(n, dtype=np.int64), features),
+        sampled_rows,
+    )
+
+
+def top_pairs(result, k=10):
+    """Mutlak değerce en güçlü k özellik çifti (her çift bir kez), güçlüden zayıfa.
+
+    Yalnızca üst üçgen değerlendirilir; k aday np.argpartition ile seçilip
+    yalnızca kendi aralarında sıralanır. Tam (±1) korelasyonlar da dahildir.
+    """
+    features = result.matrix.columns
+    upper = np.triu_indices(len(features), k=1)
+    r = result.matrix.to_numpy()[upper]
+    strength = np.nan_to_num(np.abs(r), nan=-1.0)
+    k = min(k, int((strength >= 0).sum()))
+    if k == 0:
+        return pd.DataFrame(columns=["Özellik 1", "Özellik 2", "Korelasyon", "p-değeri", "n"])
+    candidates = np.argpartition(-strength, k - 1)[:k]
+    chosen = candidates[np.argsort(-strength[candidates], kind="stable")]
+    first, second = upper[0][chosen], upper[1][chosen]
+    return pd.DataFrame({
+        "Özellik 1": features[first],
+        "Özellik 2": features[second],
+        "Korelasyon": r[chosen],
+        "p-değeri": result.p_values.to_numpy()[first, second],
+        "n": result.n_obs.to_numpy()[first, second],
+    })
+
+
+def heatmap_matrix(matrix, max_features=HEATMAP_MAX_FEATURES):
+    """Isı haritasında gösterilecek matris.
+
+    Özellik sayısı sınırı aşmıyorsa matris olduğu gibi döner. Aşıyorsa en
+    güçlü korelasyona sahip max_features özellik seçilir ve benzer
+    özellikler yan yana gelecek şekilde 1 - |r| uzaklığıyla hiyerarşik
+    kümeleme (ortalama bağlantı) sırasına dizilir.
+    """
+    if len(matrix) <= max_features:
+        return matrix
+    from scipy.cluster import hierarchy
+    from scipy.spatial.distance import squareform
+
+    strength = np.abs(np.nan_to_num(matrix.to_numpy(), nan=0.0))
+    np.fill_diagonal(strength, 0.0)
+    keep = np.sort(np.argpartition(-strength.max(axis=0), max_features - 1)[:max_features])
+    sub = strength[np.ix_(keep, keep)]
+    distance = 1.0 - sub
+    np.fill_diagonal(distance, 0.0)
+    order = hierarchy.leaves_list(hierarchy.linkage(squareform(distance, checks=False), method="average"))
+    labels = matrix.columns[keep[order]]
+    return matrix.loc[labels, labels]
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Yerel öncelikli, parmak izli veri seti yükleyici.
+
+Önce yerel CSV okunur; ağ yalnızca yerel dosya yoksa (kısa bir zaman aşımıyla)
+denenir. Okunan veri en küçük güvenli veri tiplerine çevrilir; sonuç, içerik
+hash'i ile adlandırılmış bellek eşlemli bir sütun deposu (column_store.py)
+olarak .cache/ altına yazılır ve kaynak değişene kadar bu depo kullanılır.
+"""
+
+import hashlib
+import io
+import json
+import os
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import column_store
+
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_CSV = BASE_DIR / "endangered_animals.csv"
+DEFAULT_URL = "https://raw.githubusercontent.com/iremkay/veri-analizi-projesi/main/endangered_animals.csv"
+CACHE_DIR = BASE_DIR / ".cache"
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+
+# Şema değiştiğinde eski önbellek dosyalarının kullanılmaması için artırılır
+SCHEMA_VERSION = 2
+
+# Bilinen sütunlar için açık veri tipleri
+COLUMN_DTYPES = {
+    "animal_name": "string",
+    "scientific_name": "string",
+    "conservation_status": "category",
+    "population": "float64",
+    "habitat": "category",
+    "continent": "category",
+    "threat_level": "int8",
+    "body_weight_kg": "float64",
+    "lifespan_years": "int16",
+    "diet_type": "category",
+}
+
+# Veri setinde bilinmeyen popülasyonlar "Unknown" olarak yazılmıştır
+NA_VALUES = ["Unknown"]
+
+# Benzersiz değer oranı bunun altındaki metin sütunları kategoriye çevrilir
+CATEGORY_MAX_RATIO = 0.5
+
+REMOTE_TIMEOUT_SECONDS = 5
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def _file_hash(path):
+    """Dosya içeriğinin SHA-1 özetini parça parça hesaplar"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest):
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except OSError:
+        pass
+
+
+def source_signature(path=DEFAULT_CSV):
+    """Dosyanın ucuz imzası (mtime, boyut); dosya yoksa None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_fingerprint(path):
+    """Dosyanın içerik parmak izi.
+
+    mtime ve boyut manifest'teki kayıtla aynıysa hash yeniden hesaplanmaz.
+    """
+    path = Path(path).resolve()
+    signature = source_signature(path)
+    manifest = _read_manifest()
+    entry = manifest.get(str(path))
+
+    if entry and (entry["mtime_ns"], entry["size"]) == signature:
+        return entry["sha1"]
+
+    sha1 = _file_hash(path)
+    manifest[str(path)] = {"mtime_ns": signature[0], "size": signature[1], "sha1": sha1}
+    _write_manifest(manifest)
+    return sha1
+
+
+def read_csv_typed(source):
+    """CSV'yi bilinen sütunlar için açık veri tipleriyle okur"""
+    columns = pd.read_csv(source, nrows=0).columns
+    if hasattr(source, "seek"):
+        source.seek(0)
+    dtypes = {col: dtype for col, dtype in COLUMN_DTYPES.items() if col in columns}
+
+    try:
+        return pd.read_csv(source, dtype=dtypes, na_values=NA_VALUES)
+    except ValueError:
+        # Tamsayı sütunlarında eksik değer varsa küçük tamsayı tipine çevrilemez
+        if hasattr(source, "seek"):
+            source.seek(0)
+        dtypes = {col: dtype for col, dtype in dtypes.items() if not dtype.startswith("int")}
+        return pd.read_csv(source, dtype=dtypes, na_values=NA_VALUES)
+
+
+def _downcast_float(series):
+    """Float sütunu, değer kaybı olmuyorsa float32'ye indirir"""
+    narrow = series.astype("float32")
+    values, restored = series.to_numpy(), narrow.to_numpy(dtype="float64")
+    if np.array_equal(values, restored, equal_nan=True):
+        return narrow
+    return series
+
+
+def optimize_dtypes(df, category_max_ratio=CATEGORY_MAX_RATIO):
+    """Sütunları güvenli en küçük veri tiplerine çevirir.
+
+    - Az sayıda farklı değeri olan metin sütunları "category" olur; sayım ve
+      benzersiz değer hesapları Python dizeleri yerine tamsayı kodlar üzerinde
+      yapılır. Diğer metin sütunları pyarrow destekli "string" olur.
+    - Tamsayılar değer aralığına sığan en küçük işaretli tamsayıya, float'lar
+      yalnızca hiçbir değer değişmiyorsa float32'ye indirilir.
+    """
+    optimized = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            optimized[col] = series.cat.remove_unused_categories()
+        elif pd.api.types.is_string_dtype(series.dtype) or series.dtype == object:
+            n_unique = series.nunique()
+            if len(series) > 0 and n_unique <= category_max_ratio * len(series):
+                optimized[col] = series.astype("category")
+            else:
+                optimized[col] = series.astype(pd.StringDtype("pyarrow"))
+        elif pd.api.types.is_bool_dtype(series.dtype):
+            optimized[col] = series
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            optimized[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series.dtype):
+            optimized[col] = _downcast_float(series)
+        else:
+            optimized[col] = series
+    return pd.DataFrame(optimized, index=df.index)
+
+
+def iter_csv_chunks(path, chunksize):
+    """CSV'yi bilinen veri tipleriyle parça parça okur.
+
+    Tamsayı tipleri parçalar arasında eksik değer yüzünden değişebileceği için
+    parçalı okumada zorlanmaz.
+    """
+    columns = pd.read_csv(path, nrows=0).columns
+    dtypes = {
+        col: dtype for col, dtype in COLUMN_DTYPES.items()
+        if col in columns and not dtype.startswith("int")
+    }
+    return pd.read_csv(path, dtype=dtypes, na_values=NA_VALUES, chunksize=chunksize)
+
+
+def _cache_name(fingerprint):
+    return f"{fingerprint}-v{SCHEMA_VERSION}"
+
+
+def load_mapped(df, directory, fingerprint):
+    """Veri setini sütun deposuna yazıp bellek eşlemiyle yeniden açar.
+
+    Depo yazılamazsa bellekteki veri seti olduğu gibi döner.
+    """
+    try:
+        column_store.write(df, directory, _cache_name(fingerprint))
+        return column_store.open_mapped(directory, _cache_name(fingerprint), fingerprint)
+    except (OSError, ValueError, ImportError):
+        # Depo en iyi çaba ile tutulur; yazılamazsa bellekteki kopya kullanılır
+        return df
+
+
+def open_cached(directory, fingerprint):
+    """Depoda varsa veri setini bellek eşlemiyle açar; yoksa None"""
+    if not column_store.exists(directory, _cache_name(fingerprint)):
+        return None
+    try:
+        return column_store.open_mapped(directory, _cache_name(fingerprint), fingerprint)
+    except (OSError, ValueError, ImportError):
+        return None
+
+
+def load_dataset(path=DEFAULT_CSV, url=DEFAULT_URL):
+    """Veri setini yükler; (DataFrame, parmak izi) döndürür.
+
+    Yerel dosya yoksa uzak adres denenir, o da olmazsa hata fırlatılır.
+    """
+    if source_signature(path) is None:
+        with urllib.request.urlopen(url, timeout=REMOTE_TIMEOUT_SECONDS) as response:
+            raw = response.read()
+        df = optimize_dtypes(read_csv_typed(io.BytesIO(raw)))
+        return df, hashlib.sha1(raw).hexdigest()
+
+    fingerprint = file_fingerprint(path)
+    cached = open_cached(CACHE_DIR, fingerprint)
+    if cached is not None:
+        return cached, fingerprint
+
+    df = optimize_dtypes(read_csv_typed(path))
+    return load_mapped(df, CACHE_DIR, fingerprint), fingerprint
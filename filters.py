@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""İndeks destekli satır filtreleme.
+
+Veri seti bir kez indekslenir:
+
+- Kategorik sütunlarda her kategori için satırların bit eşlemi (bitmap)
+  tutulur; bitler np.packbits ile sıkıştırıldığından bir milyon satırlık bir
+  eşlem 125 KB yer kaplar ve birleşim/kesişim işlemleri bayt düzeyinde yapılır.
+- Sayısal sütunlarda değerlere göre sıralanmış satır numaraları tutulur ve
+  sıralı dizi en fazla RANGE_BUCKETS kovaya (eşit değerler bölünmeden)
+  ayrılır. Her kova sınırı için "sınırdan önceki satırlar" eşlemi saklanır;
+  bir aralık sorgusu iki ikili arama (searchsorted) ve iki eşlem işlemiyle
+  çözülür, yalnızca kova sınırına denk gelmeyen uçlardaki satırlar tek tek
+  işaretlenir. Kenar çubuğundaki kaydırıcılar kova sınırlarında durduğu için
+  arayüzden gelen sorgularda bu uçlar ya boştur ya da tek bir değerden oluşur.
+
+Bir filtre kombinasyonu, seçilen kategorilerin eşlemlerinin OR'u ve sütunlar
+arasında AND ile tek bir bit eşlemine indirgenir. Filtre uygulanmayan
+sütunlar hiç işlenmez.
+
+Kenar çubuğundaki seçenekler (kategoriler ve kaydırıcı durakları) bit
+eşlemleri kurulmadan FilterOptions ile çıkarılır; indeks ancak ilk filtre
+seçildiğinde kurulur.
+"""
+
+import functools
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+
+# Kenar çubuğunda filtrelenebilen sütunlar
+CATEGORY_FILTER_COLUMNS = ["conservation_status", "continent", "habitat", "diet_type"]
+RANGE_FILTER_COLUMNS = ["population", "threat_level", "body_weight_kg", "lifespan_years"]
+# Sayısal sütun başına en fazla kova sayısı; bellek sütun başına ~RANGE_BUCKETS * n / 8 bayt
+RANGE_BUCKETS = 64
+
+
+def _category_codes(values):
+    """Kategori kodları ve kategoriler (eksik değer -1)"""
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype("category")
+    return values.cat.codes.to_numpy(), values.cat.categories
+
+
+def _range_values(values):
+    """Aralık filtresi için float64 değerler; NaN'lar aralıklara girmez"""
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _bucket_boundaries(sorted_values):
+    """Sıralı dizide kova sınırları (eşit değerler bölünmez); son eleman dolu
+    değer sayısıdır"""
+    n_valid = int(np.count_nonzero(~np.isnan(sorted_values)))
+    valid = sorted_values[:n_valid]
+
+    # Her farklı değerin sıralı dizideki ilk konumu
+    run_starts = np.flatnonzero(np.r_[True, valid[1:] != valid[:-1]]) if n_valid else np.empty(0, dtype=np.intp)
+    if len(run_starts) > RANGE_BUCKETS:
+        targets = np.linspace(0, n_valid, RANGE_BUCKETS, endpoint=False).astype(np.intp)
+        run_starts = np.unique(run_starts[np.searchsorted(run_starts, targets, side="right") - 1])
+    return np.r_[run_starts, n_valid].astype(np.intp)
+
+
+def _slider_options(sorted_values, boundaries):
+    """Kaydırıcı için seçenekler: kova başlangıç değerleri ve en büyük değer"""
+    if boundaries[-1] == 0:
+        return []
+    options = sorted_values[boundaries[:-1]].tolist()
+    maximum = sorted_values[boundaries[-1] - 1]
+    if maximum != options[-1]:
+        options.append(maximum)
+    return options
+
+
+class FilterOptions:
+    """Kenar çubuğu filtrelerinin seçenekleri; RowIndex ile aynı kategorileri
+    ve kova duraklarını verir, ama bit eşlemi ve sıralı satır numarası tutmaz"""
+
+    def __init__(self, df, category_columns=CATEGORY_FILTER_COLUMNS, range_columns=RANGE_FILTER_COLUMNS):
+        self._categories = {}
+        self._ranges = {}
+        for col in category_columns:
+            if col not in df.columns:
+                continue
+            codes, categories = _category_codes(df[col])
+            present = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+            self._categories[col] = list(categories[present])
+
+        for col in range_columns:
+            if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            values = np.sort(_range_values(df[col]))
+            self._ranges[col] = _slider_options(values, _bucket_boundaries(values))
+
+    def categories(self, column):
+        """Sütunda en az bir satırda görülen kategoriler"""
+        return self._categories.get(column, [])
+
+    def range_options(self, column):
+        """Kaydırıcı seçenekleri; sütun filtrelenemiyorsa boş liste"""
+        return self._ranges.get(column, [])
+
+
+class RowIndex:
+    """Kategori bit eşlemleri ve sıralı sayısal indekslerle satır filtresi"""
+
+    def __init__(self, df, category_columns=CATEGORY_FILTER_COLUMNS, range_columns=RANGE_FILTER_COLUMNS):
+        self.n_rows = len(df)
+        self.bitmaps = {}
+        self.sorted_rows = {}
+        self.sorted_values = {}
+        self.boundaries = {}
+        self.prefix_bitmaps = {}
+
+        for col in category_columns:
+            if col not in df.columns:
+                continue
+            codes, categories = _category_codes(df[col])
+            self.bitmaps[col] = {}
+            for code, category in enumerate(categories):
+                rows = codes == code
+                if rows.any():
+                    self.bitmaps[col][category] = np.packbits(rows)
+
+        for col in range_columns:
+            if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            values = _range_values(df[col])
+            # NaN değerler sıralamanın sonuna düşer ve hiçbir aralığa girmez
+            order = np.argsort(values, kind="stable")
+            self.sorted_rows[col] = order
+            self.sorted_values[col] = values[order]
+            self._build_buckets(col)
+
+    def _build_buckets(self, column):
+        order = self.sorted_rows[column]
+        boundaries = _bucket_boundaries(self.sorted_values[column])
+
+        mask = np.zeros(self.n_rows, dtype=bool)
+        prefix = [np.packbits(mask)]
+        for previous, boundary in zip(boundaries[:-1], boundaries[1:]):
+            mask[order[previous:boundary]] = True
+            prefix.append(np.packbits(mask))
+        self.boundaries[column] = boundaries
+        # prefix[j]: sıralı konumu boundaries[j]'den küçük olan satırlar
+        self.prefix_bitmaps[column] = prefix
+
+    def categories(self, column):
+        """Sütunda en az bir satırda görülen kategoriler"""
+        return list(self.bitmaps.get(column, {}))
+
+    def range_options(self, column):
+        """Kaydırıcı için seçenekler: kova başlangıç değerleri ve en büyük değer"""
+        return _slider_options(self.sorted_values[column], self.boundaries[column])
+
+    def category_bitmap(self, column, categories):
+        """Seçilen kategorilerden herhangi birine sahip satırların eşlemi"""
+        bitmaps = self.bitmaps[column]
+        selected = [bitmaps[category] for category in categories if category in bitmaps]
+        if not selected:
+            return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        return functools.reduce(np.bitwise_or, selected)
+
+    def range_bitmap(self, column, low, high):
+        """low <= değer <= high olan satırların eşlemi"""
+        values, order = self.sorted_values[column], self.sorted_rows[column]
+        boundaries, prefix = self.boundaries[column], self.prefix_bitmaps[column]
+        start = np.searchsorted(values, low, side="left")
+        stop = np.searchsorted(values, high, side="right")
+
+        # Aralığın tamamen kapsadığı kovalar iki önek eşleminin farkıdır
+        first = np.searchsorted(boundaries, start, side="left")
+        last = np.searchsorted(boundaries, stop, side="right") - 1
+        if first <= last:
+            bitmap = prefix[last] & ~prefix[first]
+            edges = np.r_[order[start:boundaries[first]], order[boundaries[last]:stop]]
+        else:
+            bitmap = np.zeros_like(prefix[0])
+            edges = order[start:stop]
+
+        if len(edges):
+            np.bitwise_or.at(bitmap, edges >> 3, (128 >> (edges & 7)).astype(np.uint8))
+        return bitmap
+
+    def resolve(self, selection):
+        """Filtre seçimini satır eşlemine çevirir; seçim boşsa None döndürür"""
+        bitmap = None
+        for column, categories in selection.categories.items():
+            part = self.category_bitmap(column, categories)
+            bitmap = part if bitmap is None else bitmap & part
+        for column, (low, high) in selection.ranges.items():
+            part = self.range_bitmap(column, low, high)
+            bitmap = part if bitmap is None else bitmap & part
+        return bitmap
+
+    def positions(self, selection):
+        """Filtreye uyan satırların konumları; seçim boşsa None (tüm satırlar)"""
+        bitmap = self.resolve(selection)
+        if bitmap is None:
+            return None
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.n_rows))
+
+
+class FilterSelection:
+    """Etkin filtreler: sütun -> seçilen kategoriler ve sütun -> (alt, üst)"""
+
+    def __init__(self, categories=None, ranges=None):
+        self.categories = {col: list(values) for col, values in (categories or {}).items()}
+        self.ranges = {col: (float(low), float(high)) for col, (low, high) in (ranges or {}).items()}
+
+    def __bool__(self):
+        return bool(self.categories or self.ranges)
+
+    def key(self):
+        """Seçimin kararlı özeti; önbellek anahtarlarında kullanılır"""
+        payload = json.dumps(
+            {"categories": {col: sorted(map(str, values)) for col, values in sorted(self.categories.items())},
+             "ranges": dict(sorted(self.ranges.items()))},
+            sort_keys=True
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def apply_filters(df, row_index, selection):
+    """Seçime uyan satırları döndürür; seçim boşsa df'nin kendisi döner"""
+    positions = row_index.positions(selection)
+    if positions is None:
+        return df
+    return df.take(positions)
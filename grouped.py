@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Kategorik bir sütuna göre gruplanmış analizler.
+
+Satırlar grup koduna göre bir kez (kararlı) sıralanır; her grup sıralı
+matriste bitişik bir dilim olur. Filtrelenmiş alt tablolar oluşturulmadan:
+
+- describe() biçimindeki istatistikler ve Pearson korelasyonları her dilim
+  üzerinde tek bir moment biriktiricisiyle,
+- kantiller her dilimin yerinde sıralanması ve tüm gruplar için tek seferde
+  vektörel doğrusal enterpolasyonla,
+- IQR aykırı değer sayıları grup sınırlarının satırlara yayınlanması
+  (broadcast) ve np.add.reduceat ile
+
+hesaplanır. Grup başına PCA isteğe bağlı olarak bir süreç havuzunda
+paralel çalıştırılır.
+"""
+
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from accumulators import MomentAccumulator
+
+
+# Gruplanabilen kategorik sütunlar
+GROUP_COLUMNS = ["conservation_status", "continent", "diet_type"]
+DESCRIBE_QUANTILES = [0.25, 0.5, 0.75]
+# PCA için bir grupta gereken en az eksiksiz satır sayısı
+GROUP_PCA_MIN_ROWS = 3
+# Süreç havuzuna bir seferde gönderilen grup sayısı
+GROUP_PCA_CHUNKSIZE = 16
+
+GroupedStats = namedtuple("GroupedStats", ["sizes", "describe", "correlation", "outliers"])
+
+
+def _group_layout(df, by, features):
+    """(grup etiketleri, grup sınırları, grup sırasına dizilmiş değerler, satırların grup numaraları)
+
+    Grup sütunu eksik olan satırlar, groupby'da olduğu gibi dışarıda kalır.
+    """
+    codes, labels = pd.factorize(df[by], sort=True, use_na_sentinel=True)
+    sizes = np.bincount(codes[codes >= 0], minlength=len(labels))
+    observed = np.flatnonzero(sizes)
+    # Görülmeyen kategorileri at ve kodları 0..G-1 aralığına sıkıştır
+    remap = np.full(len(labels) + 1, -1, dtype=np.int64)
+    remap[observed] = np.arange(len(observed))
+    group_ids = remap[codes]
+
+    valid = np.flatnonzero(group_ids >= 0)
+    # Küçük tamsayı anahtarlarda kararlı sıralama radix sıralamasıdır
+    sort_keys = group_ids[valid].astype(np.uint16 if len(observed) <= 2 ** 16 else np.int64)
+    order = valid[np.argsort(sort_keys, kind="stable")]
+
+    groups = pd.Index(np.asarray(labels)[observed], name=by)
+    bounds = np.r_[0, np.cumsum(sizes[observed])]
+    values = df[features].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+    return groups, bounds, values, group_ids[order]
+
+
+def _segment_quantiles(values, bounds, quantiles):
+    """Her grup ve sütun için kantiller; dizi (q, G, p).
+
+    Gruplar zaten bitişik dilimler olduğundan her dilim kendi içinde
+    sıralanır (NaN'lar dilimin sonuna düşer); kantiller tüm gruplar için
+    tek seferde, numpy'nin "linear" yöntemiyle aynı konumlardan okunur.
+    """
+    n_groups, p = len(bounds) - 1, values.shape[1]
+    result = np.full((len(quantiles), n_groups, p), np.nan)
+    if len(values) == 0:
+        return result
+    # Sütun başına bitişik bellek: her dilim sıralaması önbellek dostu olur
+    ordered = np.ascontiguousarray(values.T)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        ordered[:, start:stop].sort(axis=1)
+
+    starts = bounds[:-1]
+    valid = np.add.reduceat(~np.isnan(ordered), starts, axis=1)
+    for i, q in enumerate(quantiles):
+        position = starts + q * (np.maximum(valid, 1) - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        low_values = np.take_along_axis(ordered, low, axis=1)
+        high_values = np.take_along_axis(ordered, high, axis=1)
+        estimate = low_values + (high_values - low_values) * (position - low)
+        result[i] = np.where(valid > 0, estimate, np.nan).T
+    return result
+
+
+def grouped_stats(df, by, features):
+    """Grup başına describe() istatistikleri, korelasyonlar ve IQR aykırı değer sayıları.
+
+    - describe: satırlar gruplar, sütunlar (özellik, istatistik)
+    - correlation: satırlar gruplar, sütunlar "a ~ b" özellik çiftleri
+    - outliers: satırlar gruplar, sütunlar (özellik, "Aykırı Değer Sayısı" / "Yüzde (%)")
+    """
+    features = list(features)
+    groups, bounds, values, group_ids = _group_layout(df, by, features)
+    sizes = pd.Series(np.diff(bounds), index=groups, name="Satır")
+
+    moments = [MomentAccumulator(features).update(values[start:stop])
+               for start, stop in zip(bounds[:-1], bounds[1:])]
+    quantile_values = _segment_quantiles(values, bounds, DESCRIBE_QUANTILES)
+
+    stat_columns = {
+        "count": np.array([m.count().to_numpy() for m in moments]),
+        "mean": np.array([m.means().to_numpy() for m in moments]),
+        "std": np.array([m.std().to_numpy() for m in moments]),
+        "min": np.array([m.minimum().to_numpy() for m in moments]),
+    }
+    for i, q in enumerate(DESCRIBE_QUANTILES):
+        stat_columns[f"{q * 100:g}%"] = quantile_values[i]
+    stat_columns["max"] = np.array([m.maximum().to_numpy() for m in moments])
+
+    stat_names = list(stat_columns)
+    stacked = np.stack([stat_columns[name].reshape(len(groups), len(features)) for name in stat_names], axis=2)
+    describe = pd.DataFrame(
+        stacked.reshape(len(groups), -1),
+        index=groups,
+        columns=pd.MultiIndex.from_product([features, stat_names], names=["Özellik", "İstatistik"])
+    )
+
+    pairs = [(a, b) for i, a in enumerate(features) for b in features[i + 1:]]
+    upper = np.triu_indices(len(features), k=1)
+    correlation = pd.DataFrame(
+        [m.corr().to_numpy()[upper] for m in moments] if pairs else np.empty((len(groups), 0)),
+        index=groups,
+        columns=[f"{a} ~ {b}" for a, b in pairs]
+    )
+
+    # Grup sınırları satırlara yayınlanır; sayım grup dilimleri üzerinde tek reduceat'tir
+    q1, q3 = quantile_values[DESCRIBE_QUANTILES.index(0.25)], quantile_values[DESCRIBE_QUANTILES.index(0.75)]
+    iqr = q3 - q1
+    lower, upper_bound = (q1 - 1.5 * iqr)[group_ids], (q3 + 1.5 * iqr)[group_ids]
+    is_outlier = (values < lower) | (values > upper_bound)
+    counts = np.add.reduceat(is_outlier, bounds[:-1], axis=0) if len(values) else np.zeros((0, len(features)))
+    percentages = (counts / sizes.to_numpy()[:, None] * 100).round(2)
+    outliers = pd.DataFrame(
+        {(feature, column): table[:, j]
+         for j, feature in enumerate(features)
+         for column, table in [("Aykırı Değer Sayısı", counts.astype(np.int64)), ("Yüzde (%)", percentages)]},
+        index=groups
+    )
+    outliers.columns.names = ["Özellik", None]
+
+    return GroupedStats(sizes, describe, correlation, outliers)
+
+
+def _group_pca(values):
+    """Tek bir grubun kendi standartlaştırmasıyla iki bileşenli PCA'sı.
+
+    (satır sayısı, açıklanan varyans oranları, PC1 yükleri) döndürür; süreç
+    havuzunda çalıştığı için modül düzeyindedir.
+    """
+    complete = values[~np.isnan(values).any(axis=1)]
+    if len(complete) < GROUP_PCA_MIN_ROWS:
+        return len(complete), None, None
+    scales = complete.std(axis=0)
+    standardized = (complete - complete.mean(axis=0)) / np.where(scales > 0, scales, 1.0)
+    _, singular_values, components = np.linalg.svd(standardized, full_matrices=False)
+    variance = singular_values ** 2
+    if variance.sum() == 0:
+        return len(complete), None, None
+    ratios = np.zeros(2)
+    ratios[:min(2, len(variance))] = (variance / variance.sum())[:2]
+    # sklearn ile aynı işaret kuralı: mutlak değerce en büyük yük pozitif
+    loadings = components[0] * np.sign(components[0][np.argmax(np.abs(components[0]))])
+    return len(complete), ratios, loadings
+
+
+def _map_group_pca(blocks, workers):
+    if workers == 1 or len(blocks) < 2:
+        return [_group_pca(block) for block in blocks]
+    try:
+        # Streamlit sunucusu çok iş parçacıklı olduğundan fork yerine spawn kullanılır
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(_group_pca, blocks, chunksize=GROUP_PCA_CHUNKSIZE))
+    except (BrokenProcessPool, OSError):
+        # Süreç açılamayan ortamlarda (ör. kısıtlı sunucular) sırayla çalışılır
+        return [_group_pca(block) for block in blocks]
+
+
+def grouped_pca(df, by, features, workers=1):
+    """Her grup için iki bileşenli PCA özeti.
+
+    workers 1 ise gruplar sırayla, aksi halde bir süreç havuzunda paralel
+    işlenir (None: işlemci sayısı kadar süreç). Eksiksiz satırı
+    GROUP_PCA_MIN_ROWS'tan az olan gruplarda değerler boş kalır.
+    """
+    features = list(features)
+    groups, bounds, values, _ = _group_layout(df, by, features)
+    blocks = [values[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    results = _map_group_pca(blocks, workers)
+
+    rows = []
+    for n_complete, ratios, loadings in results:
+        if ratios is None:
+            rows.append({"Eksiksiz Satır": n_complete, "PC1 (%)": np.nan, "PC2 (%)": np.nan,
+                         "Toplam (%)": np.nan, "PC1 Baskın Özellik": None})
+        else:
+            rows.append({
+                "Eksiksiz Satır": n_complete,
+                "PC1 (%)": round(ratios[0] * 100, 2),
+                "PC2 (%)": round(ratios[1] * 100, 2),
+                "Toplam (%)": round(ratios.sum() * 100, 2),
+                "PC1 Baskın Özellik": features[int(np.argmax(np.abs(loadings)))],
+            })
+    return pd.DataFrame(rows, index=groups)
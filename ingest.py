@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Kullanıcı veri seti yükleme: arka planda okuma ve içerik adresli depo.
+
+Yüklenen dosyanın biçimi ilk baytlarından anlaşılır: CSV (düz, gzip ya da
+zstd sıkıştırılmış), Parquet ve Arrow IPC (dosya ya da akış). Okuma bir arka
+plan iş parçacığında pyarrow'un çok iş parçacıklı okuyucularıyla parça
+parça yapılır; ilerleme oranı ve o ana kadar okunan satırlar okuma sürerken
+sorgulanabilir.
+
+Okunan veri seti tip optimizasyonundan sonra içeriğin SHA-1 özetiyle
+adlandırılmış bellek eşlemli bir sütun deposu olarak .cache/uploads/
+altına yazılır.
+Aynı dosya yeniden yüklendiğinde (başka bir oturumdan da olsa) okuma
+yapılmaz; aynı anda aynı dosyayı yükleyen oturumlar tek bir işi paylaşır.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+import data_loader
+
+
+UPLOAD_DIR = data_loader.CACHE_DIR / "uploads"
+# file_uploader'ın kabul ettiği uzantılar
+UPLOAD_TYPES = ["csv", "gz", "zst", "zstd", "parquet", "pq", "arrow", "feather", "ipc"]
+# CSV akış okuyucusunun bir seferde ayrıştırdığı blok boyutu
+CSV_BLOCK_SIZE = 4 << 20
+# pyarrow'un varsayılan eksik değer işaretlerine veri setine özgü olanlar eklenir
+NULL_VALUES = ["", "NA", "N/A", "NaN", "nan", "null", "NULL", "None", *data_loader.NA_VALUES]
+# Bellekte tutulan tamamlanmış yükleme sayısı; fazlası depodan yeniden açılır
+MAX_JOBS_IN_MEMORY = 4
+
+_MAGIC = [
+    (b"PAR1", "parquet"),
+    (b"ARROW1", "arrow_file"),
+    (b"\xff\xff\xff\xff", "arrow_stream"),
+    (b"\x1f\x8b", "csv_gzip"),
+    (b"\x28\xb5\x2f\xfd", "csv_zstd"),
+]
+
+
+def content_hash(data):
+    """Yüklenen baytların SHA-1 özeti; depo anahtarı ve parmak izi olarak kullanılır"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def detect_format(data):
+    """Dosya biçimi, sihirli baytlara göre; tanınmayanlar düz CSV sayılır"""
+    for magic, fmt in _MAGIC:
+        if data[:len(magic)] == magic:
+            return fmt
+    return "csv"
+
+
+def _iter_batches(data, fmt):
+    """(kayıt grubu, ilerleme oranı) çiftleri üretir"""
+    raw = pa.BufferReader(data)
+    if fmt == "parquet":
+        parquet = pq.ParquetFile(raw)
+        total, done = max(parquet.metadata.num_rows, 1), 0
+        for batch in parquet.iter_batches(use_threads=True):
+            done += batch.num_rows
+            yield batch, done / total
+    elif fmt == "arrow_file":
+        reader = pa.ipc.open_file(raw)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i), (i + 1) / reader.num_record_batches
+    elif fmt == "arrow_stream":
+        for batch in pa.ipc.open_stream(raw):
+            yield batch, raw.tell() / len(data)
+    else:
+        codec = {"csv_gzip": "gzip", "csv_zstd": "zstd"}.get(fmt)
+        stream = pa.CompressedInputStream(raw, codec) if codec else raw
+        reader = pacsv.open_csv(
+            stream,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(null_values=NULL_VALUES, strings_can_be_null=True),
+        )
+        # Sıkıştırılmış girdide ilerleme açıcının tükettiği ham bayt oranıdır.
+        # Düz girdide okuyucu tamponu kopyalamadan hemen sona atlar; her kayıt
+        # grubu yaklaşık bir blok olduğundan oran blok sayısından tahmin edilir.
+        for i, batch in enumerate(reader, start=1):
+            yield batch, raw.tell() / len(data) if codec else i * CSV_BLOCK_SIZE / len(data)
+
+
+def _read_csv_fallback(data, fmt):
+    """Akış okuyucusu ilk bloktan çıkardığı tiple sonraki blokları okuyamazsa
+    dosya pandas ile bir kerede okunur"""
+    codec = {"csv_gzip": "gzip", "csv_zstd": "zstd"}.get(fmt)
+    with pa.input_stream(pa.BufferReader(data), compression=codec) as stream:
+        # read_csv_typed başlığı okuduktan sonra başa döner; akış yerine bellek tamponu verilir
+        return data_loader.read_csv_typed(io.BytesIO(stream.read()))
+
+
+class IngestJob:
+    """Tek bir yüklemenin arka planda okunması"""
+
+    def __init__(self, digest, name, data):
+        self.digest = digest
+        self.name = name
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+        self._data = data
+        self._progress = 0.0
+        self._batches = []
+        self._lock = threading.Lock()
+
+    def run(self):
+        try:
+            self.result = self._load()
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            with self._lock:
+                self._progress = 1.0
+                self._batches = []
+            self._data = None
+            self.done.set()
+
+    def _load(self):
+        cached = data_loader.open_cached(UPLOAD_DIR, self.digest)
+        if cached is not None:
+            return cached
+
+        fmt = detect_format(self._data)
+        try:
+            for batch, progress in _iter_batches(self._data, fmt):
+                with self._lock:
+                    self._batches.append(batch)
+                    self._progress = min(progress, 0.99)
+            with self._lock:
+                batches = list(self._batches)
+            df = pa.Table.from_batches(batches).to_pandas() if batches else pd.DataFrame()
+        except pa.ArrowInvalid:
+            if not fmt.startswith("csv"):
+                raise
+            df = _read_csv_fallback(self._data, fmt)
+
+        return data_loader.load_mapped(data_loader.optimize_dtypes(df), UPLOAD_DIR, self.digest)
+
+    def status(self):
+        """(ilerleme oranı, o ana kadar okunan satır sayısı)"""
+        with self._lock:
+            return self._progress, sum(batch.num_rows for batch in self._batches)
+
+    def preview(self, n_rows):
+        """Okunmuş ilk n_rows satır; henüz satır yoksa None"""
+        with self._lock:
+            batches = list(self._batches)
+        if not batches:
+            return None
+        return pa.Table.from_batches(batches).slice(0, n_rows).to_pandas()
+
+
+_jobs = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def submit(digest, name, data):
+    """Yüklemeyi başlatır ya da aynı içerik için mevcut işi döndürür.
+
+    Okunamayan bir dosyanın işi de hatasıyla birlikte saklanır; aynı içerik
+    her yeniden çalıştırmada baştan ayrıştırılmaz (bkz. forget).
+    """
+    with _jobs_lock:
+        job = _jobs.get(digest)
+        if job is not None:
+            _jobs.move_to_end(digest)
+            return job
+
+        job = IngestJob(digest, name, data)
+        _jobs[digest] = job
+        # En eski tamamlanmış işler bellekten atılır; sonuçları diskte kalır
+        finished = [key for key, old in _jobs.items() if old.done.is_set() and key != digest]
+        for key in finished[:max(0, len(_jobs) - MAX_JOBS_IN_MEMORY)]:
+            del _jobs[key]
+
+    threading.Thread(target=job.run, name=f"ingest-{digest[:8]}", daemon=True).start()
+    return job
+
+
+def forget(digest):
+    """Dosya kaldırıldığında içeriğin başarısız işini bırakır; aynı dosya
+    yeniden yüklenirse yeniden okunur. Başarılı işler diğer oturumlarla
+    paylaşıldığı için bırakılmaz."""
+    with _jobs_lock:
+        job = _jobs.get(digest)
+        if job is not None and job.error is not None:
+            del _jobs[digest]
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""İsteğe bağlı (opt-in) çalışma zamanı ölçümü.
+
+Bir Streamlit yeniden çalıştırması boyunca bölümler ve ağır çağrılar
+(veri yükleme, önbellekli analiz sonuçları, grafik çizimleri) birer "aralık"
+(span) olarak kaydedilir. Her aralık için:
+
+- duvar saati süresi,
+- isteğe bağlı olarak tracemalloc ile ayrılan net bellek ve en yüksek bellek,
+- önbellekli çağrılarda isabet (hit) ya da ıskalama (miss)
+
+tutulur. Aralıklar iç içe olabilir; dış aralığın süresi iç aralıkları da
+kapsar.
+
+Ölçüm kapalıyken span() hiçbir şey kaydetmez. Etkin kayıt bir ContextVar'da
+tutulur; Streamlit her oturumun betiğini ayrı bir iş parçacığında
+çalıştırdığı için oturumların kayıtları birbirine karışmaz. tracemalloc ise
+süreç geneldir: aynı anda çalışan diğer oturumların ve çizim havuzunun
+ayırdığı bellek de sayılara yansıyabilir.
+
+Tamamlanan her çalıştırma JSON satırı olarak, süreç genelindeki toplamlar
+Prometheus metin biçiminde dışa aktarılabilir. Ortam değişkenleri:
+
+- VERI_ANALIZI_PROFILE=1: ölçüm tüm oturumlarda varsayılan olarak açık
+- VERI_ANALIZI_PROFILE_MEMORY=1: tracemalloc varsayılan olarak açık
+- VERI_ANALIZI_METRICS_JSONL: her çalıştırmanın ekleneceği JSON satırları dosyası
+- VERI_ANALIZI_METRICS_PROM: her çalıştırmadan sonra yeniden yazılan
+  Prometheus metin dosyası (node_exporter textfile collector için)
+
+Dışa aktarma dosyalarından biri verilmişse tüm çalıştırmalar ölçülür.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+METRICS_JSONL = os.environ.get("VERI_ANALIZI_METRICS_JSONL") or None
+METRICS_PROM = os.environ.get("VERI_ANALIZI_METRICS_PROM") or None
+PROFILE_DEFAULT = os.environ.get("VERI_ANALIZI_PROFILE", "0") != "0" or bool(METRICS_JSONL or METRICS_PROM)
+PROFILE_MEMORY_DEFAULT = os.environ.get("VERI_ANALIZI_PROFILE_MEMORY", "0") != "0"
+
+METRIC_PREFIX = "veri_analizi"
+# Yeniden çalıştırma süresi histogramının üst sınırları (saniye)
+RERUN_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# ResultStore.stats() içinde yalnızca artan sayaçlar
+RESULT_STORE_COUNTERS = ("hits", "misses", "waits", "evictions")
+
+SpanRecord = namedtuple("SpanRecord", ["name", "kind", "depth", "seconds", "allocated_bytes", "peak_bytes", "cache"])
+
+
+class _OpenSpan:
+    """Sürmekte olan bir aralık"""
+
+    __slots__ = ("index", "name", "kind", "depth", "started", "memory_start", "memory_peak", "computed")
+
+    def __init__(self, index, name, kind, depth):
+        self.index = index
+        self.name = name
+        self.kind = kind
+        self.depth = depth
+        self.started = time.perf_counter()
+        self.memory_start = None
+        self.memory_peak = 0
+        self.computed = False
+
+
+class RunRecorder:
+    """Tek bir yeniden çalıştırmanın aralıklarını toplar"""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.run_id = uuid.uuid4().hex[:12]
+        self.timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        self.started = time.perf_counter()
+        self.spans = []
+        self._stack = []
+        self.release_tracing = lambda: None
+
+    def _note_peak(self):
+        # tracemalloc'un tek bir tepe sayacı var: iç aralık sayacı sıfırlamadan
+        # önce, o ana kadarki tepe açık tüm dış aralıklara işlenir
+        current, peak = tracemalloc.get_traced_memory()
+        for span in self._stack:
+            span.memory_peak = max(span.memory_peak, peak)
+        return current
+
+    def open(self, name, kind):
+        span = _OpenSpan(len(self.spans), name, kind, len(self._stack))
+        self.spans.append(None)
+        if self.trace_memory and tracemalloc.is_tracing():
+            self._note_peak()
+            tracemalloc.reset_peak()
+            span.memory_start = tracemalloc.get_traced_memory()[0]
+            span.memory_peak = span.memory_start
+        self._stack.append(span)
+        return span
+
+    def close(self, span, cache=False):
+        seconds = time.perf_counter() - span.started
+        allocated = peak = None
+        if span.memory_start is not None and tracemalloc.is_tracing():
+            current = self._note_peak()
+            allocated = current - span.memory_start
+            peak = span.memory_peak - span.memory_start
+        self._stack.remove(span)
+        outcome = ("miss" if span.computed else "hit") if cache else None
+        self.spans[span.index] = SpanRecord(span.name, span.kind, span.depth, seconds, allocated, peak, outcome)
+
+    def mark_computed(self):
+        """En içteki aralığın sonucu önbellekten gelmedi, hesaplandı"""
+        if self._stack:
+            self._stack[-1].computed = True
+
+    def finish(self):
+        """Çalıştırmanın özet kaydı (JSON'a çevrilebilir sözlük)"""
+        spans = [span for span in self.spans if span is not None]
+        peaks = [span.peak_bytes for span in spans if span.depth == 0 and span.peak_bytes is not None]
+        return {
+            "run_id": self.run_id,
+            "timestamp": self.timestamp,
+            "total_seconds": time.perf_counter() - self.started,
+            "trace_memory": self.trace_memory,
+            "peak_bytes": max(peaks) if peaks else None,
+            "cache_hits": sum(span.cache == "hit" for span in spans),
+            "cache_misses": sum(span.cache == "miss" for span in spans),
+            "spans": [span._asdict() for span in spans],
+        }
+
+
+_current = contextvars.ContextVar("veri_analizi_run_recorder", default=None)
+
+_tracing_users = 0
+_tracing_lock = threading.Lock()
+
+
+def _acquire_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_users += 1
+
+
+def _release_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users = max(_tracing_users - 1, 0)
+        if _tracing_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def start_run(enabled, trace_memory=False):
+    """Bu iş parçacığında yeni bir çalıştırma kaydı başlatır; kapalıysa None.
+
+    Önceki çalıştırma bitirilmeden (ör. st.stop() ile) kesildiyse onun kaydı
+    atılır.
+    """
+    previous = _current.get()
+    if previous is not None:
+        previous.release_tracing()
+    if not enabled:
+        _current.set(None)
+        return None
+    recorder = RunRecorder(trace_memory)
+    if trace_memory:
+        _acquire_tracing()
+        # Kayıt bitirilmeden iş parçacığıyla birlikte kaybolsa da tracemalloc bırakılır
+        recorder.release_tracing = weakref.finalize(recorder, _release_tracing)
+    _current.set(recorder)
+    return recorder
+
+
+def finish_run(store_stats=None):
+    """Etkin kaydı bitirir, toplamlara ekler ve dışa aktarır; kayıt yoksa None"""
+    recorder = _current.get()
+    if recorder is None:
+        return None
+    _current.set(None)
+    recorder.release_tracing()
+    run = recorder.finish()
+    _totals.add(run)
+    export(run, store_stats=store_stats)
+    return run
+
+
+@contextmanager
+def span(name, kind="call", cache=False):
+    """Bloğu aralık olarak kaydeder; ölçüm kapalıyken maliyetsizdir.
+
+    cache=True ise blok içinde mark_computed() çağrılmadıysa isabet,
+    çağrıldıysa ıskalama sayılır.
+    """
+    recorder = _current.get()
+    if recorder is None:
+        yield
+        return
+    opened = recorder.open(name, kind)
+    try:
+        yield
+    finally:
+        recorder.close(opened, cache)
+
+
+def mark_computed():
+    """Önbellekli bir çağrının hesaplama gövdesinden çağrılır (ıskalama işareti)"""
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.mark_computed()
+
+
+def is_active():
+    return _current.get() is not None
+
+
+# ==============================
+# Süreç geneli toplamlar ve dışa aktarma
+# ==============================
+
+class _Totals:
+    """Tüm oturumların çalıştırmalarından biriken sayaçlar"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.run_seconds = 0.0
+        self.buckets = [0] * len(RERUN_BUCKETS)
+        # (tür, ad) -> [çağrı, saniye, ayrılan bayt]
+        self.spans = {}
+        # (ad, sonuç) -> sayı
+        self.cache = {}
+
+    def add(self, run):
+        with self._lock:
+            self.runs += 1
+            self.run_seconds += run["total_seconds"]
+            for i, bound in enumerate(RERUN_BUCKETS):
+                if run["total_seconds"] <= bound:
+                    self.buckets[i] += 1
+            for span in run["spans"]:
+                entry = self.spans.setdefault((span["kind"], span["name"]), [0, 0.0, 0])
+                entry[0] += 1
+                entry[1] += span["seconds"]
+                entry[2] += max(span["allocated_bytes"] or 0, 0)
+                if span["cache"] is not None:
+                    key = (span["name"], span["cache"])
+                    self.cache[key] = self.cache.get(key, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return (self.runs, self.run_seconds, list(self.buckets),
+                    {key: list(value) for key, value in self.spans.items()}, dict(self.cache))
+
+
+_totals = _Totals()
+_export_lock = threading.Lock()
+
+
+def to_json_line(run):
+    return json.dumps(run, ensure_ascii=False, separators=(",", ":"))
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def prometheus_text(store_stats=None):
+    """Süreç genelindeki toplamlar, Prometheus metin biçiminde.
+
+    store_stats verilirse (ResultStore.stats()) sonuç deposunun sayaçları da
+    eklenir.
+    """
+    runs, run_seconds, buckets, spans, cache = _totals.snapshot()
+    p = METRIC_PREFIX
+    lines = [
+        f"# HELP {p}_rerun_duration_seconds Betik yeniden çalıştırma süresi.",
+        f"# TYPE {p}_rerun_duration_seconds histogram",
+    ]
+    for bound, count in zip(RERUN_BUCKETS, buckets):
+        lines.append(f'{p}_rerun_duration_seconds_bucket{{le="{bound}"}} {count}')
+    lines += [
+        f'{p}_rerun_duration_seconds_bucket{{le="+Inf"}} {runs}',
+        f"{p}_rerun_duration_seconds_sum {run_seconds:.6f}",
+        f"{p}_rerun_duration_seconds_count {runs}",
+    ]
+
+    metrics = [
+        ("span_calls_total", "Aralık (bölüm ya da ağır çağrı) sayısı.", 0, "{:d}"),
+        ("span_seconds_total", "Aralıklarda geçen toplam süre.", 1, "{:.6f}"),
+        ("span_allocated_bytes_total", "Aralıklarda tracemalloc ile ölçülen net ayrılan bellek.", 2, "{:d}"),
+    ]
+    for metric, help_text, position, number in metrics:
+        lines += [f"# HELP {p}_{metric} {help_text}", f"# TYPE {p}_{metric} counter"]
+        for (kind, name), values in sorted(spans.items()):
+            lines.append(f'{p}_{metric}{{kind="{_label(kind)}",name="{_label(name)}"}} ' + number.format(values[position]))
+
+    lines += [f"# HELP {p}_cache_requests_total Önbellekli çağrılar, sonuca göre.",
+              f"# TYPE {p}_cache_requests_total counter"]
+    for (name, outcome), count in sorted(cache.items()):
+        lines.append(f'{p}_cache_requests_total{{name="{_label(name)}",result="{outcome}"}} {count}')
+
+    if store_stats:
+        # Sayaçlar yalnızca artar (rate() ile kullanılır); doluluk değerleri anlık ölçümdür
+        for key, value in store_stats.items():
+            if key in RESULT_STORE_COUNTERS:
+                lines += [f"# TYPE {p}_result_store_{key}_total counter", f"{p}_result_store_{key}_total {value}"]
+            else:
+                lines += [f"# TYPE {p}_result_store_{key} gauge", f"{p}_result_store_{key} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def export(run, jsonl_path=METRICS_JSONL, prom_path=METRICS_PROM, store_stats=None):
+    """Çalıştırmayı JSON satırı olarak ekler ve Prometheus dosyasını yeniler.
+
+    Prometheus dosyası geçici bir dosyaya yazılıp os.replace ile yerine
+    konur; toplayıcı yarım dosya okumaz. Yazma hataları uygulamayı durdurmaz.
+    """
+    if not (jsonl_path or prom_path):
+        return
+    with _export_lock:
+        try:
+            if jsonl_path:
+                with open(jsonl_path, "a", encoding="utf-8") as f:
+                    f.write(to_json_line(run) + "\n")
+            if prom_path:
+                path = Path(prom_path)
+                temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+                temporary.write_text(prometheus_text(store_stats), encoding="utf-8")
+                os.replace(temporary, path)
+        except OSError:
+            pass
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Vektörel aykırı değer motoru.
+
+Tüm yöntemler özellik matrisi üzerinde tek seferde çalışır; özellik başına
+döngü ya da filtrelenmiş ara tablo yoktur:
+
+- IQR: özellik matrisi bir kez float64'e çevrilir; çeyrekler bu matris
+  üzerinde tek bir np.nanquantile çağrısıyla bulunur, sınırlar satırlara
+  yayınlanarak (broadcast) tüm hücreler tek karşılaştırmayla işaretlenir.
+- MAD z-skoru: medyan ve medyan mutlak sapmaya dayalı dayanıklı z-skoru
+  (Iglewicz & Hoaglin); |z| > MAD_THRESHOLD aykırıdır.
+- Mahalanobis uzaklığı: bölüm 7'deki standartlaştırılmış matris ve
+  korelasyon matrisinin (standart verinin kovaryansı) sözde tersiyle; d²
+  eşiği p serbestlik dereceli ki-kare dağılımının %97.5 kantilidir.
+
+outlier_flags() satır başına bayrak tablosu döndürür; dışa aktarılabilir.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+IQR_FACTOR = 1.5
+# Iglewicz & Hoaglin'in önerdiği eşik ve normal dağılım için tutarlılık sabiti
+MAD_THRESHOLD = 3.5
+MAD_CONSISTENCY = 0.6745
+# MAD sıfırsa ortalama mutlak sapma bu sabitle ölçeklenir
+MEAN_AD_CONSISTENCY = 0.7979
+# Mahalanobis eşiği için standart normal kantili (%97.5)
+MAHALANOBIS_Z = 1.959964
+
+
+def _matrix(df, features):
+    return df[features].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def iqr_bounds(values, factor=IQR_FACTOR):
+    """Satırlar x özellikler matrisinden özellik başına (alt sınır, üst sınır)
+    dizileri; tek nanquantile çağrısı, eksik değerler atlanır"""
+    with warnings.catch_warnings():
+        # Tamamen boş sütunların sınırları NaN kalır (pandas quantile gibi)
+        warnings.simplefilter("ignore", RuntimeWarning)
+        q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+    return q1 - factor * iqr, q3 + factor * iqr
+
+
+def iqr_table(df, features, values=None):
+    """IQR yöntemiyle her özellik için aykırı değer istatistikleri.
+
+    values verilirse (sütun deposunun float64 bloğu) özellikler
+    DataFrame'den kopyalanmaz.
+    """
+    features = list(features)
+    values = _matrix(df, features) if values is None else values
+    lower, upper = iqr_bounds(values)
+    # NaN karşılaştırmaları False döner; eksik değerler aykırı sayılmaz
+    counts = ((values < lower) | (values > upper)).sum(axis=0)
+    return pd.DataFrame({
+        'Özellik': features,
+        'Aykırı Değer Sayısı': counts.astype(int),
+        'Aykırı Değer Yüzdesi': [f"{count / max(len(df), 1) * 100:.2f}%" for count in counts],
+        'Alt Sınır': [f"{value:.2f}" for value in lower],
+        'Üst Sınır': [f"{value:.2f}" for value in upper],
+    })
+
+
+def mad_zscores(values):
+    """Sütun başına dayanıklı z-skorları: 0.6745 * (x - medyan) / MAD"""
+    median = np.nanmedian(values, axis=0)
+    deviations = np.abs(values - median)
+    mad = np.nanmedian(deviations, axis=0)
+    # Değerlerin yarısından fazlası aynıysa MAD sıfırdır; ortalama mutlak sapmaya geçilir
+    mean_ad = np.nanmean(deviations, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(
+            mad > 0,
+            MAD_CONSISTENCY * (values - median) / mad,
+            MEAN_AD_CONSISTENCY * (values - median) / mean_ad
+        )
+
+
+def chi2_threshold(degrees, z=MAHALANOBIS_Z):
+    """Ki-kare kantili, Wilson-Hilferty yaklaşımıyla (scipy gerekmez)"""
+    k = 2.0 / (9.0 * degrees)
+    return degrees * (1.0 - k + z * np.sqrt(k)) ** 3
+
+
+def mahalanobis_distances(standardized, corr_matrix):
+    """Standartlaştırılmış satırların kare Mahalanobis uzaklıkları.
+
+    Standart verinin kovaryansı korelasyon matrisidir; tekil matrislerde de
+    çalışmak için sözde ters kullanılır. Eksik değerli satırlar NaN olur.
+    """
+    z = np.asarray(standardized, dtype=np.float64)
+    precision = np.linalg.pinv(np.nan_to_num(np.asarray(corr_matrix, dtype=np.float64)))
+    complete = ~np.isnan(z).any(axis=1)
+    distances = np.full(len(z), np.nan)
+    rows = z[complete]
+    distances[complete] = np.einsum("ij,jk,ik->i", rows, precision, rows)
+    return distances
+
+
+def outlier_flags(df, features, standardized, corr_matrix, values=None):
+    """Satır başına aykırı değer bayrakları.
+
+    Her özellik için "<özellik>_iqr" ve "<özellik>_mad" sütunları,
+    "mahalanobis_d2" uzaklığı, "mahalanobis" bayrağı ve herhangi bir
+    yöntemde aykırı olan satırlar için "any" sütunu döner. values
+    iqr_table'daki gibidir.
+    """
+    features = list(features)
+    values = _matrix(df, features) if values is None else values
+    lower, upper = iqr_bounds(values)
+    iqr = (values < lower) | (values > upper)
+    with np.errstate(invalid="ignore"):
+        mad = np.abs(mad_zscores(values)) > MAD_THRESHOLD
+
+    distances = mahalanobis_distances(standardized[features], corr_matrix.loc[features, features])
+    with np.errstate(invalid="ignore"):
+        mahalanobis = distances > chi2_threshold(len(features))
+
+    columns = {}
+    for j, feature in enumerate(features):
+        columns[f"{feature}_iqr"] = iqr[:, j]
+        columns[f"{feature}_mad"] = mad[:, j]
+    columns["mahalanobis_d2"] = distances
+    columns["mahalanobis"] = mahalanobis
+    columns["any"] = iqr.any(axis=1) | mad.any(axis=1) | mahalanobis
+    return pd.DataFrame(columns, index=df.index)
+
+
+def method_summary(flags, features):
+    """Özellik başına IQR ve MAD ile işaretlenen satır sayıları"""
+    n_rows = max(len(flags), 1)
+    iqr = flags[[f"{feature}_iqr" for feature in features]].to_numpy().sum(axis=0)
+    mad = flags[[f"{feature}_mad" for feature in features]].to_numpy().sum(axis=0)
+    return pd.DataFrame({
+        'Özellik': list(features),
+        'IQR': iqr,
+        'IQR (%)': (iqr / n_rows * 100).round(2),
+        'MAD z-skoru': mad,
+        'MAD (%)': (mad / n_rows * 100).round(2),
+    })
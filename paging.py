@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Büyük tablolar için sunucu tarafında sayfalama.
+
+Tablo görünümü bir satır sırası (konum dizisi) ve sayfa numarasıyla
+tanımlanır; tarayıcıya yalnızca görünen sayfanın satırları gönderilir:
+
+- Sıralama: sütun başına bir kez hesaplanan argsort (eksik değerler sonda).
+- Filtre: metin sütunlarında büyük/küçük harf duyarsız içerir araması
+  (kategorik sütunlarda yalnızca kategoriler üzerinde), sayısal sütunlarda
+  "<, <=, >, >=, =" karşılaştırması ya da "a..b" aralığı.
+- Rastgele örnek: tohuma (seed) bağlı bir permütasyon; aynı tohum her zaman
+  aynı sırayı verir, böylece sayfalar arasında gezinmek tutarlıdır.
+
+Konum dizileri çağıran tarafından önbelleğe alınır; sayfa almak yalnızca
+bir dilim ve take() işlemidir.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+_COMPARISON = re.compile(r"^\s*(<=|>=|<|>|=)\s*(\S+)\s*$")
+_RANGE = re.compile(r"^\s*(\S+)\s*\.\.\s*(\S+)\s*$")
+
+
+def sort_order(series, ascending=True):
+    """Sütuna göre sıralı satır konumları; eksik değerler her iki yönde de sonda"""
+    values = series.reset_index(drop=True)
+    return values.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+
+
+def sample_order(n_rows, seed):
+    """Tohuma bağlı, tekrarlanabilir rastgele satır sırası"""
+    return np.random.default_rng(seed).permutation(n_rows)
+
+
+def filter_mask(series, query):
+    """Sorguya uyan satırların maskesi.
+
+    Sayısal sütunda sorgu çözümlenemezse ValueError fırlatılır.
+    """
+    query = query.strip()
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            if (match := _RANGE.match(query)):
+                low, high = float(match.group(1)), float(match.group(2))
+                return (values >= low) & (values <= high)
+            if (match := _COMPARISON.match(query)):
+                operator, value = match.group(1), float(match.group(2))
+                return {
+                    "<": values < value, "<=": values <= value,
+                    ">": values > value, ">=": values >= value,
+                    "=": values == value,
+                }[operator]
+            return values == float(query)
+
+    needle = query.casefold()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Arama yalnızca kategoriler üzerinde yapılır, satırlara kodlarla yayılır
+        matches = np.array([needle in str(category).casefold() for category in series.cat.categories] + [False])
+        return matches[series.cat.codes.to_numpy()]
+    text = series.astype("string").str.casefold()
+    return text.str.contains(needle, regex=False).fillna(False).to_numpy(dtype=bool)
+
+
+def restrict(order, mask):
+    """Sıralamayı koruyarak yalnızca maskedeki satırları bırakır"""
+    if mask is None:
+        return order
+    if order is None:
+        return np.flatnonzero(mask)
+    return order[mask[order]]
+
+
+def page_bounds(n_rows, page, page_size):
+    """Sayfa numarası (1'den başlar) için [başlangıç, bitiş) aralığı"""
+    n_pages = max(1, -(-n_rows // page_size))
+    page = min(max(1, page), n_pages)
+    start = (page - 1) * page_size
+    return start, min(start + page_size, n_rows)
+
+
+def page(df, positions, start, stop):
+    """Görünen sayfanın satırları; positions None ise doğal satır sırası"""
+    if positions is None:
+        return df.iloc[start:stop]
+    return df.take(positions[start:stop])
+
+
+def standardize_page(page_df, means, scales):
+    """Yalnızca görünen satırlar için z-skorları, önbellekteki ölçekleme parametreleriyle"""
+    columns = list(means.index)
+    return (page_df[columns].astype("float64") - means) / scales
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Bölüm (partition) bazında kısmi toplamlar.
+
+Satırlar kıta ve koruma statüsü gibi düşük kardinaliteli sütunlara göre
+bölümlere ayrılır. Her bölüm için:
+
+- sayısal sütunların moment biriktiricisi (MomentAccumulator) ve
+- kategorik sütunların değer frekansları
+
+bir kez hesaplanır. Yalnızca bölüm sütunları üzerindeki filtrelerle seçilen
+bir alt kümenin korelasyonu, ölçekleme parametreleri ve pasta grafiği
+frekansları, satırlar yeniden taranmadan seçili bölümlerin kısmi sonuçları
+Chan formülleriyle birleştirilerek elde edilir.
+
+Veri setine yeni satırlar eklendiğinde (günlük saha verisi gibi) yalnızca
+yeni satırlar toplanır. Eski satırların değişmediği, satır özetlerinin
+zincirleme bir SHA-1'iyle doğrulanır; doğrulama tutmazsa kısmi sonuçlar
+baştan kurulur. Satır özetleri her veri seti için bir kez hesaplanır:
+zincir, saklanan önceki özet durumundan yalnızca yeni satırların
+özetleriyle ilerletilir.
+"""
+
+import copy
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from accumulators import MomentAccumulator, combine
+
+
+# Varsayılan bölümleme sütunları
+PARTITION_COLUMNS = ["continent", "conservation_status"]
+# Bölüm başına frekansları tutulan sütunlar
+COUNT_COLUMNS = ["conservation_status", "continent", "habitat", "diet_type"]
+
+
+def _row_hashes(df):
+    """Satır başına 64 bitlik özetler.
+
+    Sayısal sütunlar float64'e çevrilerek özetlenir; böylece yeni satırlarla
+    değişen tip küçültmesi (ör. int8 -> int16) eski satırların özetini
+    değiştirmez.
+    """
+    numeric = df.select_dtypes(include="number").columns
+    canonical = df.astype({col: "float64" for col in numeric})
+    return pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+
+
+def _codes(series):
+    """Tamsayı kodlar (eksik değer -1) ve kodlara karşılık gelen değerler"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.int64), series.cat.categories
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes.astype(np.int64), pd.Index(uniques)
+
+
+def _decode(partition_id, labels):
+    """Bölüm kimliğini sütun değerlerinden oluşan anahtara çevirir"""
+    key = []
+    for column_labels in reversed(labels):
+        partition_id, slot = divmod(int(partition_id), len(column_labels))
+        key.append(column_labels[slot])
+    return tuple(reversed(key))
+
+
+class PartitionedAggregates:
+    """Bölüm anahtarı -> kısmi momentler ve frekanslar"""
+
+    def __init__(self, numeric_features, partition_columns=PARTITION_COLUMNS, count_columns=COUNT_COLUMNS):
+        self.numeric_features = list(numeric_features)
+        self.partition_columns = list(partition_columns)
+        self.count_columns = list(count_columns)
+        self.moments = {}
+        # sütun -> (bölüm sütunları..., değer) çok düzeyli indeksli sayım serisi
+        self.counts = {}
+        self.n_rows = 0
+        self._digest = hashlib.sha1()
+
+    @classmethod
+    def from_frame(cls, df, numeric_features, partition_columns=PARTITION_COLUMNS, count_columns=COUNT_COLUMNS,
+                   values=None, row_hashes=None):
+        """Veri setindeki mevcut sütunlarla kısmi toplamları kurar"""
+        partials = cls(
+            numeric_features,
+            [col for col in partition_columns if col in df.columns],
+            [col for col in count_columns if col in df.columns],
+        )
+        return partials.append(df, values, row_hashes)
+
+    def append(self, batch, values=None, row_hashes=None):
+        """Yeni satırları yalnızca kendi bölümlerine toplar.
+
+        values verilirse (sütun deposunun float64 bloğundan batch'in satırları)
+        sayısal sütunlar DataFrame'den kopyalanmaz; yalnızca bölüm sırasına
+        dizilirken bir kez kopyalanır. row_hashes batch'in önceden hesaplanmış
+        satır özetleridir; zincirleme özet yalnızca bunlarla ilerletilir.
+        """
+        if len(batch) == 0:
+            return self
+        if row_hashes is None:
+            row_hashes = _row_hashes(batch)
+        self._digest.update(row_hashes.tobytes())
+        self.n_rows += len(batch)
+
+        # Bölüm kimliği: bölüm sütunlarının kodlarından karışık tabanlı tek tamsayı
+        # (her sütunda eksik değer için ayrı bir yuva vardır)
+        partition_ids = np.zeros(len(batch), dtype=np.int64)
+        labels = []
+        for col in self.partition_columns:
+            codes, uniques = _codes(batch[col])
+            partition_ids = partition_ids * (len(uniques) + 1) + codes + 1
+            labels.append(np.r_[np.array([np.nan], dtype=object), uniques.to_numpy(dtype=object)])
+        # Bölüm kimlikleri küçük tamsayılardır; sıralama yerine sayım kullanılır
+        present_ids = np.flatnonzero(np.bincount(partition_ids))
+        remap = np.zeros(present_ids[-1] + 1, dtype=np.uint16 if len(present_ids) <= 2 ** 16 else np.int64)
+        remap[present_ids] = np.arange(len(present_ids))
+        partition_ids = remap[partition_ids]
+        keys = [_decode(pid, labels) for pid in present_ids]
+
+        # Satırlar bölümlerine göre bir kez sıralanır (16 bitlik kimliklerde radix
+        # sıralaması); her bölüm bitişik bir dilimdir
+        order = np.argsort(partition_ids, kind="stable")
+        bounds = np.searchsorted(partition_ids[order], np.arange(len(keys) + 1))
+        if values is None:
+            values = batch[self.numeric_features].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[order]
+        for key, start, stop in zip(keys, bounds[:-1], bounds[1:]):
+            block = MomentAccumulator(self.numeric_features).update(values[start:stop])
+            if key in self.moments:
+                self.moments[key].merge(block)
+            else:
+                self.moments[key] = block
+
+        key_index = pd.MultiIndex.from_tuples(keys, names=self.partition_columns)
+        for column in self.count_columns:
+            codes, uniques = _codes(batch[column])
+            width = len(uniques) + 1
+            counts = np.bincount(partition_ids.astype(np.int64) * width + codes + 1, minlength=len(keys) * width)
+            nonzero = np.flatnonzero(counts)
+            value_labels = np.r_[np.array([np.nan], dtype=object), uniques.to_numpy(dtype=object)]
+            index = pd.MultiIndex.from_arrays(
+                [key_index.get_level_values(level)[nonzero // width] for level in range(len(keys[0]))]
+                + [value_labels[nonzero % width]],
+                names=self.partition_columns + [column]
+            )
+            counts = pd.Series(counts[nonzero], index=index)
+            previous = self.counts.get(column)
+            self.counts[column] = counts if previous is None else previous.add(counts, fill_value=0).astype("int64")
+        return self
+
+    def copy(self):
+        """append() ile değiştirilebilecek bağımsız bir kopya"""
+        clone = copy.copy(self)
+        clone.moments = copy.deepcopy(self.moments)
+        clone.counts = dict(self.counts)
+        clone._digest = self._digest.copy()
+        return clone
+
+    def covers_prefix_of(self, df, row_hashes=None):
+        """df'nin ilk n_rows satırı bu toplamların kurulduğu satırlarla aynı mı.
+
+        row_hashes verilirse df'nin satır özetleri yeniden hesaplanmaz.
+        """
+        if len(df) < self.n_rows or not set(self.numeric_features) <= set(df.columns):
+            return False
+        if row_hashes is None:
+            row_hashes = _row_hashes(df.iloc[:self.n_rows])
+        prefix = hashlib.sha1(row_hashes[:self.n_rows].tobytes())
+        return prefix.digest() == self._digest.digest()
+
+    def extended_to(self, df, numeric_features, values=None):
+        """df için kısmi toplamlar: bu toplamlar df'nin ilk satırlarınınsa
+        bir kopyasına yalnızca yeni satırlar eklenir, değilse baştan kurulur.
+
+        df'nin satır özetleri bir kez hesaplanır; doğrulama, eklenen satırların
+        zincirleme özeti ve gerekirse baştan kurulum aynı özetleri kullanır.
+        """
+        row_hashes = _row_hashes(df)
+        if list(numeric_features) != self.numeric_features or not self.covers_prefix_of(df, row_hashes):
+            return PartitionedAggregates.from_frame(df, numeric_features, values=values, row_hashes=row_hashes)
+        start = self.n_rows
+        new_values = None if values is None else values[start:]
+        return self.copy().append(df.iloc[start:], new_values, row_hashes[start:])
+
+    def selected_keys(self, selection):
+        """Seçime uyan bölüm anahtarları; seçim yalnızca bölüm sütunlarını
+        filtrelemiyorsa None (kısmi sonuçlarla karşılanamaz)"""
+        if selection.ranges or not set(selection.categories) <= set(self.partition_columns):
+            return None
+        wanted = [set(selection.categories[col]) if col in selection.categories else None
+                  for col in self.partition_columns]
+        return [key for key in self.moments
+                if all(allowed is None or value in allowed for value, allowed in zip(key, wanted))]
+
+    def combined_moments(self, keys=None):
+        """Seçili bölümlerin (None ise tümünün) birleşik moment biriktiricisi"""
+        keys = list(self.moments) if keys is None else keys
+        if not keys:
+            return MomentAccumulator(self.numeric_features)
+        return combine(self.moments[key] for key in keys)
+
+    def value_counts(self, column, keys=None):
+        """analysis.value_counts ile aynı biçimde frekanslar"""
+        counts = self.counts[column]
+        if keys is not None:
+            # Sayım tablosu bölüm x değer kadar satırdır; Python döngüsü yeterince ucuz
+            wanted = set(keys) if len(self.partition_columns) > 1 else {key[0] for key in keys}
+            partitions = counts.index.droplevel(-1).to_flat_index()
+            counts = counts[[partition in wanted for partition in partitions]]
+        values = counts.index.get_level_values(-1)
+        counts = counts[values.notna()]
+        result = counts.groupby(level=-1, observed=True).sum()
+        result = result[result > 0].rename("count").sort_values(ascending=False, kind="stable")
+        result.index.name = column
+        return result
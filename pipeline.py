@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""Oturumlar arası paylaşılan, önbelleğe alınmış analiz hattı.
+
+Tüm ağır hesaplar, süreçteki bütün oturumların paylaştığı tek bir sonuç
+deposunda veri setinin parmak izine göre tutulur. Aynı sonucu aynı anda
+isteyen oturumlardan yalnızca biri hesaplar, diğerleri onu bekler. Sonuçlar
+kopyalanmadan paylaşıldığı için değiştirilmemelidir.
+
+Modül streamlit'e bağlı değildir: serve.py, sunucu trafik kabul etmeden önce
+warm_up() ile ağır modülleri yükleyip varsayılan veri setinin sonuçlarını
+aynı depoya doldurur.
+"""
+
+import importlib
+import os
+import threading
+import time
+
+import numpy as np
+
+import analysis
+import column_store
+import correlation
+import data_loader
+import filters
+import grouped
+import instrumentation
+import outliers
+import paging
+import partitions
+import profiler
+import result_store
+
+
+RESULT_STORE_BYTES = int(os.environ.get("VERI_ANALIZI_CACHE_BYTES", 512 * 1024 ** 2))
+
+# Bu boyutu aşan dosyalar belleğe alınmadan parça parça özetlenir
+STREAMING_THRESHOLD_BYTES = int(os.environ.get("VERI_ANALIZI_STREAMING_BYTES", 512 * 1024 ** 2))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+# En son kurulan (şema, bölüm toplamları); eklemelerde yalnızca yeni satırlar
+# toplanır. Tek kayıt tutulur: eski veri setlerinin toplamları depoda kalır
+_latest_partials = None
+_partials_lock = threading.Lock()
+
+
+def get_result_store():
+    """Süreç genelinde paylaşılan sonuç deposu"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = result_store.ResultStore(budget_bytes=RESULT_STORE_BYTES)
+        return _store
+
+
+def shared_result(fingerprint, name, params, compute):
+    """(parmak izi, ad, parametreler) anahtarıyla depodan sonuç getirir.
+
+    Ölçüm açıksa çağrı, isabet ya da ıskalamasıyla birlikte bir aralık
+    olarak kaydedilir.
+    """
+    if not instrumentation.is_active():
+        return get_result_store().get_or_compute((fingerprint, name, params), compute)
+
+    def measured():
+        instrumentation.mark_computed()
+        return compute()
+
+    with instrumentation.span(name, kind="cache", cache=True):
+        return get_result_store().get_or_compute((fingerprint, name, params), measured)
+
+
+def cached_filter_options(fingerprint, df):
+    return shared_result(fingerprint, "filter_options", (),
+                         lambda: filters.FilterOptions(df))
+
+
+def cached_row_index(fingerprint, df):
+    # Bit eşlemleri yalnızca boş olmayan bir filtre seçimi için kurulur (cached_subset)
+    return shared_result(fingerprint, "row_index", (),
+                         lambda: filters.RowIndex(df))
+
+
+def cached_partitions(fingerprint, df):
+    """Veri setinin bölüm bazında kısmi toplamları.
+
+    Aynı şemaya sahip önceki veri seti bu veri setinin ilk satırlarıysa
+    (satır eklenmişse) onun toplamlarının bir kopyasına yalnızca yeni satırlar
+    eklenir; aksi halde toplamlar baştan kurulur. Veri seti sütun deposundan
+    açıldıysa sayısal sütunlar bellek eşlemli bloktan okunur.
+    """
+    def build():
+        global _latest_partials
+        schema = tuple(df.columns)
+        with _partials_lock:
+            latest = _latest_partials
+        numeric_features = analysis.get_numeric_features(df)
+        values = numeric_values(fingerprint, numeric_features)
+        if latest is not None and latest[0] == schema:
+            partials = latest[1].extended_to(df, numeric_features, values)
+        else:
+            partials = partitions.PartitionedAggregates.from_frame(df, numeric_features, values=values)
+        with _partials_lock:
+            _latest_partials = (schema, partials)
+        return partials
+
+    return shared_result(fingerprint, "partitions", (), build)
+
+
+def _seed_from_partitions(fingerprint, partials, keys):
+    """Momentleri ve frekansları satır taramadan kısmi toplamlardan depoya koyar"""
+    shared_result(fingerprint, "moments", tuple(partials.numeric_features),
+                  lambda: partials.combined_moments(keys))
+    for column in partials.count_columns:
+        shared_result(fingerprint, "value_counts", column,
+                      lambda column=column: partials.value_counts(column, keys))
+
+
+def cached_subset(fingerprint, df, selection):
+    """Filtre seçimine uyan satırlar ve alt kümenin parmak izi.
+
+    Seçim boşsa veri setinin kendisi döner; kısmi toplamlar kurulmaz ve
+    tam veri setinin momentleri cached_moments ile sayısal bloktan (varsa
+    kopyasız) hesaplanır. Alt küme kendi parmak iziyle anahtarlandığı için
+    tüm sonraki analizler ve grafikler alt küme için ayrıca önbelleğe alınır.
+    Seçim yalnızca bölüm sütunlarını süzüyorsa alt kümenin momentleri ve
+    frekansları kısmi toplamlardan birleştirilir.
+    """
+    if not selection:
+        return df, fingerprint
+
+    partials = cached_partitions(fingerprint, df)
+
+    subset_fingerprint = f"{fingerprint}-{selection.key()}"
+    keys = partials.selected_keys(selection)
+    if keys is not None:
+        _seed_from_partitions(subset_fingerprint, partials, keys)
+    subset = shared_result(fingerprint, "subset", selection.key(),
+                           lambda: filters.apply_filters(df, cached_row_index(fingerprint, df), selection))
+    return subset, subset_fingerprint
+
+
+def cached_table_order(fingerprint, df, sort_column=None, ascending=True, seed=None,
+                       filter_column=None, query=""):
+    """Tablo görünümünün satır konumları; hiçbir ayar yoksa None (doğal sıra).
+
+    Sıralama, örnekleme ve filtre maskesi ayrı ayrı önbelleğe alınır; böylece
+    örneğin yalnızca sorgu değiştiğinde sıralama yeniden hesaplanmaz.
+    """
+    query = query.strip() if filter_column else ""
+
+    def compute():
+        if sort_column is not None:
+            order = shared_result(fingerprint, "sort_order", (sort_column, ascending),
+                                  lambda: paging.sort_order(df[sort_column], ascending))
+        elif seed is not None:
+            order = shared_result(fingerprint, "sample_order", seed,
+                                  lambda: paging.sample_order(len(df), seed))
+        else:
+            order = None
+        mask = None
+        if query:
+            mask = shared_result(fingerprint, "table_filter", (filter_column, query),
+                                 lambda: paging.filter_mask(df[filter_column], query))
+        return paging.restrict(order, mask)
+
+    if sort_column is None and seed is None and not query:
+        return None
+    return shared_result(fingerprint, "table_order",
+                         (sort_column, ascending, seed, filter_column, query), compute)
+
+
+def cached_profile(fingerprint, df):
+    return shared_result(fingerprint, "profile", (),
+                         lambda: profiler.profile_columns(df))
+
+
+def cached_memory_comparison(fingerprint, df):
+    return shared_result(fingerprint, "memory_comparison", (),
+                         lambda: analysis.memory_comparison(df))
+
+
+def numeric_values(fingerprint, numeric_features):
+    """Veri seti sütun deposundan açıldıysa sayısal sütunların bellek eşlemli
+    float64 bloğu (kopyasız); filtrelenmiş alt kümeler için None"""
+    return column_store.numeric_block(fingerprint, numeric_features)
+
+
+def cached_moments(fingerprint, df, numeric_features):
+    return shared_result(fingerprint, "moments", tuple(numeric_features),
+                         lambda: analysis.numeric_moments(df, numeric_features,
+                                                          numeric_values(fingerprint, numeric_features)))
+
+
+def cached_value_counts(fingerprint, df, column):
+    return shared_result(fingerprint, "value_counts", column,
+                         lambda: analysis.value_counts(df[column]))
+
+
+def cached_describe_numeric(fingerprint, df, numeric_features):
+    return shared_result(fingerprint, "describe_numeric", tuple(numeric_features),
+                         lambda: analysis.describe_numeric(df, cached_moments(fingerprint, df, numeric_features)))
+
+
+def cached_describe_all(fingerprint, df):
+    return shared_result(fingerprint, "describe_all", (),
+                         lambda: analysis.describe_all(df))
+
+
+def cached_correlation(fingerprint, df, numeric_features):
+    return shared_result(fingerprint, "correlation", tuple(numeric_features),
+                         lambda: analysis.correlation_matrix(cached_moments(fingerprint, df, numeric_features)))
+
+
+def cached_correlation_result(fingerprint, df, numeric_features, method):
+    """Seçilen yöntemle korelasyon, p-değeri ve gözlem sayısı matrisleri.
+
+    Pearson bölüm 3 ile paylaşılan momentlerden türetilir; sıra yöntemleri
+    sayısal bloğu (varsa bellek eşlemli) okur.
+    """
+    def compute():
+        if method == "pearson":
+            return correlation.correlation(None, numeric_features, method,
+                                           cached_moments(fingerprint, df, numeric_features))
+        values = numeric_values(fingerprint, numeric_features)
+        if values is None:
+            values = df[list(numeric_features)].to_numpy(dtype=np.float64, na_value=np.nan)
+        return correlation.correlation(values, numeric_features, method)
+
+    return shared_result(fingerprint, "correlation_result", (tuple(numeric_features), method), compute)
+
+
+def cached_top_pairs(fingerprint, df, numeric_features, method, k):
+    return shared_result(fingerprint, "top_pairs", (tuple(numeric_features), method, k),
+                         lambda: correlation.top_pairs(
+                             cached_correlation_result(fingerprint, df, numeric_features, method), k))
+
+
+def cached_standardize(fingerprint, df, numeric_features):
+    return shared_result(fingerprint, "standardize", tuple(numeric_features),
+                         lambda: analysis.standardize(df, cached_moments(fingerprint, df, numeric_features),
+                                                      numeric_values(fingerprint, numeric_features)))
+
+
+def cached_pca(fingerprint, df, numeric_features, engine):
+    return shared_result(fingerprint, "pca", (tuple(numeric_features), engine),
+                         lambda: analysis.pca_2d(df, cached_moments(fingerprint, df, numeric_features), engine=engine,
+                                                 values=numeric_values(fingerprint, numeric_features)))
+
+
+def cached_box_stats(fingerprint, df, numeric_features):
+    return shared_result(fingerprint, "box_stats", tuple(numeric_features),
+                         lambda: analysis.box_plot_stats(df, numeric_features,
+                                                         values=numeric_values(fingerprint, numeric_features)))
+
+
+def cached_outliers(fingerprint, df, numeric_features):
+    return shared_result(fingerprint, "outliers", tuple(numeric_features),
+                         lambda: outliers.iqr_table(df, numeric_features,
+                                                    numeric_values(fingerprint, numeric_features)))
+
+
+def cached_outlier_flags(fingerprint, df, numeric_features):
+    # Mahalanobis uzaklığı bölüm 7'nin standartlaştırılmış matrisini yeniden kullanır
+    return shared_result(fingerprint, "outlier_flags", tuple(numeric_features),
+                         lambda: outliers.outlier_flags(
+                             df, numeric_features,
+                             cached_standardize(fingerprint, df, numeric_features)[0],
+                             cached_correlation(fingerprint, df, numeric_features),
+                             numeric_values(fingerprint, numeric_features)))
+
+
+def cached_grouped_stats(fingerprint, df, by, numeric_features):
+    return shared_result(fingerprint, "grouped_stats", (by, tuple(numeric_features)),
+                         lambda: grouped.grouped_stats(df, by, numeric_features))
+
+
+def cached_grouped_pca(fingerprint, df, by, numeric_features, parallel=False):
+    # Sonuç paralel ya da sıralı çalışmada aynıdır; anahtarda yer almaz
+    return shared_result(fingerprint, "grouped_pca", (by, tuple(numeric_features)),
+                         lambda: grouped.grouped_pca(df, by, numeric_features, workers=None if parallel else 1))
+
+
+# Isındırmada önceden yüklenen, ilk kullanımda saniyeler süren modüller
+HEAVY_MODULES = ["matplotlib.figure", "seaborn", "sklearn.decomposition"]
+
+
+def warm_up(path=data_loader.DEFAULT_CSV, pca_engine="auto"):
+    """Ağır modülleri yükler ve varsayılan veri setinin sonuçlarını depoya doldurur.
+
+    Anahtarlar uygulamanın kullandıklarıyla aynıdır; böylece ilk oturum bu
+    sonuçları hazır bulur. Akış moduna düşecek kadar büyük dosyalarda
+    yalnızca modüller yüklenir. Adım başına süreleri (saniye) döndürür.
+    """
+    timings = {}
+
+    def timed(step, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        timings[step] = time.perf_counter() - started
+        return result
+
+    for module in HEAVY_MODULES:
+        timed(f"import:{module}", importlib.import_module, module)
+
+    signature = data_loader.source_signature(path)
+    if signature is not None and signature[1] > STREAMING_THRESHOLD_BYTES:
+        return timings
+
+    df, fingerprint = timed("load", data_loader.load_dataset, path)
+    numeric_features = analysis.get_numeric_features(df)
+
+    timed("partitions", cached_partitions, fingerprint, df)
+    timed("profile", cached_profile, fingerprint, df)
+    timed("memory_comparison", cached_memory_comparison, fingerprint, df)
+    timed("describe_all", cached_describe_all, fingerprint, df)
+    if numeric_features:
+        timed("describe_numeric", cached_describe_numeric, fingerprint, df, numeric_features)
+        timed("correlation", cached_correlation, fingerprint, df, numeric_features)
+        timed("moments", cached_moments, fingerprint, df, numeric_features)
+        timed("box_stats", cached_box_stats, fingerprint, df, numeric_features)
+        timed("outliers", cached_outliers, fingerprint, df, numeric_features)
+    if len(numeric_features) >= 2:
+        timed("pca", cached_pca, fingerprint, df, numeric_features, pca_engine)
+    return timings
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Grafikleri Streamlit betik iş parçacığının dışında çizen işçi havuzu.
+
+Sayfa metin ve tabloları akıtırken bağımsız grafikler (pastalar, ısı
+haritası, PCA dağılımı, kutu grafikleri...) havuzda paralel çizilir; sayfanın
+tamamlanma süresi yaklaşık olarak en yavaş tek grafiğin süresine iner.
+
+Varsayılan iş parçacığı havuzu ("thread") her ortamda güvenlidir ve çizimi
+betik iş parçacığından ayırır; ancak Agg çizimi büyük ölçüde GIL'i tuttuğu
+için CPU paralelliği sınırlıdır. Gerçek paralellik için süreç havuzu
+("process", VERI_ANALIZI_RENDER_POOL=process) seçilebilir; süreç havuzu
+çökerse havuz kendiliğinden iş parçacığı havuzuna döner. Aynı anahtarla aynı
+anda gelen istekler tek bir çizimde birleştirilir.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import charts
+
+
+DEFAULT_KIND = os.environ.get("VERI_ANALIZI_RENDER_POOL", "thread")
+DEFAULT_WORKERS = int(os.environ.get("VERI_ANALIZI_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+class RenderPool:
+    """Figür oluşturucuları PNG'ye çizen havuz"""
+
+    def __init__(self, kind=DEFAULT_KIND, max_workers=DEFAULT_WORKERS):
+        self.max_workers = max_workers
+        self._executor = self._create_executor(kind)
+        self.kind = kind
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _create_executor(self, kind):
+        max_workers = self.max_workers
+        if kind == "process":
+            # Streamlit sunucusu çok iş parçacıklı olduğundan fork yerine spawn kullanılır
+            return ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        if kind == "thread":
+            return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render")
+        raise ValueError(f"Bilinmeyen çizim havuzu türü: {kind}")
+
+    def submit(self, key, build_figure, *args):
+        """build_figure(*args) çizimini sıraya alır; PNG baytları için Future döndürür.
+
+        build_figure modül düzeyinde bir fonksiyon, argümanları pickle
+        edilebilir olmalıdır. Aynı anahtar zaten çiziliyorsa onun Future'ı
+        döndürülür.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            try:
+                future = self._executor.submit(charts.render_png, build_figure, *args)
+            except BrokenProcessPool:
+                self._fall_back_to_threads()
+                future = self._executor.submit(charts.render_png, build_figure, *args)
+            self._inflight[key] = future
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _fall_back_to_threads(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._create_executor("thread")
+        self.kind = "thread"
+
+    def _forget(self, key):
+        with self._lock:
+            future = self._inflight.pop(key, None)
+            if (future is not None and self.kind == "process"
+                    and isinstance(future.exception(), BrokenProcessPool)):
+                self._fall_back_to_threads()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
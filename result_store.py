@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Süreç genelinde paylaşılan, iş parçacığı güvenli sonuç deposu.
+
+Hesaplanan ara sonuçlar (moment biriktiricisi, korelasyon matrisi, ölçekleme
+parametreleri, PCA bileşenleri, aykırı değer tabloları, grafik PNG'leri) tüm
+oturumlar arasında tek bir depoda tutulur:
+
+- Tekil uçuş (single-flight): aynı anahtar için aynı anda gelen isteklerden
+  yalnızca biri hesaplar, diğerleri onun sonucunu bekler.
+- Bellek sınırı: tahmini toplam boyut bütçeyi aşınca en uzun süredir
+  kullanılmayan sonuçlar atılır (LRU).
+- Sayaçlar: isabet, ıskalama, bekleme ve tahliye sayıları tutulur.
+
+Sonuçlar kopyalanmadan paylaşılır; çağıranlar onları değiştirmemelidir.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_BUDGET_BYTES = 512 * 1024 ** 2
+
+
+def estimate_size(value):
+    """Bir sonucun bellekte kapladığı yaklaşık bayt sayısı"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, (tuple, list, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value.values())
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+class _Flight:
+    """Devam eden bir hesaplama; bekleyenler sonucu buradan alır"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultStore:
+    """Anahtar -> sonuç deposu; tekil uçuş, LRU tahliyesi ve sayaçlarla"""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES, sizeof=estimate_size):
+        self.budget_bytes = budget_bytes
+        self.sizeof = sizeof
+        self._items = OrderedDict()
+        self._sizes = {}
+        self._size = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def get(self, key, default=None):
+        """Depodaki sonucu tek bir aramayla döndürür; yoksa default.
+
+        Bulunursa isabet sayılır; bulunamaması ıskalama sayılmaz (çağıran
+        sonucu başka yoldan üretip get_or_compute ile depoya koyar).
+        """
+        with self._lock:
+            if key not in self._items:
+                return default
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def get_or_compute(self, key, compute):
+        """Depodaki sonucu döndürür; yoksa compute() ile bir kez hesaplar.
+
+        Aynı anahtar başka bir iş parçacığında hesaplanıyorsa onun bitmesi
+        beklenir. Hesaplama hata verirse bekleyenlere de aynı hata iletilir
+        ve sonuç saklanmaz.
+        """
+        with self._lock:
+            if key in self._items:
+                self.hits += 1
+                self._items.move_to_end(key)
+                return self._items[key]
+
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                owner = True
+                self.misses += 1
+            else:
+                owner = False
+                self.waits += 1
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+        except BaseException as error:
+            flight.error = error
+            raise
+        else:
+            self._put(key, flight.value)
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.value
+
+    def _put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self._size -= self._sizes.pop(key)
+                del self._items[key]
+            if size > self.budget_bytes:
+                return
+            self._items[key] = value
+            self._sizes[key] = size
+            self._size += size
+            while self._size > self.budget_bytes:
+                evicted_key, _ = self._items.popitem(last=False)
+                self._size -= self._sizes.pop(evicted_key)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    def stats(self):
+        """Sayaçların ve doluluğun anlık görüntüsü"""
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "size_bytes": self._size,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "evictions": self.evictions,
+            }
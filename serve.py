@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Isındırmadan (warm-up) sonra Streamlit sunucusunu başlatan giriş noktası.
+
+`streamlit run app.py` yerine kullanılır. Sunucu trafik kabul etmeden önce
+aynı süreçte ağır modüller yüklenir ve varsayılan veri setinin sonuçları
+paylaşılan sonuç deposuna doldurulur; böylece yeni bir kopyaya (replica)
+gelen ilk kullanıcı soğuk başlangıç maliyetini ödemez.
+
+    python serve.py --server.port 8501
+
+Ek argümanlar olduğu gibi `streamlit run`'a iletilir. VERI_ANALIZI_WARMUP=0
+ile ısındırma atlanabilir.
+"""
+
+import os
+import sys
+import time
+
+import pipeline
+
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    if os.environ.get("VERI_ANALIZI_WARMUP", "1") != "0":
+        started = time.perf_counter()
+        try:
+            timings = pipeline.warm_up()
+        except Exception as e:
+            # Isındırma yalnızca hızlandırır; başarısız olursa sunucu yine başlar
+            print(f"Isındırma başarısız: {type(e).__name__}: {e}", file=sys.stderr)
+        else:
+            slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:3]
+            details = ", ".join(f"{step} {seconds:.2f} s" for step, seconds in slowest)
+            print(f"Isındırma tamamlandı: {time.perf_counter() - started:.2f} s ({details})")
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", APP_PATH, *argv]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
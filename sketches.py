@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""Sabit bellekli, birleştirilebilir veri özetleri (sketch).
+
+Çok büyük veri setlerinde kesin sonuç için tüm değerleri tutmak gerekir; bu
+modüldeki yapılar küçük ve sabit bir hata payı karşılığında sabit bellekle
+çalışır ve parçalardan gelen kısmi sonuçlar birleştirilebilir.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class HyperLogLog:
+    """Benzersiz değer sayısı için HyperLogLog tahmincisi.
+
+    precision=14 için 16 KB bellek kullanılır, göreli hata yaklaşık %0.8'dir.
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Bir değer dizisini (eksik değerler hariç) özete ekler"""
+        values = pd.Series(values).dropna()
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+        tail_bits = 64 - self.precision
+        buckets = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # Kalan bitlerdeki ilk 1'in konumu: bit uzunluğu frexp ile bulunur
+        bit_length = np.frexp(tail.astype(np.float64))[1]
+        ranks = (tail_bits - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, buckets, ranks)
+
+    def merge(self, other):
+        """Başka bir özetle birleştirir (aynı precision gerekir)"""
+        if other.precision != self.precision:
+            raise ValueError("Farklı precision değerine sahip HyperLogLog özetleri birleştirilemez")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """Tahmini benzersiz değer sayısı"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros > 0:
+            # Küçük kardinalitelerde doğrusal sayım daha isabetlidir
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+
+class DistinctCounter:
+    """Az sayıda benzersiz değerde kesin sayar, sınır aşılınca HyperLogLog'a geçer"""
+
+    def __init__(self, exact_limit=50_000, precision=14):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self.values = set()
+        self.hll = None
+
+    @property
+    def is_exact(self):
+        return self.hll is None
+
+    def update(self, values):
+        values = pd.Series(values).dropna()
+        if self.hll is not None:
+            self.hll.update(values)
+            return
+
+        self.values.update(values.unique())
+        if len(self.values) > self.exact_limit:
+            self.hll = HyperLogLog(self.precision)
+            self.hll.update(pd.Series(list(self.values), dtype=values.dtype))
+            self.values = set()
+
+    def merge(self, other):
+        if self.hll is None and other.hll is None:
+            self.update(pd.Series(list(other.values), dtype=object))
+            return self
+        if self.hll is None:
+            self.hll = HyperLogLog(self.precision)
+            self.hll.update(pd.Series(list(self.values), dtype=object))
+            self.values = set()
+        if other.hll is None:
+            self.hll.update(pd.Series(list(other.values), dtype=object))
+        else:
+            self.hll.merge(other.hll)
+        return self
+
+    def count(self):
+        return len(self.values) if self.hll is None else self.hll.estimate()
+
+
+class KLLSketch:
+    """Birleştirilebilir yaklaşık kantil (quantile) özeti (KLL).
+
+    error, sıralama (rank) hatasının hedef üst sınırıdır; 0.01 değeri,
+    döndürülen kantilin gerçek sıralamasının en fazla ~%1 sapması demektir.
+    Bellek kullanımı veri boyutundan bağımsız olarak O(k log(n/k)) kalır.
+    """
+
+    CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, error=0.01, seed=0):
+        self.error = error
+        self.k = max(8, int(np.ceil(3.3 / error)))
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - 1 - level
+        return max(2, int(self.k * self.CAPACITY_DECAY ** depth))
+
+    def update(self, values):
+        """Bir değer dizisini (eksik değerler hariç) özete ekler"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.count += len(values)
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            capacity = self._capacity(level)
+            if len(items) > capacity:
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                # Taşan seviye, kapasite boyutlu bloklar halinde toplu sıkıştırılır:
+                # her blok sıralanır ve blok başına rastgele bir ofsetle her ikinci
+                # eleman bir üst seviyeye (iki kat ağırlıkla) taşınır. Ofsetlerin
+                # bağımsız olması blok hatalarının aynı yöne birikmesini önler.
+                block = max(2, capacity - capacity % 2)
+                n_blocks = len(items) // block
+                blocks = np.sort(items[:n_blocks * block].reshape(n_blocks, block), axis=1)
+                offsets = self._rng.integers(2, size=(n_blocks, 1))
+                promoted = np.take_along_axis(blocks, offsets + 2 * np.arange(block // 2), axis=1).ravel()
+                self.levels[level] = items[n_blocks * block:]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other):
+        """Başka bir KLL özetini bununla birleştirir"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Tek bir kantil ya da kantil dizisi için tahmini değer(ler)"""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2.0 ** level) for level, level_items in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+
+        targets = np.asarray(q, dtype=np.float64) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, targets, side="left"), len(items) - 1)
+        result = items[positions]
+        # Uç kantiller için kesin min/max kullanılır
+        result = np.where(np.asarray(q) <= 0, self.min, np.where(np.asarray(q) >= 1, self.max, result))
+        return result if np.ndim(q) else float(result)
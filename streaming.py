@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Belleğe sığmayan CSV dosyaları için parça parça (chunked) özet çıkarma.
+
+Dosya pandas'ın chunksize seçeneğiyle okunur ve sayfada gösterilen özetler
+(genel bakış, eksik değerler, kategorik dağılımlar, benzersiz değer sayıları,
+ortalama/standart sapma) okuma sırasında biriktirilir. Bellek kullanımı dosya
+boyutuna değil parça boyutuna bağlıdır; yüksek kardinaliteli sütunların
+benzersiz değer sayıları HyperLogLog ile tahmin edilir.
+"""
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+import profiler
+from accumulators import MomentAccumulator
+from sketches import DistinctCounter
+
+
+DEFAULT_CHUNK_SIZE = 200_000
+
+# Pasta grafiklerinde gösterilen kategorik sütunlar
+PIE_COLUMNS = ["conservation_status", "continent", "diet_type"]
+
+
+class StreamingSummary:
+    """Parçalar okundukça güncellenen veri seti özeti"""
+
+    def __init__(self):
+        self.n_rows = 0
+        self.columns = []
+        self.dtypes = None
+        self.first_row = None
+        self.null_counts = None
+        self.value_counts = {}
+        self.distinct_values = {}
+        self.moments = None
+
+    def update(self, chunk):
+        """Bir veri parçasını özete ekler"""
+        if self.n_rows == 0:
+            self.columns = chunk.columns.tolist()
+            self.dtypes = chunk.dtypes.astype(str)
+            self.first_row = chunk.iloc[0] if len(chunk) > 0 else None
+            self.null_counts = pd.Series(0, index=chunk.columns)
+            self.distinct_values = {col: DistinctCounter() for col in chunk.columns}
+        self.n_rows += len(chunk)
+
+        self.null_counts = self.null_counts.add(chunk.isnull().sum(), fill_value=0).astype("int64")
+
+        for col in PIE_COLUMNS:
+            if col in chunk.columns:
+                counts = chunk[col].value_counts()
+                previous = self.value_counts.get(col)
+                self.value_counts[col] = counts if previous is None else previous.add(counts, fill_value=0)
+
+        for col in chunk.columns:
+            values = chunk[col]
+            if pd.api.types.is_numeric_dtype(values):
+                # Parçaya göre int ya da float okunan sütunlar aynı hash'i üretsin
+                values = values.astype("float64")
+            self.distinct_values[col].update(values)
+
+        if self.moments is None:
+            self.moments = MomentAccumulator(chunk.select_dtypes(include="number").columns)
+        self.moments.update(chunk)
+
+    @property
+    def n_columns(self):
+        return len(self.columns)
+
+    @property
+    def numeric_features(self):
+        return [] if self.moments is None else self.moments.columns
+
+    def nunique(self):
+        """Sütun başına (kesin ya da tahmini) benzersiz değer sayıları"""
+        return pd.Series({col: counter.count() for col, counter in self.distinct_values.items()})
+
+    def profile(self):
+        """profiler.profile_columns ile aynı biçimde sütun profili.
+
+        Veri belleğe alınmadığı için bellek kullanımı bilinmez (NaN); örnek
+        değer ilk satırdan alınır.
+        """
+        rows = {}
+        for col in self.columns:
+            counter = self.distinct_values[col]
+            sample = None if self.first_row is None else self.first_row[col]
+            rows[col] = {
+                "dtype": self.dtypes[col],
+                "null_count": int(self.null_counts[col]),
+                "distinct": counter.count(),
+                "distinct_exact": counter.is_exact,
+                "sample": None if pd.isna(sample) else sample,
+                "memory_bytes": np.nan,
+            }
+        return pd.DataFrame.from_dict(rows, orient="index", columns=profiler.PROFILE_COLUMNS)
+
+    def sorted_value_counts(self, column):
+        """Bir kategorik sütunun büyükten küçüğe sıralı frekansları"""
+        return self.value_counts[column].astype("int64").sort_values(ascending=False)
+
+    def numeric_stats(self, ddof=1):
+        """Sayısal sütunlar için sayım, ortalama ve standart sapma tablosu"""
+        return pd.DataFrame({
+            "count": self.moments.count(),
+            "mean": self.moments.means(),
+            "std": self.moments.std(ddof=ddof),
+        }).T
+
+
+def summarize_csv(path, chunksize=DEFAULT_CHUNK_SIZE):
+    """CSV dosyasını parça parça okuyarak StreamingSummary döndürür"""
+    summary = StreamingSummary()
+    for chunk in data_loader.iter_csv_chunks(path, chunksize=chunksize):
+        summary.update(chunk)
+    return summary
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""correlation.spearman_rho'nun pandas'ın çift bazlı Spearman'ıyla karşılaştırması.
+
+    python -m pytest -q tests
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import correlation
+
+
+def _many_patterns(n_rows, n_columns, seed=0):
+    """Her sütunun kendi eksik değer deseni olan, bağlı değerli bir matris"""
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 50, size=(n_rows, n_columns)).astype(np.float64)
+    values[:, 1] = values[:, 0] + rng.integers(0, 5, size=n_rows)
+    values[rng.random(values.shape) < 0.05] = np.nan
+    return values
+
+
+def _pandas_spearman(values):
+    return pd.DataFrame(values).corr(method="spearman").to_numpy()
+
+
+def _off_diagonal(matrix):
+    return matrix[~np.eye(len(matrix), dtype=bool)]
+
+
+def test_spearman_matches_pandas_with_many_missing_patterns():
+    values = _many_patterns(500, 12)
+    rho, counts = correlation.spearman_rho(values)
+    assert len(correlation._missing_patterns(~np.isnan(values))) == 12
+    np.testing.assert_allclose(_off_diagonal(rho), _off_diagonal(_pandas_spearman(values)), atol=1e-12)
+    valid = (~np.isnan(values)).astype(np.float64)
+    np.testing.assert_array_equal(counts, valid.T @ valid)
+    np.testing.assert_array_equal(rho, rho.T)
+
+
+def test_spearman_handles_empty_and_constant_columns():
+    values = _many_patterns(60, 5, seed=1)
+    values[:, 2] = np.nan
+    values[:, 3] = np.where(np.isnan(values[:, 3]), np.nan, 7.0)
+    values[:5, 4] = np.nan
+    rho, _ = correlation.spearman_rho(values)
+    np.testing.assert_allclose(_off_diagonal(rho), _off_diagonal(_pandas_spearman(values)), atol=1e-12)
+
+
+def test_spearman_many_patterns_is_faster_than_pairwise_reranking():
+    # Desen çifti başına yeniden sıralama, pandas'ın çift bazlı sıralamasıyla aynı
+    # maliyettedir; tek sıralamadan türetilen sıralar ondan belirgin biçimde hızlı olmalı
+    values = _many_patterns(20_000, 30)
+    started = time.perf_counter()
+    expected = _pandas_spearman(values)
+    pairwise = time.perf_counter() - started
+
+    elapsed = []
+    for _ in range(3):
+        started = time.perf_counter()
+        rho, _ = correlation.spearman_rho(values)
+        elapsed.append(time.perf_counter() - started)
+    np.testing.assert_allclose(_off_diagonal(rho), _off_diagonal(expected), atol=1e-12)
+    assert min(elapsed) < 0.75 * pairwise